@@ -0,0 +1,68 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+scripts.bench.parsing module
+
+Benchmark of extracting 100k sigers, digests and counters from a CESR stream.
+Compares .fromQb64bFast on a parsing.Cursor, as the parser does, with init
+from qb64b on a bytearray stream and init from qb64 str of each primitive.
+Run on demand, not collected by pytest:
+
+    python scripts/bench/parsing.py
+
+"""
+import time
+
+from keri.core import coring, parsing
+
+
+def lap(extract, count, repeat):
+    """ Returns least average microseconds per call of extract over repeat runs
+
+    Parameters:
+        extract (Callable): returns function that extracts one primitive
+        count (int): number of calls per run
+        repeat (int): number of runs
+    """
+    best = None
+    for _ in range(repeat):
+        fn = extract()
+        start = time.perf_counter()
+        for _ in range(count):
+            fn()
+        cost = (time.perf_counter() - start) / count * 1e6
+        best = cost if best is None else min(best, cost)
+    return best
+
+
+def bench(count=100000, repeat=3):
+    """ Prints average microseconds per primitive extracted
+
+    Parameters:
+        count (int): number of primitives of each class in stream
+        repeat (int): number of runs of which the fastest is reported
+    """
+    siger = coring.Signer().sign(b"abc", index=0)
+    diger = coring.Diger(ser=b"abc")
+    counter = coring.Counter(code=coring.CtrDex.ControllerIdxSigs, count=1)
+
+    print(f"{'primitive':>10} {'cursor us':>10} {'bytearray us':>13} {'str us':>8}")
+    for klas, prim in ((coring.Siger, siger), (coring.Diger, diger), (coring.Counter, counter)):
+        def cursor():
+            ims = parsing.Cursor(prim.qb64b * count)
+            return lambda: klas.fromQb64bFast(ims, strip=True)
+
+        def stream():
+            ims = bytearray(prim.qb64b * count)
+            return lambda: klas(qb64b=ims, strip=True)
+
+        def text():
+            qb64 = prim.qb64
+            return lambda: klas(qb64=qb64)
+
+        costs = [lap(extract, count, repeat) for extract in (cursor, stream, text)]
+        print(f"{klas.__name__:>10} {costs[0]:>10.3f} {costs[1]:>13.3f} {costs[2]:>8.3f}")
+
+
+if __name__ == "__main__":
+    bench()
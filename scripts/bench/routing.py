@@ -0,0 +1,61 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+scripts.bench.routing module
+
+Benchmark of Router.find cost as the number of registered routes grows,
+compared with a linear regex search of all routes in registration order.
+Run on demand, not collected by pytest:
+
+    python scripts/bench/routing.py
+
+"""
+import time
+
+from keri.core import routing
+
+
+class Resource:
+    """ Resource stand in for registered routes """
+
+    def processReply(self, **kwa):
+        pass
+
+
+def bench(counts=(10, 100, 1000, 10000), rounds=20000):
+    """ Prints average microseconds per find of templated and static route and
+    per linear regex search of templated route
+
+    Parameters:
+        counts (tuple): numbers of templated and of static routes to register
+        rounds (int): number of finds of each route timed per count
+    """
+    res = Resource()
+    print(f"{'routes':>8} {'templated us':>14} {'static us':>12} {'linear us':>12}")
+    for count in counts:
+        rtr = routing.Router()
+        for i in range(count):
+            rtr.addRoute(f"/route{i}/{{aid}}", res)
+            rtr.addRoute(f"/static{i}/scheme", res)
+
+        costs = []
+        for route in (f"/route{count - 1}/EAbc", f"/static{count - 1}/scheme"):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                rtr.find(route)
+            costs.append((time.perf_counter() - start) / rounds * 1e6)
+
+        route = f"/route{count - 1}/EAbc"
+        laps = max(rounds // count, 10)  # linear search is slow
+        start = time.perf_counter()
+        for _ in range(laps):
+            for r in rtr.routes:
+                if r.regex.search(route):
+                    break
+        costs.append((time.perf_counter() - start) / laps * 1e6)
+
+        print(f"{count:>8} {costs[0]:>14.3f} {costs[1]:>12.3f} {costs[2]:>12.3f}")
+
+
+if __name__ == "__main__":
+    bench()
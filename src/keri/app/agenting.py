@@ -27,13 +27,17 @@ class WitnessReceiptor(doing.DoDoer):
     for receipts from each of those witnesses and propagates those receipts to each
     of the other witnesses after receiving the complete set.
 
-    Removes all Doers and exits as Done once all witnesses have been sent the entire
-    receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
-    and an `all` method that runs and waits for more messages to receipt.
+    Events are pipelined.  Each event popped from .msgs is receipted by its own
+    doer so up to .Window events may be in flight at once and each one is cued as
+    soon as its own receipt set is complete.  Witnessers are pooled by witness URL
+    so every event sent to the same witness reuses the same persistent connection.
+    The pool is released once it has been idle for .linger seconds.
 
     """
+    Window = 64  # maximum number of events in flight at once
+    Linger = 2.0  # seconds an idle pool of witnessers is kept open
 
-    def __init__(self, hby, msgs=None, cues=None, **kwa):
+    def __init__(self, hby, msgs=None, cues=None, window=None, linger=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
@@ -42,11 +46,18 @@ class WitnessReceiptor(doing.DoDoer):
             hby (Habery): Habitat of the identifier to receipt witnesses
             msgs (Deck): incoming messages to publish to witnesses
             cues (Deck): outgoing cues of successful messages
+            window (int): maximum number of events in flight at once
+            linger (float): seconds to keep idle pooled witnessers open
 
         """
         self.hby = hby
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.window = window if window is not None else self.Window
+        self.linger = linger if linger is not None else self.Linger
+        self.witers = dict()  # pooled witnessers keyed by witness URL
+        self.posts = dict()  # number of messages posted to each pooled witnesser
+        self.flights = []  # event doers in flight
 
         super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
 
@@ -67,102 +78,167 @@ class WitnessReceiptor(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        idled = None  # tyme pool went idle
         while True:
-            while self.msgs:
+            done = [flight for flight in self.flights if flight.done is not None]
+            if done:
+                self.flights = [flight for flight in self.flights if flight.done is None]
+                self.remove(done)
+
+            while self.msgs and len(self.flights) < self.window:
                 evt = self.msgs.popleft()
-                pre = evt["pre"]
+                flight = doing.doify(self.eventDo, evt=evt)
+                self.flights.append(flight)
+                self.extend([flight])
 
-                if pre not in self.hby.habs:
-                    continue
+            for witer in self.witers.values():  # responses are tracked by count, drop them
+                witer.sent.clear()
 
-                hab = self.hby.habs[pre]
+            if self.flights or not self.witers:
+                idled = None
+            elif idled is None:
+                idled = self.tyme
+            elif self.tyme - idled >= self.linger:
+                self.release()
+                idled = None
 
-                sn = evt["sn"] if "sn" in evt else hab.kever.sn
-                wits = hab.kever.wits
+            yield self.tock
 
-                if len(wits) == 0:
-                    continue
+    def eventDo(self, tymth=None, tock=0.0, evt=None):
+        """
+        Returns doifiable Doist compatible generator method (doer dog) that
+        receipts a single event with the pooled witnessers of its witnesses
+
+        Parameters:
+            tymth is injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock is injected initial tock value
+            evt (dict): event to receipt with pre and optional sn
+
+        """
+        self.wind(tymth)
+        _ = (yield tock)
 
-                msg = hab.makeOwnEvent(sn=sn)
-                ser = coring.Serder(raw=msg)
+        pre = evt["pre"]
+        if pre not in self.hby.habs:
+            return False
 
-                dgkey = dbing.dgKey(ser.preb, ser.saidb)
+        hab = self.hby.habs[pre]
 
-                # Check to see if we already have all the receipts we need for this event
-                wigs = hab.db.getWigs(dgkey)
-                if len(wigs) == len(wits):  # We have all the receipts, skip
-                    self.cues.append(evt)
+        sn = evt["sn"] if "sn" in evt else hab.kever.sn
+        wits = hab.kever.wits
+
+        if len(wits) == 0:
+            return False
+
+        msg = hab.makeOwnEvent(sn=sn)
+        ser = coring.Serder(raw=msg)
+
+        dgkey = dbing.dgKey(ser.preb, ser.saidb)
+
+        # Check to see if we already have all the receipts we need for this event
+        wigs = hab.db.getWigs(dgkey)
+        if len(wigs) == len(wits):  # We have all the receipts, skip
+            self.cues.append(evt)
+            return True
+
+        witers = []
+        for wit in wits:
+            witer = self.witnesser(hab, wit)
+            witers.append(witer)
+
+            if "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send missing KEL to catch up
+                fn = hab.db.fons.get(keys=(pre, ser.said))
+                kel = catchup(hab, wit, end=fn.sn if fn is not None else None)
+                if kel:
+                    self.post(witer, kel)
+
+            self.post(witer, bytearray(msg))  # make a copy
+
+        while True:
+            wigs = hab.db.getWigs(dgkey)
+            if len(wigs) == len(wits):
+                break
+            _ = yield tock
+
+        # generate all rct msgs to send to all witnesses
+        awigers = [coring.Siger(qb64b=bytes(wig)) for wig in wigs]
+
+        # make sure all witnesses have fully receipted KERL and know about each other
+        marks = []
+        for witer in witers:
+            ewits = []
+            wigers = []
+            for i, wit in enumerate(wits):
+                if wit == witer.wit:
                     continue
+                ewits.append(wit)
+                wigers.append(awigers[i])
 
-                witers = []
-                for wit in wits:
-                    witer = witnesser(hab, wit)
+            if len(wigers) == 0:
+                continue
 
-                    witers.append(witer)
-                    if "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                        for msg in hab.db.clonePreIter(pre=pre):
-                            witer.msgs.append(msg)
+            rctMsg = bytearray()
 
-                    witer.msgs.append(bytearray(msg))  # make a copy
-                    self.extend([witer])
+            # Now that the witnesses have not met each other, send them each other's receipts
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
+                rctMsg.extend(self.replay(eids=ewits))
+            elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
+                    ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
+                rctMsg.extend(self.replay(eids=ewits))
 
-                    _ = (yield self.tock)
+            rserder = eventing.receipt(pre=ser.pre,
+                                       sn=sn,
+                                       said=ser.said)
+            rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
 
-                while True:
-                    wigs = hab.db.getWigs(dgkey)
-                    if len(wigs) == len(wits):
-                        break
-                    _ = yield self.tock
-
-                # generate all rct msgs to send to all witnesses
-                awigers = [coring.Siger(qb64b=bytes(wig)) for wig in wigs]
-
-                # make sure all witnesses have fully receipted KERL and know about each other
-                for witer in witers:
-                    ewits = []
-                    wigers = []
-                    for i, wit in enumerate(wits):
-                        if wit == witer.wit:
-                            continue
-                        ewits.append(wit)
-                        wigers.append(awigers[i])
-
-                    if len(wigers) == 0:
-                        continue
-
-                    rctMsg = bytearray()
-
-                    # Now that the witnesses have not met each other, send them each other's receipts
-                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
-                        rctMsg.extend(self.replay(eids=ewits))
-                    elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
-                            ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
-                        rctMsg.extend(self.replay(eids=ewits))
-
-                    rserder = eventing.receipt(pre=ser.pre,
-                                               sn=sn,
-                                               said=ser.said)
-                    rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
-
-                    witer.msgs.append(rctMsg)
-                    _ = (yield self.tock)
+            marks.append((witer, self.post(witer, rctMsg)))
 
-                while True:
-                    done = True
-                    for witer in witers:
-                        if not witer.idle:
-                            yield 1.0
-                            done = False
-                            break
-                    if done:
-                        break
+        # wait until every witness has been delivered its receipts for this event
+        while not all(witer.flushed >= mark for witer, mark in marks):
+            _ = yield tock
 
-                self.remove(witers)
+        self.cues.append(evt)
+        return True
 
-                self.cues.append(evt)
-                yield self.tock
+    def witnesser(self, hab, wit):
+        """ Returns pooled witnesser for wit, creating and running one if needed
 
-            yield self.tock
+        Parameters:
+            hab (Habitat): Environment to use to look up witness URLs
+            wit (str): qb64 identifier prefix of witness
+
+        Returns:
+            Optional(TcpWitnesser, HttpWitnesser): pooled witnesser for witness URL
+        """
+        url = witnessUrl(hab, wit)
+        if url not in self.witers:
+            witer = witnesser(hab, wit)
+            self.witers[url] = witer
+            self.posts[url] = 0
+            self.extend([witer])
+
+        return self.witers[url]
+
+    def release(self):
+        """ Close and remove all pooled witnessers """
+        self.remove(list(self.witers.values()))
+        self.witers = dict()
+        self.posts = dict()
+
+    def post(self, witer, msg):
+        """ Queue msg on pooled witer and return its running post count
+
+        Parameters:
+            witer (Union(TCPWitnesser, HttpWitnesser)): pooled witnesser
+            msg (bytes): message to send to the witness
+
+        Returns:
+            int: .flushed value of witer once msg has been delivered
+        """
+        witer.msgs.append(msg)
+        self.posts[witer.url] += 1
+        return self.posts[witer.url]
 
     def replay(self, eids):
         msgs = bytearray()
@@ -258,7 +334,7 @@ class WitnessInquisitor(doing.DoDoer):
 
             kel = forwarding.introduce(hab, wit)
             if kel:
-                witer.msgs.append(bytearray(kel))
+                witer.msgs.append(httping.CesrStream(kel))
 
             witer.msgs.append(bytearray(msg))
 
@@ -386,6 +462,7 @@ class TCPWitnesser(doing.DoDoer):
         self.wit = wit
         self.url = url
         self.posted = 0
+        self.flushed = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -432,6 +509,7 @@ class TCPWitnesser(doing.DoDoer):
             while client.txbs:
                 yield self.tock
 
+            self.flushed += 1
             self.sent.append(msg)
             yield self.tock
 
@@ -459,7 +537,7 @@ class TCPWitnesser(doing.DoDoer):
 
     @property
     def idle(self):
-        return len(self.sent) == self.posted
+        return self.flushed == self.posted
 
 
 class HttpWitnesser(doing.DoDoer):
@@ -479,7 +557,11 @@ class HttpWitnesser(doing.DoDoer):
         """
         self.hab = hab
         self.wit = wit
+        self.url = url
         self.posted = 0
+        self.received = 0
+        self.flushed = 0
+        self.marks = decking.Deck()  # .posted after each msg, flushed once all answered
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -513,7 +595,12 @@ class HttpWitnesser(doing.DoDoer):
                 yield self.tock
 
             msg = self.msgs.popleft()
-            self.posted += httping.streamCESRRequests(client=self.client, ims=msg)
+            if isinstance(msg, httping.CesrStream):  # framed batch sent as one request
+                httping.createCESRStreamRequest(client=self.client, ims=msg)
+                self.posted += 1
+            else:
+                self.posted += httping.streamCESRRequests(client=self.client, ims=msg)
+            self.marks.append(self.posted)
             while self.client.requests:
                 yield self.tock
 
@@ -531,13 +618,17 @@ class HttpWitnesser(doing.DoDoer):
         while True:
             while self.client.responses:
                 rep = self.client.respond()
+                self.received += 1
+                while self.marks and self.marks[0] <= self.received:
+                    self.marks.popleft()
+                    self.flushed += 1
                 self.sent.append(rep)
                 yield
             yield
 
     @property
     def idle(self):
-        return self.posted == len(self.sent)
+        return self.posted == self.received
 
 
 def mailbox(hab, cid):
@@ -556,6 +647,41 @@ def mailbox(hab, cid):
     return mbx
 
 
+def catchup(hab, wit, pre=None, start=None, end=None):
+    """ Returns the suffix of the KEL of pre that wit is not known to hold
+
+    Starts after the latest event wit is known to hold from its receipts or key
+    state (see Baser.knownFn) so a witness that already holds most of a long KEL
+    is only sent what it is missing.
+
+    Parameters:
+        hab (Habitat): Environment with the KEL to clone
+        wit (str): qb64 identifier prefix of witness to catch up
+        pre (str): qb64 identifier prefix of KEL, defaults to hab.pre
+        start (int): optional first seen ordinal at which to start, instead of
+            the one following the latest event wit is known to hold
+        end (int): optional first seen ordinal at which to stop, exclusive
+
+    Returns:
+        CesrStream: framed stream of missing event messages with attachments
+    """
+    pre = pre if pre is not None else hab.pre
+    if start is None:
+        known = hab.db.knownFn(pre=pre, eid=wit)
+        start = known + 1 if known is not None else 0
+
+    msgs = httping.CesrStream()
+    for ofn, dig in hab.db.getFelItemPreIter(pre.encode("utf-8"), fn=start):
+        if end is not None and ofn >= end:
+            break
+        try:
+            msgs.extend(hab.db.cloneEvtMsg(pre=pre.encode("utf-8"), fn=ofn, dig=dig))
+        except Exception:
+            continue  # skip this event
+
+    return msgs
+
+
 def witnesser(hab, wit):
     """ Create a Witnesser (tcp or http) based on available endpoints
 
@@ -566,19 +692,34 @@ def witnesser(hab, wit):
     Returns:
         Optional(TcpWitnesser, HttpWitnesser): witnesser for ensuring full reciepts
     """
-    urls = hab.fetchUrls(eid=wit)
-    if kering.Schemes.http in urls:
-        url = urls[kering.Schemes.http]
+    url = witnessUrl(hab, wit)
+    if urlparse(url).scheme == kering.Schemes.http:
         witer = HttpWitnesser(hab=hab, wit=wit, url=url)
-    elif kering.Schemes.tcp in urls:
-        url = urls[kering.Schemes.tcp]
-        witer = TCPWitnesser(hab=hab, wit=wit, url=url)
     else:
-        raise kering.ConfigurationError(f"unable to find a valid endpoint for witness {wit}")
+        witer = TCPWitnesser(hab=hab, wit=wit, url=url)
 
     return witer
 
 
+def witnessUrl(hab, wit):
+    """ Return the URL a witnesser for wit connects to, preferring http over tcp
+
+    Parameters:
+        hab (Habitat): Environment to use to look up witness URLs
+        wit (str): qb64 identifier prefix of witness
+
+    Returns:
+        str: endpoint URL of witness
+    """
+    urls = hab.fetchUrls(eid=wit)
+    if kering.Schemes.http in urls:
+        return urls[kering.Schemes.http]
+    elif kering.Schemes.tcp in urls:
+        return urls[kering.Schemes.tcp]
+
+    raise kering.ConfigurationError(f"unable to find a valid endpoint for witness {wit}")
+
+
 def httpClient(hab, wit):
     """ Create and return a http.client and http.ClientDoer for the witness
 
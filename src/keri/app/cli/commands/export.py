@@ -12,6 +12,7 @@ from hio.base import doing
 
 from keri.app.cli.common import existing
 from keri.core import coring
+from keri.db import basing
 
 logger = help.ogler.getLogger()
 
@@ -88,14 +89,11 @@ class ExportDoer(doing.DoDoer):
         if self.files:
             f = open(f"{pre}-kel.cesr", "w")
 
-        for msg in self.hby.db.clonePreIter(pre=pre):
+        for chunk in basing.chunkify(self.hby.db.clonePreIter(pre=pre)):
             if f is not None:
-                f.write(msg.decode("utf-8"))
+                f.write(chunk.decode("utf-8"))
             else:
-                serder = coring.Serder(raw=msg)
-                atc = msg[serder.size:]
-                sys.stdout.write(serder.raw.decode("utf-8"))
-                sys.stdout.write(atc.decode("utf-8"))
+                sys.stdout.write(chunk.decode("utf-8"))
 
         if f is not None:
             f.close()
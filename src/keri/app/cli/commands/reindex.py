@@ -0,0 +1,51 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Rebuild anchored seal index of existing KELs and escrow expiry index in keystore')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+
+
+def handler(args):
+    kwa = dict(args=args)
+    return [doing.doify(reindex, **kwa)]
+
+
+def reindex(tymth, tock=0.0, **opts):
+    """ Command line anchored seal and escrow expiry index backfill handler
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            count = hby.db.reindexSeals()
+            print(f"Indexed anchored seals of {count} events")
+            count = hby.db.reindexEscrows()
+            print(f"Indexed expiry of {count} escrowed entries")
+
+    except ConfigurationError as e:
+        print(e)
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
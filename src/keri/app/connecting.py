@@ -6,7 +6,13 @@ from keri import kering
 
 
 class Organizer:
-    """ Organizes contacts relating contact information to AIDs """
+    """ Organizes contacts relating contact information to AIDs
+
+    Contact field values are indexed in .hby.db.cidx so lookups by field value
+    only touch matching contacts
+
+    """
+    MaxIdxKeySize = 480  # max bytes of field value index key, LMDB max is 511
 
     def __init__(self, hby):
         """ Create contact Organizer
@@ -15,6 +21,9 @@ class Organizer:
             hby (Habery): database environment for contact information
         """
         self.hby = hby
+        if (next(self.hby.db.cidx.getItemIter(), None) is None and
+                next(self.hby.db.cfld.getItemIter(), None) is not None):
+            self.reindex()  # contacts from before field value index
 
     def update(self, pre, data):
         """ Add or update contact information in data for the identfier prefix
@@ -37,7 +46,10 @@ class Organizer:
         self.hby.db.cons.pin(keys=(pre,), val=raw)
 
         for field, val in data.items():
+            if (old := self.hby.db.cfld.get(keys=(pre, field))) is not None:
+                self.hby.db.cidx.rem(keys=self._idxkey(field, old), val=pre)
             self.hby.db.cfld.pin(keys=(pre, field), val=val)
+            self.hby.db.cidx.add(keys=self._idxkey(field, val), val=pre)
 
     def replace(self, pre, data):
         """ Replace all contact information for identifier prefix with data
@@ -88,7 +100,10 @@ class Organizer:
         """
         self.hby.db.ccigs.rem(keys=(pre,))
         self.hby.db.cons.rem(keys=(pre,))
-        return self.hby.db.cfld.trim(keys=(pre,))
+        for keys, val in self.hby.db.cfld.getItemIter(keys=(pre, "")):
+            field = self.hby.db.cfld.sep.join(keys[1:])
+            self.hby.db.cidx.rem(keys=self._idxkey(field, val), val=pre)
+        return self.hby.db.cfld.trim(keys=(pre, ""))
 
     def get(self, pre):
         """ Retrieve all contact information for identifier prefix
@@ -153,10 +168,59 @@ class Organizer:
         if not isinstance(val, list):
             val = [val]
 
-        pres = []
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field and v in val:
-                pres.append(pre)
+        pres = oset()
+        for v in val:
+            for pre in self.hby.db.cidx.getIter(keys=self._idxkey(field, v)):
+                if self._truncated(field, v) and self.hby.db.cfld.get(keys=(pre, field)) != v:
+                    continue  # truncated index key shared with other value
+                pres.add(pre)
+
+        return [self.get(pre) for pre in pres]
+
+    def findPrefix(self, field, prefix):
+        """ Find all contact information for all contacts whose value in field
+        starts with prefix
+
+        Parameters:
+            field (str): field name to search for
+            prefix (str): start of value to search for
+
+        Returns:
+            list: All contacts that match the prefix in field in order of value
+
+        """
+        pres = oset()
+        for _, pre in self.hby.db.cidx.getItemIter(keys=self._idxkey(field, prefix)):
+            if self._truncated(field, prefix):
+                if not self.hby.db.cfld.get(keys=(pre, field)).startswith(prefix):
+                    continue
+            pres.add(pre)
+
+        return [self.get(pre) for pre in pres]
+
+    def findRange(self, field, start="", stop=None):
+        """ Find all contact information for all contacts whose value in field
+        is in range start inclusive to stop exclusive by lexicographic order of
+        utf-8 encoded values
+
+        Parameters:
+            field (str): field name to search for
+            start (str): lowest value to search for
+            stop (str): value to stop before, None means no upper bound
+
+        Returns:
+            list: All contacts that match the range in field in order of value
+
+        """
+        pres = oset()
+        for v, pre in self._idxItemIter(field, start=start):
+            if stop is not None and v >= stop:
+                break
+            if self._truncated(field, v):  # maybe outside of range in full
+                v = self.hby.db.cfld.get(keys=(pre, field))
+                if v < start or (stop is not None and v >= stop):
+                    continue
+            pres.add(pre)
 
         return [self.get(pre) for pre in pres]
 
@@ -167,16 +231,62 @@ class Organizer:
             field (str): field to load values for
 
         Returns:
-            list: Unique values from all contacts for field
+            list: Unique values from all contacts for field in lexicographic order
 
         """
         vals = oset()
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field:
-                vals.add(v)
+        for v, pre in self._idxItemIter(field):
+            if self._truncated(field, v):
+                v = self.hby.db.cfld.get(keys=(pre, field))
+            vals.add(v)
 
         return list(vals)
 
+    def reindex(self):
+        """ Rebuild field value index of all contacts from their field values
+
+        Returns:
+            int: number of field values indexed
+
+        """
+        self.hby.db.cidx.trim()
+        count = 0
+        for keys, val in self.hby.db.cfld.getItemIter():
+            pre, field = keys[0], self.hby.db.cfld.sep.join(keys[1:])
+            self.hby.db.cidx.add(keys=self._idxkey(field, val), val=pre)
+            count += 1
+
+        return count
+
+    def _idxkey(self, field, val):
+        """ Returns field value index key truncated to .MaxIdxKeySize bytes
+
+        Parameters:
+            field (str): field name
+            val (str): field value
+
+        """
+        key = self.hby.db.cidx.sep.join((field, val)).encode("utf-8")
+        if len(key) > self.MaxIdxKeySize:  # drop any partial utf-8 char at end
+            key = key[:self.MaxIdxKeySize].decode("utf-8", "ignore").encode("utf-8")
+        return key
+
+    def _truncated(self, field, val):
+        """ Returns True if the index key of val in field may be truncated """
+        return len(self._idxkey(field, val)) >= self.MaxIdxKeySize - 3
+
+    def _idxItemIter(self, field, start=""):
+        """ Returns iterator of (value, prefix) of field value index at field
+        starting at value start in lexicographic order of values
+        """
+        top = self._idxkey(field, "")
+        for key, pre in self.hby.db.getAllItemIter(db=self.hby.db.cidx.sdb,
+                                                   key=self._idxkey(field, start),
+                                                   split=False):
+            if not key.startswith(top):
+                break
+            yield key[len(top):].decode("utf-8"), bytes(pre).decode("utf-8")
+
     def setImg(self, pre, typ, stream):
         """ Upload image for identifier prefix
 
@@ -11,6 +11,7 @@ from hio.base import doing
 from .. import help
 from ..core import eventing, routing
 from ..core import parsing
+from ..db import basing
 from ..vdr.eventing import Tevery
 
 logger = help.ogler.getLogger()
@@ -191,6 +192,8 @@ class Reactor(doing.DoDoer):
             doers.extend([doing.doify(self.exchangerDo)])
 
 
+        # parse rx stream by read offset not by deleting front of bytearray
+        self.client.rxbs = parsing.Cursor(self.client.rxbs)
         self.parser = parsing.Parser(ims=self.client.rxbs,
                                      framed=True,
                                      kvy=self.kevery,
@@ -286,7 +289,7 @@ class Reactor(doing.DoDoer):
         """
         yield  # enter context
         while True:
-            self.kevery.processEscrows()
+            self.kevery.processEscrows(woke=True)
             if self.tvy is not None:
                 self.tvy.processEscrows()
             yield
@@ -356,6 +359,7 @@ class Directant(doing.DoDoer):
         .hab is Habitat instance of local controller's context
         .server is TCP client instance. Assumes operated by another doer.
         .rants is dict of Reactants indexed by connection address
+        .size is int minimum bytes per chunk of replays sent by each Reactant
 
     Inherited Properties:
         .tyme is float relative cycle time of associated Tymist .tyme obtained
@@ -388,7 +392,7 @@ class Directant(doing.DoDoer):
        ._tock is hidden attribute for .tock property
     """
 
-    def __init__(self, hab, server, verifier=None, exchanger=None, doers=None, **kwa):
+    def __init__(self, hab, server, verifier=None, exchanger=None, doers=None, size=None, **kwa):
         """
         Initialize instance.
 
@@ -400,12 +404,14 @@ class Directant(doing.DoDoer):
             db is database instance of local controller's context
             verifier (optional) is Verifier instance of local controller's TEL context
             server is TCP Server instance
+            size (optional) is int minimum bytes per chunk of replays sent by Reactants
         """
         self.hab = hab
         self.verifier = verifier
         self.exchanger = exchanger
         self.server = server  # use server for cx
         self.rants = dict()
+        self.size = size
         doers = doers if doers is not None else []
         doers.extend([doing.doify(self.serviceDo)])
         super(Directant, self).__init__(doers=doers, **kwa)
@@ -451,7 +457,7 @@ class Directant(doing.DoDoer):
 
                 if ca not in self.rants:  # create Reactant and extend doers with it
                     rant = Reactant(tymth=self.tymth, hab=self.hab, verifier=self.verifier,
-                                    exchanger=self.exchanger, remoter=ix)
+                                    exchanger=self.exchanger, remoter=ix, size=self.size)
                     self.rants[ca] = rant
                     # add Reactant (rant) doer to running doers
                     self.extend(doers=[rant])  # open and run rant as doer
@@ -489,6 +495,8 @@ class Reactant(doing.DoDoer):
         .hab is Habitat instance of local controller's context
         .kevery is Kevery instance
         .remoter is TCP Remoter instance for connection from remote TCP client.
+        .size is int minimum bytes per chunk of replays sent to .remoter. Next chunk
+            is not queued until fewer than .size bytes are waiting to be sent.
 
     Inherited Attributes:
         .done is Boolean completion state:
@@ -530,7 +538,7 @@ class Reactant(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, remoter, verifier=None, exchanger=None, doers=None, **kwa):
+    def __init__(self, hab, remoter, verifier=None, exchanger=None, doers=None, size=None, **kwa):
         """
         Initialize instance.
 
@@ -544,12 +552,14 @@ class Reactant(doing.DoDoer):
             verifier is Verifier instance of local controller's TEL context
             remoter is TCP Remoter instance
             doers is list of doers (do generator instances, functions or methods)
+            size is int minimum bytes per chunk of replays, defaults to basing.ChunkSize
 
         """
         self.hab = hab
         self.verifier = verifier
         self.exchanger = exchanger
         self.remoter = remoter  # use remoter for both rx and tx
+        self.size = size if size is not None else basing.ChunkSize
 
         doers = doers if doers is not None else []
         doers.extend([doing.doify(self.msgDo),
@@ -576,6 +586,8 @@ class Reactant(doing.DoDoer):
 
         self.kevery.registerReplyRoutes(router=rvy.rtr)
 
+        # parse rx stream by read offset not by deleting front of bytearray
+        self.remoter.rxbs = parsing.Cursor(self.remoter.rxbs)
         self.parser = parsing.Parser(ims=self.remoter.rxbs,
                                      framed=True,
                                      kvy=self.kevery,
@@ -646,10 +658,13 @@ class Reactant(doing.DoDoer):
         yield  # enter context
         while True:
             for msg in self.hab.processCuesIter(self.kevery.cues):
-                if isinstance(msg, list):
-                    msg = bytearray(itertools.chain(*msg))
-
-                self.sendMessage(msg, label="chit or receipt or replay")
+                if isinstance(msg, list):  # replay so send in chunks as remote drains them
+                    for chunk in basing.chunkify(msg, size=self.size):
+                        while len(self.remoter.txbs) >= self.size:
+                            yield  # backpressure wait for remote to drain
+                        self.sendMessage(chunk, label="replay")
+                else:
+                    self.sendMessage(msg, label="chit or receipt")
                 yield  # throttle just do one cue at a time
             yield
         return False  # should never get here except forced close
@@ -676,7 +691,7 @@ class Reactant(doing.DoDoer):
         """
         yield  # enter context
         while True:
-            self.kevery.processEscrows()
+            self.kevery.processEscrows(woke=True)
             if self.tevery is not None:
                 self.tevery.processEscrows()
             yield
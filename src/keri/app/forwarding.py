@@ -11,7 +11,7 @@ from hio.base import doing
 from hio.help import decking
 
 from keri import kering
-from keri.app import agenting
+from keri.app import agenting, httping
 from keri.core import coring, eventing
 from keri.db import dbing
 from keri.peer import exchanging
@@ -23,13 +23,33 @@ class Postman(doing.DoDoer):
     delivers to sends them to one of the target recipient's witnesses for store and forward
     to the intended recipient
 
+    Delivery is pipelined.  Enveloped messages are queued per witness URL and up to
+    .batch queued messages are coalesced into one CESR stream sent over a pooled
+    witnesser, with at most .window streams in flight per witness.  The KEL of the
+    sender is introduced to each witness once and afterwards only new events are sent.
+    A KEL counts as introduced only once the stream carrying it is answered with a
+    2xx response. Idle pooled witnessers are closed after .linger seconds.
+
     """
+    Batch = 32  # maximum number of messages coalesced into one stream
+    Window = 4  # maximum number of streams in flight per witness
+    Linger = 2.0  # seconds an idle pool of witnessers is kept open
 
-    def __init__(self, hby, evts=None, cues=None, klas=None, **kwa):
+    def __init__(self, hby, evts=None, cues=None, klas=None, batch=None, window=None, linger=None, **kwa):
         self.hby = hby
         self.evts = evts if evts is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.klas = klas if klas is not None else agenting.HttpWitnesser
+        self.batch = batch if batch is not None else self.Batch
+        self.window = window if window is not None else self.Window
+        self.linger = linger if linger is not None else self.Linger
+
+        self.witers = dict()  # pooled witnessers keyed by witness URL
+        self.queues = dict()  # deque of (cue, msg) waiting to be sent keyed by witness URL
+        self.flights = dict()  # deque of (mark, cues) of streams in flight keyed by witness URL
+        self.posts = dict()  # number of streams posted keyed by witness URL
+        self.introduced = dict()  # last first seen ordinal of KEL delivered keyed by (wit, pre)
+        self.introducing = dict()  # last first seen ordinal of KEL queued keyed by (wit, pre)
 
         doers = [doing.doify(self.deliverDo)]
         super(Postman, self).__init__(doers=doers, **kwa)
@@ -50,55 +70,162 @@ class Postman(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        idled = None  # tyme pool went idle
         while True:
             while self.evts:
-                evt = self.evts.popleft()
-                src = evt["src"]
-                recp = evt["dest"]
-                tpc = evt["topic"]
-                srdr = evt["serder"]
-
-                # Get the hab of the sender
-                hab = self.hby.habs[src]
-
-                # Get the kever of the recipient and choose a witness
-                wit = agenting.mailbox(hab, recp)
-                if not wit:
-                    print(f"exiting because can't find wit for {recp}")
-                    continue
+                self.enqueue(self.evts.popleft())
 
-                msg = bytearray()
-                msg.extend(introduce(hab, wit))
-                # Transpose the signatures to point to the new location
+            for url in self.queues:
+                self.dispatch(url)
 
-                # create the forward message with payload embedded at `a` field
-                fwd = exchanging.exchange(route='/fwd', modifiers=dict(pre=recp, topic=tpc),
-                                          payload=srdr.ked)
-                ims = hab.endorse(serder=fwd, last=True, pipelined=False)
+            self.complete()
 
-                if "attachment" in evt:
-                    atc = bytearray()
-                    attachment = evt["attachment"]
-                    pather = coring.Pather(path=["a"])
-                    atc.extend(pather.qb64b)
-                    atc.extend(attachment)
-                    ims.extend(coring.Counter(code=coring.CtrDex.PathedMaterialQuadlets,
-                                              count=(len(atc) // 4)).qb64b)
-                    ims.extend(atc)
+            if any(self.queues.values()) or any(self.flights.values()) or not self.witers:
+                idled = None
+            elif idled is None:
+                idled = self.tyme
+            elif self.tyme - idled >= self.linger:
+                self.release()
+                idled = None
 
-                witer = agenting.witnesser(hab=hab, wit=wit)
+            yield self.tock
 
-                msg.extend(ims)
-                witer.msgs.append(bytearray(msg))  # make a copy
-                self.extend([witer])
+    def enqueue(self, evt):
+        """ Envelope evt in a `fwd` message and queue it for the mailbox witness of its recipient
 
-                while not witer.sent:
-                    _ = (yield self.tock)
+        Parameters:
+            evt (dict): message to forward as queued by .send
+        """
+        src = evt["src"]
+        recp = evt["dest"]
+        tpc = evt["topic"]
+        srdr = evt["serder"]
+
+        # Get the hab of the sender
+        hab = self.hby.habs[src]
+
+        # Get the kever of the recipient and choose a witness
+        wit = agenting.mailbox(hab, recp)
+        if not wit:
+            print(f"exiting because can't find wit for {recp}")
+            return
+
+        url = agenting.witnessUrl(hab, wit)
+        if url not in self.witers:
+            witer = agenting.witnesser(hab=hab, wit=wit)
+            self.witers[url] = witer
+            self.queues[url] = decking.Deck()
+            self.flights[url] = decking.Deck()
+            self.posts[url] = 0
+            self.extend([witer])
+
+        msg = bytearray()
+        msg.extend(self.introduce(hab, wit))
+        keys = (wit, hab.pre)
+        intro = (keys, self.introducing[keys]) if keys in self.introducing else None
+
+        # create the forward message with payload embedded at `a` field
+        fwd = exchanging.exchange(route='/fwd', modifiers=dict(pre=recp, topic=tpc),
+                                  payload=srdr.ked)
+        ims = hab.endorse(serder=fwd, last=True, pipelined=False)
+
+        if "attachment" in evt:
+            atc = bytearray()
+            attachment = evt["attachment"]
+            pather = coring.Pather(path=["a"])
+            atc.extend(pather.qb64b)
+            atc.extend(attachment)
+            ims.extend(coring.Counter(code=coring.CtrDex.PathedMaterialQuadlets,
+                                      count=(len(atc) // 4)).qb64b)
+            ims.extend(atc)
+
+        msg.extend(ims)
+        self.queues[url].append((dict(dest=recp, topic=tpc, said=srdr.said), msg, intro))
+
+    def introduce(self, hab, wit):
+        """ Returns KEL of hab to send to wit, only the events not already sent to it
+        by a delivered or in flight stream
 
-                self.cues.append(dict(dest=recp, topic=tpc, said=srdr.said))
-                yield self.tock
+        Parameters:
+            hab (Hab): local environment for the identifier to propagate
+            wit (str): qb64 identifier prefix of the mailbox witness
+        """
+        if wit in hab.kever.wits:  # own witnesses get KEL from receipting
+            return bytearray()
+
+        keys = (wit, hab.pre)
+        fner = self.hby.db.fons.get(keys=(hab.pre, hab.kever.serder.said))
+        last = fner.sn if fner is not None else None
+
+        sent = self.introducing.get(keys, self.introduced.get(keys))
+        if sent is None:
+            msgs = introduce(hab, wit)
+        elif last is not None and last > sent:
+            msgs = agenting.catchup(hab, wit, start=sent + 1)
+        else:
+            msgs = bytearray()
+
+        if last is not None:
+            self.introducing[keys] = last
+        return msgs
 
-            yield self.tock
+    def dispatch(self, url):
+        """ Coalesce queued messages for witness at url into streams while its window allows
+
+        Parameters:
+            url (str): witness URL of pooled witnesser
+        """
+        queue = self.queues[url]
+        flights = self.flights[url]
+        while queue and len(flights) < self.window:
+            stream = httping.CesrStream()
+            cues = []
+            intros = []
+            while queue and len(cues) < self.batch:
+                cue, msg, intro = queue.popleft()
+                stream.extend(msg)
+                cues.append(cue)
+                if intro is not None:
+                    intros.append(intro)
+
+            self.witers[url].msgs.append(stream)
+            self.posts[url] += 1
+            flights.append((self.posts[url], cues, intros))
+
+    def complete(self):
+        """ Cue every message whose stream has been answered by its witness
+
+        Over HTTP each stream is one request so responses are matched to streams in
+        order. KELs carried by a stream answered with 2xx are recorded as introduced,
+        otherwise they are forgotten so the next message introduces them again.
+        TCP has no responses so a stream counts as delivered once flushed.
+        """
+        for url, flights in self.flights.items():
+            witer = self.witers[url]
+            while flights and witer.flushed >= flights[0][0] and witer.sent:
+                _, cues, intros = flights.popleft()
+                sent = witer.sent.popleft()  # response over HTTP, stream over TCP
+                ok = (not isinstance(witer, agenting.HttpWitnesser)
+                      or 200 <= sent.status < 300)
+                for keys, last in intros:
+                    if ok:
+                        self.introduced[keys] = max(last, self.introduced.get(keys, last))
+                        if self.introducing.get(keys) == self.introduced[keys]:
+                            del self.introducing[keys]  # nothing later in flight
+                    else:
+                        self.introduced.pop(keys, None)
+                        self.introducing.pop(keys, None)
+                self.cues.extend(cues)
+
+    def release(self):
+        """ Close and remove all pooled witnessers and forget introduced KELs """
+        self.remove(list(self.witers.values()))
+        self.witers = dict()
+        self.queues = dict()
+        self.flights = dict()
+        self.posts = dict()
+        self.introduced = dict()
+        self.introducing = dict()
 
     def send(self, src, dest, topic, serder, attachment=None):
         """
@@ -270,9 +397,8 @@ def introduce(hab, wit):
                 found = True  # yes so don't send own inception
 
     if not found:  # no receipt from remote so send own inception
-        # no vrcs or rct of own icp from remote so send own inception
-        for msg in hab.db.clonePreIter(pre=hab.pre):
-            msgs.extend(msg)
+        # no vrcs or rct of own icp from remote so send whatever part of KEL remote is missing
+        msgs.extend(agenting.catchup(hab, wit))
 
         msgs.extend(hab.replyEndRole(cid=hab.pre, role=kering.Roles.witness))
 
@@ -4,6 +4,7 @@ KERI
 keri.app.habbing module
 
 """
+import itertools
 import json
 import os
 from contextlib import contextmanager
@@ -313,7 +314,8 @@ class Habery:
             self.setup(**self._inits)  # finish setup later
 
     def setup(self, *, seed=None, aeid=None, bran=None, pidx=None, algo=None,
-              salt=None, tier=None, free=False, temp=None, ):
+              salt=None, tier=None, free=False, temp=None, cacheSize=0,
+              cacheTTL=300.0):
         """
         Setup Habery. Assumes that both .db and .ks have been opened.
         This allows dependency injection of .db and .ks into Habery instance
@@ -352,6 +354,9 @@ class Habery:
                     Use quick method to stretch salts for seeds such as
                     bran salt to seed or key creation of Habs.
                     Otherwise use more resources set by tier to stretch
+            cacheSize (int): max decrypted signers .mgr holds in memory for
+                signing. Zero means do not cache, see keeping.SignerCache
+            cacheTTL (float): seconds .mgr holds each cached decrypted signer
         """
         if not (self.ks.opened and self.db.opened):
             raise kering.ClosedError("Attempt to setup Habitat with closed "
@@ -376,7 +381,8 @@ class Habery:
 
         try:
             self.mgr = keeping.Manager(ks=self.ks, seed=seed, aeid=aeid, pidx=pidx,
-                                       algo=algo, salt=salt, tier=tier)
+                                       algo=algo, salt=salt, tier=tier,
+                                       cacheSize=cacheSize, cacheTTL=cacheTTL)
         except kering.AuthError as ex:
             self.close()
             raise ex
@@ -533,6 +539,9 @@ class Habery:
         Parameters:
            clear is boolean, True means clear resource directories
         """
+        if self.mgr:
+            self.mgr.clearCache()
+
         if self.ks:
             self.ks.close(clear=self.ks.temp or clear)
 
@@ -1345,20 +1354,36 @@ class Hab:
                 default is own .pre
             fn is int first seen ordering number
 
+        """
+        msgs = bytearray()
+        for chunk in self.replayIter(pre=pre, fn=fn):
+            msgs.extend(chunk)
+
+        return msgs
+
+    def replayIter(self, pre=None, fn=0, size=None):
+        """
+        Returns generator of chunks of the replay of FEL first seen event log
+        for pre starting from fn, preceded by the FEL of its delegator if any.
+        Only one chunk is held in memory at a time and no read transaction is
+        held open between chunks.
+
+        Parameters:
+            pre (str): qb64 identifier prefix, default is own .pre
+            fn (int): first seen ordering number
+            size (int): minimum bytes per chunk, defaults to basing.ChunkSize
+
         """
         if not pre:
             pre = self.pre
 
-        msgs = bytearray()
         kever = self.kevers[pre]
+        chunks = self.db.clonePreChunkIter(pre=pre, fn=fn, size=size)
         if kever.delegated:
-            for msg in self.db.clonePreIter(pre=kever.delegator, fn=0):
-                msgs.extend(msg)
+            chunks = itertools.chain(self.db.clonePreChunkIter(pre=kever.delegator, fn=0, size=size),
+                                     chunks)
 
-        for msg in self.db.clonePreIter(pre=pre, fn=fn):
-            msgs.extend(msg)
-
-        return msgs
+        return basing.chunkify(chunks, size=size)
 
     def replayAll(self, key=b''):
         """
@@ -1369,10 +1394,22 @@ class Hab:
 
         """
         msgs = bytearray()
-        for msg in self.db.cloneAllPreIter(key=key):
-            msgs.extend(msg)
+        for chunk in self.replayAllIter(key=key):
+            msgs.extend(chunk)
         return msgs
 
+    def replayAllIter(self, key=b'', size=None):
+        """
+        Returns generator of chunks of the replay of FEL first seen event log
+        for all pre starting at key
+
+        Parameters:
+            key (bytes): fnKey(pre, fn)
+            size (int): minimum bytes per chunk, defaults to basing.ChunkSize
+
+        """
+        return basing.chunkify(self.db.cloneAllPreIter(key=key), size=size)
+
     def makeOtherEvent(self, pre, sn):
         """
         Returns: messagized bytearray message with attached signatures of
@@ -1679,7 +1716,24 @@ class Hab:
             scheme (str): url scheme
         """
         msgs = bytearray()
+        for msg in self.replyEndRoleIter(cid=cid, role=role, eids=eids, scheme=scheme):
+            msgs.extend(msg)
 
+        return msgs
+
+    def replyEndRoleIter(self, cid, role=None, eids=None, scheme="", size=None):
+        """
+        Returns generator of the reply message stream of .replyEndRole so a
+        witness replaying a KEL as authz does not build the whole KEL in memory.
+
+        Parameters:
+            cid (str): identifier prefix qb64 of controller authZ endpoint provided
+                       eid is witness
+            role (str): authorized role for eid
+            eids (list): when provided restrict returns to only eids in eids
+            scheme (str): url scheme
+            size (int): minimum bytes per chunk of KEL replay
+        """
         if eids is None:
             eids = []
 
@@ -1691,20 +1745,19 @@ class Hab:
                 for eid in kever.wits:
                     if not eids or eid in eids:
                         if eid == self.pre:
-                            msgs.extend(self.replyLocScheme(eid=eid, scheme=scheme))
+                            yield self.replyLocScheme(eid=eid, scheme=scheme)
                         else:
-                            msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
+                            yield self.loadLocScheme(eid=eid, scheme=scheme)
                         if not witness:  # we are not witness, send auth records
-                            msgs.extend(self.makeEndRole(eid=eid, role=role))
+                            yield self.makeEndRole(eid=eid, role=role)
                 if witness:  # we are witness, set KEL as authz
-                    msgs.extend(self.replay(cid))
+                    yield from self.replayIter(cid, size=size)
 
-        for (_, erole, eid), end in self.db.ends.getItemIter(keys=(cid,)):
+        ends = list(self.db.ends.getItemIter(keys=(cid,)))  # no read txn held across yields
+        for (_, erole, eid), end in ends:
             if (end.enabled or end.allowed) and (not role or role == erole) and (not eids or eid in eids):
-                msgs.extend(self.replyLocScheme(eid=eid, scheme=scheme))
-                msgs.extend(self.makeEndRole(eid=eid, role=erole))
-
-        return msgs
+                yield self.replyLocScheme(eid=eid, scheme=scheme)
+                yield self.makeEndRole(eid=eid, role=erole)
 
     def replyToOobi(self, aid, role, eids=None):
         """
@@ -1730,6 +1783,20 @@ class Hab:
         # not permiteed in .habs.oobis
         return self.replyEndRole(cid=aid, role=role, eids=eids)
 
+    def replyToOobiIter(self, aid, role, eids=None, size=None):
+        """
+        Returns generator of chunks of the reply message stream of .replyToOobi
+        for writing incrementally to an OOBI response.
+
+        Parameters:
+            aid (str): qb64 of identifier in oobi, may be cid or eid
+            role (str): authorized role for eid
+            eids (list): when provided restrict returns to only eids in eids
+            size (int): minimum bytes per chunk, defaults to basing.ChunkSize
+
+        """
+        return basing.chunkify(self.replyEndRoleIter(cid=aid, role=role, eids=eids, size=size), size=size)
+
     def getOwnEvent(self, sn):
         """
         Returns: message Serder and controller signatures of
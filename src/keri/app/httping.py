@@ -18,6 +18,7 @@ logger = help.ogler.getLogger()
 
 CESR_CONTENT_TYPE = "application/cesr+json"
 CESR_ATTACHMENT_HEADER = "CESR-ATTACHMENT"
+CESR_STREAM_CONTENT_TYPE = "application/cesr"
 
 
 class SignatureValidationComponent(object):
@@ -65,6 +66,12 @@ class SignatureValidationComponent(object):
         return True
 
 
+class CesrStream(bytearray):
+    """ Stream of CESR messages with attachments that is sent over HTTP as the body
+    of a single framed request instead of as one request per message
+    """
+
+
 @dataclass
 class CesrRequest:
     payload: dict
@@ -197,3 +204,30 @@ def streamCESRRequests(client, ims, path=None):
     return cnt
 
 
+
+
+def createCESRStreamRequest(client, ims, path=None):
+    """
+    Turns a stream of KERI messages into a single CESR stream http request against
+    the provided hio http Client.  All messages and their attachments are sent as
+    the request body so the whole stream costs one round trip.
+
+    Parameters
+       client (Client): hio http Client that will send the stream
+       ims (bytearray):  stream of KERI messages with attachments
+       path (str): path to put to
+
+    """
+    path = path if path is not None else "/"
+
+    headers = Hict([
+        ("Content-Type", CESR_STREAM_CONTENT_TYPE),
+        ("Content-Length", len(ims)),
+    ])
+
+    client.request(
+        method="PUT",
+        path=path,
+        headers=headers,
+        body=bytes(ims)
+    )
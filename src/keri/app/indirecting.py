@@ -83,6 +83,7 @@ def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
 
     # setup doers
     regDoer = basing.BaserDoer(baser=verfer.reger)
+    pruneDoer = basing.PruneDoer(baser=hby.db)
 
     server = serving.Server(host="", port=tcpPort)
     serverDoer = serving.ServerDoer(server=server)
@@ -94,7 +95,7 @@ def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
                             responses=rep.cues, queries=httpEnd.qrycues)
 
     doers.extend(oobiRes)
-    doers.extend([regDoer, exchanger, directant, serverDoer, httpServerDoer, rep, witStart, oobiery])
+    doers.extend([regDoer, pruneDoer, exchanger, directant, serverDoer, httpServerDoer, rep, witStart, oobiery])
 
     return doers
 
@@ -178,7 +179,7 @@ class WitnessStart(doing.DoDoer):
         _ = (yield self.tock)
 
         while True:
-            self.kvy.processEscrows()
+            self.kvy.processEscrows(woke=True)
             self.rvy.processEscrowReply()
             if self.tvy is not None:
                 self.tvy.processEscrows()
@@ -424,7 +425,7 @@ class Indirector(doing.DoDoer):
         _ = (yield self.tock)
 
         while True:
-            self.kevery.processEscrows()
+            self.kevery.processEscrows(woke=True)
             yield
 
     def sendMessage(self, msg, label=""):
@@ -686,7 +687,7 @@ class MailboxDirector(doing.DoDoer):
         _ = (yield self.tock)
 
         while True:
-            self.kvy.processEscrows()
+            self.kvy.processEscrows(woke=True)
             self.rvy.processEscrowReply()
             if self.tevery is not None:
                 self.tevery.processEscrows()
@@ -914,6 +915,47 @@ class HttpEnd:
             rep.status = falcon.HTTP_200
             rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=serder.said)
 
+    def on_put(self, req, rep):
+        """
+        Handles PUT for a framed stream of KERI messages with attachments.
+
+        Parameters:
+              req (Request) Falcon HTTP request
+              rep (Response) Falcon HTTP response
+
+        ---
+        summary:  Accept stream of KERI events with inline attachments and parse
+        description:  Accept a CESR stream of KERI events, such as a KEL catch-up, in a single request.
+        tags:
+           - Events
+        requestBody:
+           required: true
+           content:
+             application/cesr:
+               schema:
+                 type: string
+                 format: binary
+                 description: CESR stream of KERI messages with attachments
+        responses:
+           204:
+              description: KERI message stream accepted.
+        """
+        if req.method == "OPTIONS":
+            rep.status = falcon.HTTP_200
+            return
+
+        rep.set_header('Cache-Control', "no-cache")
+        rep.set_header('connection', "close")
+
+        if req.content_type != httping.CESR_STREAM_CONTENT_TYPE:
+            raise falcon.HTTPError(falcon.HTTP_NOT_ACCEPTABLE,
+                                   title="Content type error",
+                                   description="Unacceptable content type.")
+
+        self.rxbs.extend(req.bounded_stream.read())
+
+        rep.status = falcon.HTTP_204
+
 
 class QryRpyMailboxIterable:
 
@@ -944,8 +986,21 @@ class QryRpyMailboxIterable:
 
         return next(self.iter)
 
+    def close(self):
+        """ Close wrapped MailboxIterable if any """
+        if self.iter is not None:
+            self.iter.close()
+
 
 class MailboxIterable:
+    """
+    Server sent event stream of the messages of topics in the mailbox of pre.
+    Subscribes to Mailboxer notification of stored messages so an idle stream
+    returns empty chunks without reading the database. Ends after retry line
+    when the Mailboxer is at its max number of subscribed streams so client
+    reconnects after retry.
+
+    """
 
     TimeoutMBX = 30000000
 
@@ -954,9 +1009,13 @@ class MailboxIterable:
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.stream = None
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
+        self.stream = self.mbx.subscribe([self.pre + topic for topic in self.topics])
+        if self.stream is not None:  # read each topic from database on first pass
+            self.stream.stale.update(self.stream.topics)
         return self
 
     def __next__(self):
@@ -965,19 +1024,44 @@ class MailboxIterable:
                 self.end = time.perf_counter()
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
+            if self.stream is None:  # too many streams so client retries later
+                raise StopIteration
+
             data = bytearray()
-            for topic, idx in self.topics.items():
-                key = self.pre + topic
-                for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
-                    data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry).encode(
-                        "utf-8")))
-                    data.extend(msg)
-                    data.extend(b'\n\n')
-                    idx = idx + 1
-                    self.start = time.perf_counter()
-
-                self.topics[topic] = idx
+            while self.stream.stale:  # overflowed topics read from database
+                key = self.stream.stale.pop(0)
+                topic = key.decode("utf-8")[len(self.pre):]
+                for fn, _, msg in self.mbx.cloneTopicIter(key, self.topics[topic]):
+                    self.send(data, topic, fn, msg)
+
+            while self.stream.msgs:
+                key, fn, msg = self.stream.msgs.popleft()
+                topic = key.decode("utf-8")[len(self.pre):]
+                if fn < self.topics[topic]:  # already sent or before requested index
+                    continue
+                if fn > self.topics[topic]:  # missed some so read from database
+                    for fn, _, msg in self.mbx.cloneTopicIter(key, self.topics[topic]):
+                        self.send(data, topic, fn, msg)
+                    continue
+                self.send(data, topic, fn, msg)
+
             self.end = time.perf_counter()
             return data
 
+        self.close()
         raise StopIteration
+
+    def send(self, data, topic, fn, msg):
+        """ Extend data with server sent event of msg at fn of topic """
+        data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry).encode(
+            "utf-8")))
+        data.extend(msg)
+        data.extend(b'\n\n')
+        self.topics[topic] = fn + 1
+        self.start = time.perf_counter()
+
+    def close(self):
+        """ Unsubscribe from mailbox notification, called by server when stream ends """
+        if self.stream is not None:
+            self.mbx.unsubscribe(self.stream)
+            self.stream = None
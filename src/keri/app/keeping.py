@@ -24,12 +24,14 @@ raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 """
 import os
 import stat
+import time
 import json
 import math
 
 from typing import Union
 from dataclasses import dataclass, asdict, field
-from collections import namedtuple, deque
+from collections import namedtuple, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from hio.base import doing
 
@@ -360,6 +362,7 @@ class Creator:
 
     Methods:
         .create is method to create key pair
+        .creates is method to create multiple sets of key pairs
 
     Hidden:
 
@@ -379,6 +382,13 @@ class Creator:
         """
         return []
 
+    def creates(self, sets, **kwa):
+        """
+        Returns list of lists of signers, one list per dict of .create
+        parameters in sets. Parameters in kwa apply to all sets.
+        """
+        return [self.create(**kwa, **params) for params in sets]
+
     @property
     def salt(self):
         """
@@ -461,6 +471,9 @@ class SaltyCreator(Creator):
     Hidden:
         ._salter holds instance for .salter property
     """
+    Workers = {coring.Tiers.low: 4,  # max concurrent stretches by tier
+               coring.Tiers.med: 2,  # med tier stretch uses 256 MiB each
+               coring.Tiers.high: 1}  # high tier stretch uses 1 GiB each
 
     def __init__(self, salt=None, stem=None, tier=None, **kwa):
         """
@@ -514,18 +527,55 @@ class SaltyCreator(Creator):
             temp is Boolean True means use temp stretch otherwise use time set
                  by tier for streching
         """
-        signers = []
-        if not codes:  # if not codes make list len count of same code
-            codes = [code for i in range(count)]
+        return self.creates([dict(codes=codes, count=count, code=code,
+                                  pidx=pidx, ridx=ridx, kidx=kidx)],
+                            transferable=transferable, temp=temp)[0]
+
+    def creates(self, sets, transferable=True, temp=False, **kwa):
+        """
+        Returns list of lists of signers, one list per dict of .create
+        parameters codes, count, code, pidx, ridx, kidx in sets.
+        Stretches the paths of all sets concurrently with up to .Workers of
+        tier threads since the stretch releases the GIL. Temp stretches use
+        workers of low tier.
+
+        Parameters:
+            sets (list): of dicts of .create parameters one per set of key pairs
+            transferable is Boolean, True means use trans deriv code. Otherwise nontrans
+            temp is Boolean True means use temp stretch otherwise use time set
+                 by tier for streching
+        """
+        specs = []  # (set index, path, code)
+        for i, params in enumerate(sets):
+            codes = params.get("codes")
+            if not codes:  # if not codes make list len count of same code
+                codes = [params.get("code", coring.MtrDex.Ed25519_Seed)
+                         for j in range(params.get("count", 1))]
+
+            stem = self.stem if self.stem else "{:x}".format(params.get("pidx", 0))  # if not stem use pidx
+            ridx = params.get("ridx", 0)
+            kidx = params.get("kidx", 0)
+            for j, code in enumerate(codes):
+                specs.append((i, "{}{:x}{:x}".format(stem, ridx, kidx + j), code))
+
+        def make(spec):
+            _, path, code = spec
+            return self.salter.signer(path=path,
+                                      code=code,
+                                      transferable=transferable,
+                                      tier=self.tier,
+                                      temp=temp)
+
+        workers = self.Workers[coring.Tiers.low if temp else self.tier]
+        if len(specs) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(specs))) as pool:
+                made = list(pool.map(make, specs))
+        else:
+            made = [make(spec) for spec in specs]
 
-        stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
-        for i, code in enumerate(codes):
-            path = "{}{:x}{:x}".format(stem, ridx, kidx + i)
-            signers.append(self.salter.signer(path=path,
-                                              code=code,
-                                              transferable=transferable,
-                                              tier=self.tier,
-                                              temp=temp))
+        signers = [[] for params in sets]
+        for (i, _, _), signer in zip(specs, made):
+            signers[i].append(signer)
         return signers
 
 
@@ -587,6 +637,93 @@ class Creatory:
 Initage = namedtuple("Initage", 'aeid pidx salt tier')
 
 
+class SignerCache:
+    """
+    Bounded time limited in memory cache of decrypted Signers keyed by qb64
+    public key so signing need not fetch and decrypt private keys each time.
+    Least recently used signers are evicted beyond .capacity and signers are
+    expired .ttl seconds after they were cached.
+
+    Evicted signers are dropped from memory. Python bytes are immutable so
+    their secret seed can not be zeroed in place, only released.
+
+    Attributes:
+        capacity (int): max signers held
+        ttl (float): seconds a signer is held after it was cached
+        hits (int): count of gets found in cache
+        misses (int): count of gets not found in cache or expired
+        evictions (int): count of signers evicted to stay within .capacity
+        expirations (int): count of signers dropped after .ttl
+
+    """
+
+    def __init__(self, capacity=64, ttl=300.0):
+        """
+        Parameters:
+            capacity (int): max signers held
+            ttl (float): seconds a signer is held after it was cached
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._signers = OrderedDict()  # (signer, expire tyme) by pub
+
+    def __len__(self):
+        return len(self._signers)
+
+    def get(self, pub):
+        """
+        Returns cached Signer for qb64 pub or None if missing or expired
+        """
+        if (entry := self._signers.get(pub)) is None:
+            self.misses += 1
+            return None
+
+        signer, expire = entry
+        if time.monotonic() >= expire:
+            del self._signers[pub]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._signers.move_to_end(pub)
+        self.hits += 1
+        return signer
+
+    def put(self, pub, signer):
+        """
+        Caches signer for qb64 pub evicting least recently used beyond capacity
+        """
+        self._signers[pub] = (signer, time.monotonic() + self.ttl)
+        self._signers.move_to_end(pub)
+        while len(self._signers) > self.capacity:
+            self._signers.popitem(last=False)
+            self.evictions += 1
+
+    def rem(self, pub):
+        """
+        Removes signer for qb64 pub if any
+        """
+        self._signers.pop(pub, None)
+
+    def clear(self):
+        """
+        Removes all signers
+        """
+        self._signers.clear()
+
+    def metrics(self):
+        """
+        Returns dict of cache metrics
+        """
+        return dict(size=len(self._signers), capacity=self.capacity, ttl=self.ttl,
+                    hits=self.hits, misses=self.misses, evictions=self.evictions,
+                    expirations=self.expirations)
+
+
 class Manager:
     """Manages key pairs creation, storage, and signing
     Class for managing key pair creation, storage, retrieval, and message signing.
@@ -599,6 +736,8 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        cache (SignerCache | None): cache of decrypted signers used by .sign
+            when enabled. Disabled (None) unless cacheSize is provided.
 
     Attributes (Hidden):
 
@@ -635,12 +774,15 @@ class Manager:
 
     """
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, cacheSize=0, cacheTTL=300.0, **kwa):
         """
         Setup Manager.
 
         Parameters:
             ks (Keeper): key store instance (LMDB)
+            cacheSize (int): max decrypted signers to hold in memory for signing.
+                Zero (default) means do not cache decrypted signers.
+            cacheTTL (float): seconds to hold each cached decrypted signer
             seed (str): qb64 private-signing key (seed) for the aeid from which
                 the private decryption key may be derived. If aeid stored in
                 database is not empty then seed may required to do any key
@@ -669,6 +811,7 @@ class Manager:
         self.decrypter = None
         self._seed = seed if seed is not None else ""
         self.inited = False
+        self.cache = SignerCache(capacity=cacheSize, ttl=cacheTTL) if cacheSize else None
 
         # save keyword arg parameters to init later if db not opened yet
         self._inits = kwa
@@ -807,6 +950,7 @@ class Manager:
 
         self.ks.gbls.pin("aeid", aeid)  # set aeid in db
         self._seed = seed  # set .seed in memory
+        self.clearCache()
 
         # update .decrypter
         self.decrypter = coring.Decrypter(seed=seed) if seed else None
@@ -993,24 +1137,24 @@ class Manager:
                 raise ValueError("Invalid icount={} must be > 0.".format(icount))
             icodes = [icode for i in range(icount)]
 
-        isigners = creator.create(codes=icodes,
-                                  pidx=pidx, ridx=ridx, kidx=kidx,
-                                  transferable=transferable, temp=temp)
-        verfers = [signer.verfer for signer in isigners]
-
-        if isith is None:
-            isith = "{:x}".format(max(1, math.ceil(len(isigners) / 2)))
-        cst = coring.Tholder(sith=isith).sith  # current signing threshold
-
         if not ncodes:  # all same code, make list of len ncount of same code
             if ncount < 0:  # next may be zero if non-trans
                 raise ValueError("Invalid ncount={} must be >= 0.".format(ncount))
             ncodes = [ncode for i in range(ncount)]
 
+        # create current and next signers together so salty stretches run concurrently
         # count set to 0 to ensure does not create signers if ncodes is empty
-        nsigners = creator.create(codes=ncodes, count=0,
-                                  pidx=pidx, ridx=ridx+1, kidx=kidx+len(icodes),
-                                  transferable=transferable, temp=temp)
+        isigners, nsigners = creator.creates([dict(codes=icodes,
+                                                   pidx=pidx, ridx=ridx, kidx=kidx),
+                                              dict(codes=ncodes, count=0,
+                                                   pidx=pidx, ridx=ridx+1, kidx=kidx+len(icodes))],
+                                             transferable=transferable, temp=temp)
+        verfers = [signer.verfer for signer in isigners]
+
+        if isith is None:
+            isith = "{:x}".format(max(1, math.ceil(len(isigners) / 2)))
+        cst = coring.Tholder(sith=isith).sith  # current signing threshold
+
         digers = [coring.Diger(ser=signer.verfer.qb64b, code=dcode) for signer in nsigners]
 
         if nsith is None:
@@ -1234,9 +1378,17 @@ class Manager:
         if erase:
             for pub in old.pubs:  # remove prior old prikeys not current old
                 self.ks.pris.rem(pub)
+        self.clearCache()
 
         return (verfers, digers, cst, nst)
 
+    def clearCache(self):
+        """
+        Drops all cached decrypted signers if caching enabled
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
     def sign(self, ser, pubs=None, verfers=None, indexed=True, indices=None):
         """
         Returns list of signatures of ser if indexed as Sigers else as Cigars with
@@ -1267,48 +1419,63 @@ class Manager:
         then signs ser with eah pub
         returns list of sigers indexed else list of cigars if not
         """
-        signers = []
+        return self.signs([ser], pubs=pubs, verfers=verfers, indexed=indexed,
+                          indices=indices)[0]
+
+    def signs(self, sers, pubs=None, verfers=None, indexed=True, indices=None):
+        """
+        Returns list of lists of signatures, one list per serialization in sers.
+        Same as .sign for each ser but fetches and decrypts the private keys
+        only once for the whole batch, such as for a batch of receipts.
 
+        Parameters:
+            sers (list): of bytes serializations to sign
+            pubs is list of qb64 public keys to lookup private keys
+            verfers is list of Verfers for public keys
+            indexed is Boolean, True means return Siger instances else Cigar instances
+            indices is list of int indexes (offsets) to use for indexed signatures
+                See .sign
+        """
         if pubs is None and verfers is None:
             raise ValueError("pubs or verfers required")
 
-        if pubs:
-            for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+        if not pubs:
+            pubs = [verfer.qb64 for verfer in verfers] if verfers is not None else []
 
-        else:
-            for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
+        signers = []
+        for pub in pubs:
+            if self.aeid and not self.decrypter:
+                raise kering.DecryptError("Unauthorized decryption attempt. "
+                                          "Aeid but no decrypter.")
+            if self.cache is not None and (signer := self.cache.get(pub)) is not None:
                 signers.append(signer)
+                continue
+            if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
+                    is None):
+                raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+            if self.cache is not None:
+                self.cache.put(pub, signer)
+            signers.append(signer)
 
         if indices and len(indices) != len(signers):
             raise ValueError("Mismatch length indices={} and resultant signers "
                              "list={}".format(len(indices), len(signers)))
 
-        if indexed or indices:
-            sigers = []
-            for i, signer in enumerate(signers):
-                if indices:
-                    i = indices[i]  # get index from indices
-                sigers.append(signer.sign(ser, index=i))  # assigns .verfer to siger
-            return sigers
-        else:
-            cigars = []
-            for signer in signers:
-                cigars.append(signer.sign(ser))  # assigns .verfer to cigar
-            return cigars
+        sigs = []
+        for ser in sers:
+            if indexed or indices:
+                sigers = []
+                for i, signer in enumerate(signers):
+                    if indices:
+                        i = indices[i]  # get index from indices
+                    sigers.append(signer.sign(ser, index=i))  # assigns .verfer to siger
+                sigs.append(sigers)
+            else:
+                cigars = []
+                for signer in signers:
+                    cigars.append(signer.sign(ser))  # assigns .verfer to cigar
+                sigs.append(cigars)
+        return sigs
 
 
     def ingest(self, secrecies, iridx=0, ncount=1, ncode=coring.MtrDex.Ed25519_Seed,
@@ -1572,6 +1739,7 @@ class Manager:
             if erase:
                 for pub in old.pubs:  # remove prior old prikeys not current old
                     self.ks.pris.rem(pub)
+                self.clearCache()
 
         return (verfers, digers, cst, nst)
 
@@ -1622,6 +1790,7 @@ class Manager:
         if erase and oldps:
             for pub in oldps.pubs:  # remove old prikeys
                 self.ks.pris.rem(pub)
+            self.clearCache()
 
         verfers = [coring.Verfer(qb64=pub) for pub in newps.pubs]
         digers = [coring.Diger(ser=pub.encode("utf-8"), code=code) for pub in nxtps.pubs]
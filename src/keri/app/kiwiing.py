@@ -4,6 +4,7 @@ KERI
 keri.app.agenting module
 
 """
+import itertools
 import json
 
 import falcon
@@ -27,6 +28,8 @@ from ..vdr import verifying, credentialing
 
 logger = help.ogler.getLogger()
 
+CURSOR_HEADER = "KERI-Cursor"  # cursor of next page of paginated listings
+
 
 class LockEnd(doing.DoDoer):
     """
@@ -884,9 +887,36 @@ class CredentialEnd(doing.DoDoer):
                 type: string
              description:  type of credential to return, [issued|received]
              required: true
+           - in: query
+             name: schema
+             schema:
+                type: string
+             description:  only return credentials of this schema SAID
+             required: false
+           - in: query
+             name: status
+             schema:
+                type: string
+             description:  only return credentials with this status, [issued|revoked]
+             required: false
+           - in: query
+             name: cursor
+             schema:
+                type: string
+             description:  SAID of last credential of previous page to return credentials after
+             required: false
+           - in: query
+             name: limit
+             schema:
+                type: integer
+             description:  max number of credentials to return, all when not provided
+             required: false
         responses:
            200:
-              description: Credential list.
+              description: Credential list in SAID order. When a page is full the
+                 KERI-Cursor header holds the cursor for the next page. When the
+                 request accepts application/x-ndjson credentials are streamed one
+                 per line and the cursor is the SAID of the last line.
               content:
                   application/json:
                     schema:
@@ -894,9 +924,24 @@ class CredentialEnd(doing.DoDoer):
                         type: array
                         items:
                            type: object
+                  application/x-ndjson:
+                    schema:
+                        description: Credential
+                        type: object
+           400:
+              description: Invalid alias, status or limit
 
         """
         typ = req.params.get("type")
+        schema = req.params.get("schema")
+        status = req.params.get("status")
+        cursor = req.params.get("cursor", "")
+        try:
+            limit = req.get_param_as_int("limit", min_value=1)
+        except falcon.HTTPBadRequest:
+            rep.status = falcon.HTTP_400
+            rep.text = "Invalid limit {} for credentials".format(req.params.get("limit"))
+            return
 
         hab = self.hby.habByName(name=alias)
         if hab is None:
@@ -905,19 +950,53 @@ class CredentialEnd(doing.DoDoer):
                        "".format(alias)
             return
 
-        creds = []
-        if typ == "issued":
-            saids = self.rgy.reger.issus.get(keys=hab.pre)
-            creds = self.rgy.reger.cloneCreds(saids)
+        if status not in (None, "issued", "revoked"):
+            rep.status = falcon.HTTP_400
+            rep.text = "Invalid status {} for credentials".format(status)
+            return
 
+        if typ == "issued":
+            reger = self.rgy.reger
+            saids = reger.getCredSaidIter(reger.issus, keys=hab.pre, schema=schema,
+                                          status=status, after=cursor)
         elif typ == "received":
-            saids = self.verifier.reger.subjs.get(keys=hab.pre)
-            creds = self.verifier.reger.cloneCreds(saids)
+            reger = self.verifier.reger
+            saids = reger.getCredSaidIter(reger.subjs, keys=hab.pre, schema=schema,
+                                          status=status, after=cursor)
+        else:
+            reger = None
+            saids = iter(())
+
+        if limit is not None:
+            saids = itertools.islice(saids, limit)
 
         rep.status = falcon.HTTP_200
+        if req.client_accepts("application/x-ndjson") and not req.client_accepts_json:
+            rep.content_type = "application/x-ndjson"
+            rep.stream = self.credentialLines(reger, saids)
+            return
+
+        saids = list(saids)
+        if limit is not None and len(saids) == limit:
+            rep.set_header(CURSOR_HEADER, saids[-1].qb64)
+
+        creds = reger.cloneCreds(saids) if saids else []
         rep.content_type = "application/json"
         rep.data = json.dumps(creds).encode("utf-8")
 
+    @staticmethod
+    def credentialLines(reger, saids):
+        """ Generator of newline delimited JSON of credentials hydrated one at a time
+
+        Parameters:
+            reger (Reger): credential database
+            saids (Iterable): of Saider of credentials
+
+        """
+        for saider in saids:
+            cred = reger.cloneCreds([saider])[0]
+            yield json.dumps(cred).encode("utf-8") + b"\n"
+
     def on_get_export(self, _, rep, alias, said):
         """ Credentials GET endpoint
 
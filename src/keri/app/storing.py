@@ -5,6 +5,7 @@ keri.app.storing module
 """
 import itertools
 import random
+import weakref
 
 from hio.base import doing
 from hio.help import decking
@@ -28,6 +29,8 @@ class Mailboxer(dbing.LMDBer):
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
+    MaxStreams = 4096  # max concurrent subscribed mailbox streams
+    StreamBufferSize = 256  # max messages buffered per subscribed stream
 
     def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
         """
@@ -40,6 +43,10 @@ class Mailboxer(dbing.LMDBer):
         """
         self.tpcs = None
         self.msgs = None
+        # subscribed MailboxStreams keyed by topic, held weakly so streams of
+        # dropped connections that never unsubscribe are released
+        self.streams = dict()
+        self.subs = weakref.WeakSet()  # all subscribed MailboxStreams
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -116,8 +123,45 @@ class Mailboxer(dbing.LMDBer):
             msg = msg.encode("utf-8")
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        self.appendToTopic(topic=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        ion = self.appendToTopic(topic=topic, val=digb)
+        result = self.msgs.pin(keys=digb, val=msg)
+        if (streams := self.streams.get(topic)) is not None:  # notify subscribed streams
+            if not streams:  # all released without unsubscribe
+                del self.streams[topic]
+            for stream in list(streams):
+                stream.push(topic, ion, msg)
+        return result
+
+    def subscribe(self, topics):
+        """
+        Returns MailboxStream subscribed to messages stored to topics from now
+        on or None when .MaxStreams streams are already subscribed.
+
+        Parameters:
+            topics (Iterable): of full topics str or bytes, pre plus topic
+        """
+        if len(self.subs) >= self.MaxStreams:
+            return None
+
+        stream = MailboxStream(topics=topics, size=self.StreamBufferSize)
+        for topic in stream.topics:
+            self.streams.setdefault(topic, weakref.WeakSet()).add(stream)
+        self.subs.add(stream)
+        return stream
+
+    def unsubscribe(self, stream):
+        """
+        Removes MailboxStream stream from notification of stored messages
+
+        Parameters:
+            stream (MailboxStream): subscribed stream from .subscribe
+        """
+        for topic in stream.topics:
+            if (streams := self.streams.get(topic)) is not None:
+                streams.discard(stream)
+                if not streams:
+                    del self.streams[topic]
+        self.subs.discard(stream)
 
     def cloneTopicIter(self, topic, fn=0):
         """
@@ -134,6 +178,36 @@ class Mailboxer(dbing.LMDBer):
                 yield ion, topic, msg.encode("utf-8")
 
 
+class MailboxStream:
+    """
+    MailboxStream buffers messages pushed by Mailboxer.storeMsg for its
+    subscribed topics so a reader only touches the database on overflow.
+
+    Attributes:
+        topics (list): of full topics bytes subscribed to
+        msgs (Deck): buffered (topic, ion, msg) triples in store order
+        size (int): max number of buffered messages
+        stale (oset): topics whose messages overflowed the buffer so must be
+            read from the database
+
+    """
+
+    def __init__(self, topics, size=256):
+        self.topics = [topic.encode("utf-8") if hasattr(topic, "encode") else topic for topic in topics]
+        self.msgs = decking.Deck()
+        self.size = size
+        self.stale = oset()
+
+    def push(self, topic, ion, msg):
+        """ Buffer msg stored at ion of topic or mark topic stale when full """
+        if topic in self.stale:
+            return
+        if len(self.msgs) >= self.size:
+            self.stale.add(topic)
+            return
+        self.msgs.append((topic, ion, msg))
+
+
 class Respondant(doing.DoDoer):
     """
     Respondant processes buffer of response messages from inbound 'exn' messages and
@@ -5,11 +5,13 @@ keri.core.coring module
 """
 import re
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 from collections.abc import Iterable
 
 from dataclasses import dataclass, astuple
-from collections import namedtuple, deque
+from collections import namedtuple, deque, OrderedDict
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 from math import ceil
@@ -205,6 +207,7 @@ B64ChrByIdx[62] = '-'
 B64ChrByIdx[63] = '_'
 # Map char to Base64 index
 B64IdxByChr = {char: index for index, char in B64ChrByIdx.items()}
+B64IdxByOrd = {ord(char): index for index, char in B64ChrByIdx.items()}  # bytes
 B64_CHARS = tuple(B64ChrByIdx.values())  # tuple of characters in Base64
 
 B64REX = b'^[A-Za-z0-9\-\_]*\Z'
@@ -252,6 +255,48 @@ def b64ToInt(s):
     return i
 
 
+def b64bToInt(b):
+    """
+    Returns conversion of Base64 bytes like b to int. Iterates bytes directly
+    so bytes, bytearray and memoryview need no str conversion.
+    """
+    if not b:
+        raise ValueError("Empty string, conversion undefined.")
+    i = 0
+    for c in b:
+        i = (i << 6) | B64IdxByOrd[c]
+    return i
+
+
+def codexCodes(klas):
+    """
+    Returns frozenset of the code values of codex dataclass klas. Computed once
+    per codex so inclusion tests of codes do not convert codex with astuple.
+
+    Parameters:
+        klas (type): frozen codex dataclass whose instances use default values
+    """
+    codes = _CodexCodes.get(klas)
+    if codes is None:
+        codes = _CodexCodes[klas] = frozenset(astuple(klas()))
+    return codes
+
+
+_CodexCodes = dict()  # frozenset of codes keyed by codex class
+
+
+def hardsByOrd(hards, lead=''):
+    """
+    Returns tuple of hard sizes from code table hards indexed by int of code
+    selector byte that follows lead chars, 0 when byte does not select a code.
+
+    Parameters:
+        hards (dict): maps code selector chars to hard size
+        lead (str): fixed chars before selector byte such as '-' for counters
+    """
+    return tuple(hards.get(lead + chr(b), 0) for b in range(256))
+
+
 def b64ToB2(s):
     """
     Returns conversion (decode) of Base64 chars to Base2 bytes.
@@ -509,6 +554,9 @@ class MatterCodex:
     def __iter__(self):
         return iter(astuple(self))  # enables inclusion test with "in"
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 MtrDex = MatterCodex()  # Make instance
 
@@ -530,6 +578,9 @@ class SmallVarRawSizeCodex:
     def __iter__(self):
         return iter(astuple(self))
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 SmallVrzDex = SmallVarRawSizeCodex()  # Make instance
 
@@ -551,6 +602,9 @@ class LargeVarRawSizeCodex:
     def __iter__(self):
         return iter(astuple(self))
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 LargeVrzDex = LargeVarRawSizeCodex()  # Make instance
 
@@ -569,6 +623,9 @@ class NonTransCodex:
     def __iter__(self):
         return iter(astuple(self))
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 NonTransDex = NonTransCodex()  # Make instance
 
@@ -595,6 +652,9 @@ class DigCodex:
     def __iter__(self):
         return iter(astuple(self))
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 DigDex = DigCodex()  # Make instance
 
@@ -616,6 +676,9 @@ class NumCodex:
     def __iter__(self):
         return iter(astuple(self))
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 NumDex = NumCodex()  # Make instance
 
@@ -637,6 +700,9 @@ class BextCodex:
     def __iter__(self):
         return iter(astuple(self))
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 BexDex = BextCodex()  # Make instance
 
@@ -755,6 +821,10 @@ class Matter:
     # Bards table maps first code char. converted to binary sextext of hard size,
     # hs. Used for ._bexfil.
     Bards = ({b64ToB2(c): hs for c, hs in Hards.items()})
+    # Hardb table is Hards indexed by int of first code byte, 0 when unsupported.
+    # Sizeb table maps bytes of hard code to (code, Sizage). Used for ._exfil.
+    Hardb = hardsByOrd(Hards)
+    Sizeb = ({code.encode("utf-8"): (code, sizage) for code, sizage in Sizes.items()})
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, rize=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -860,6 +930,26 @@ class Matter:
             raise EmptyMaterialError(f"Improper initialization need either "
                                      f"(raw and code) or qb64b or qb64 or qb2.")
 
+    @classmethod
+    def fromQb64bFast(cls, qb64b, strip=False):
+        """
+        Returns instance of cls extracted from front of qualified Base64 stream
+        qb64b using the byte indexed .Hardb and .Sizeb tables of ._exfil with
+        no str conversion. A parsing.Cursor is compacted and its backing
+        bytearray extracted from directly so indexing and slicing do not go
+        through its python methods. Stripping the front of a bytearray only
+        advances its start. Used by parser. Subclass init still runs so its
+        checks and derived attributes apply.
+
+        Parameters:
+            qb64b (bytes | bytearray | memoryview | Cursor): stream of primitives
+            strip (bool): True means strip extracted primitive from stream
+        """
+        if hasattr(qb64b, "compact"):  # Cursor so use its backing bytearray
+            qb64b.compact()
+            qb64b = qb64b.buf
+        return cls(qb64b=qb64b, strip=strip)
+
     @classmethod
     def _rawSize(cls, code):
         """
@@ -1013,44 +1103,42 @@ class Matter:
     def _exfil(self, qb64b):
         """
         Extracts self.code and self.raw from qualified base64 bytes qb64b
+        Works on bytes directly using byte indexed .Hardb and .Sizeb tables so
+        only the extracted primitive is copied out of stream qb64b.
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
+        if hasattr(qb64b, "encode"):  # str so convert once
+            qb64b = qb64b.encode("utf-8")
+
+        hs = self.Hardb[qb64b[0]]  # get hard code size from first char selector
+        if not hs:
+            first = chr(qb64b[0])
+            if first == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
-            elif first[0] == '_':
+            elif first == '_':
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                             "while extracing Matter.")
             else:
                 raise UnexpectedCodeError("Unsupported code start char={}.".format(first))
 
-        hs = self.Hards[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
-        code = qb64b[:hs]  # extract hard code
-        if hasattr(code, "decode"):
-            code = code.decode("utf-8")
-        if code not in self.Sizes:
-            raise UnexpectedCodeError("Unsupported code ={}.".format(code))
+        hard = bytes(qb64b[:hs])  # extract hard code
+        if hard not in self.Sizeb:
+            raise UnexpectedCodeError("Unsupported code ={}.".format(hard.decode("utf-8")))
 
-        hs, ss, fs, ls = self.Sizes[code]  # assumes hs in both tables match
+        code, (hs, ss, fs, ls) = self.Sizeb[hard]  # assumes hs in both tables match
         cs = hs + ss  # both hs and ss
         size = None
         if not fs:  # compute fs from size chars in ss part of code
             if cs % 4:
                 raise ValidationError("Whole code size not multiple of 4 for "
                                       "variable length material. cs={}.".format(cs))
-            size = qb64b[hs:hs + ss]  # extract size chars
-            if hasattr(size, "decode"):
-                size = size.decode("utf-8")
-            size = b64ToInt(size)  # compute int size
+            size = b64bToInt(qb64b[hs:hs + ss])  # compute int size from size chars
             fs = (size * 4) + cs
 
         # assumes that unit tests on Matter and MatterCodex ensure that
@@ -1060,16 +1148,13 @@ class Matter:
 
         if len(qb64b) < fs:  # need more bytes
             raise ShortageError("Need {} more chars.".format(fs - len(qb64b)))
-        qb64b = qb64b[:fs]  # fully qualified primitive code plus material
-        if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
-            qb64b = qb64b.encode("utf-8")
 
         # strip off prepended code and append pad characters
         ps = cs % 4  # pad size ps = cs mod 4
-        base = qb64b[cs:] + ps * BASE64_PAD
+        base = bytes(qb64b[cs:fs]) + ps * BASE64_PAD
         raw = decodeB64(base)[ls:]  # decode and strip off leader bytes
-        if len(raw) != ((len(qb64b) - cs) * 3 // 4) - ls:  # exact lengths
-            raise ConversionError("Improperly qualified material = {}".format(qb64b))
+        if len(raw) != ((fs - cs) * 3 // 4) - ls:  # exact lengths
+            raise ConversionError("Improperly qualified material = {}".format(bytes(qb64b[:fs])))
 
         self._code = code
         self._size = size
@@ -1905,8 +1990,16 @@ class Verfer(Matter):
 
     Methods:
         verify: verifies signature
+        verifyMany: verifies batch of (verfer, sig, ser) triples
+        preverify: verifies batch ahead of time and memoizes results
 
     """
+    BatchThreshold = 16  # min unique triples in batch before using thread pool
+    BatchWorkers = 4  # default max threads in batch verification pool
+    _Pool = None  # shared ThreadPoolExecutor created on first large batch
+    MemoSize = 4096  # max memoized results of .preverify
+    _Memo = OrderedDict()  # preverified results keyed by (code, key, sig, ser)
+    _MemoLock = threading.Lock()  # preverify may run on pipeline worker threads
 
     def __init__(self, **kwa):
         """
@@ -1932,6 +2025,87 @@ class Verfer(Matter):
         """
         return (self._verify(sig=sig, ser=ser, key=self.raw))
 
+    @classmethod
+    def verifyMany(cls, triples):
+        """
+        Returns list of bools, one per triple in triples, True when signature
+        verifies False otherwise. Identical (key, sig, ser) triples are only
+        verified once. When the number of unique triples is at least
+        .BatchThreshold then the verifications are fanned out across a
+        shared thread pool. Each pysodium verification is a ctypes foreign
+        call which releases the GIL so large batches verify in parallel.
+
+        Parameters:
+            triples (Iterable): of (verfer, sig, ser) triples where verfer is
+                Verfer instance, sig is bytes signature, and ser is bytes
+                serialization
+
+        """
+        keys = []  # dedupe key per triple
+        jobs = {}  # unique triples keyed by (code, key, sig, ser)
+        results = {}
+        for verfer, sig, ser in triples:
+            ser = ser if isinstance(ser, bytes) else bytes(ser)
+            key = (verfer.code, verfer.raw, bytes(sig), ser)
+            keys.append(key)
+            if key not in jobs and key not in results:
+                if cls._Memo:  # consume preverified result if any
+                    with cls._MemoLock:
+                        result = cls._Memo.pop(key, None)
+                    if result is not None:
+                        results[key] = result
+                        continue
+                jobs[key] = verfer
+
+        if len(jobs) < cls.BatchThreshold:
+            results.update({key: verfer.verify(sig=key[2], ser=key[3])
+                            for key, verfer in jobs.items()})
+        else:
+            pool = cls._pool()
+            futures = {key: pool.submit(verfer.verify, sig=key[2], ser=key[3])
+                       for key, verfer in jobs.items()}
+            results.update({key: future.result() for key, future in futures.items()})
+
+        return [results[key] for key in keys]
+
+    @classmethod
+    def preverify(cls, triples):
+        """
+        Verifies (verfer, sig, ser) triples ahead of time, such as on a parser
+        pipeline worker thread, and memoizes the results so that a later
+        .verifyMany of the same triples takes its results from the memo
+        instead of verifying them again. Each memoized result is consumed by
+        its first use. Memo holds at most .MemoSize results, oldest evicted
+        first.
+
+        Returns list of bools one per triple same as .verifyMany
+
+        Parameters:
+            triples (Iterable): of (verfer, sig, ser) triples see .verifyMany
+        """
+        triples = list(triples)
+        results = cls.verifyMany(triples)
+        with cls._MemoLock:
+            for (verfer, sig, ser), result in zip(triples, results):
+                ser = ser if isinstance(ser, bytes) else bytes(ser)
+                key = (verfer.code, verfer.raw, bytes(sig), ser)
+                cls._Memo[key] = result
+                cls._Memo.move_to_end(key)
+            while len(cls._Memo) > cls.MemoSize:
+                cls._Memo.popitem(last=False)
+        return results
+
+    @classmethod
+    def _pool(cls):
+        """
+        Returns shared ThreadPoolExecutor for batch verification with
+        .BatchWorkers max threads, creating it on first use
+        """
+        if cls._Pool is None:
+            cls._Pool = ThreadPoolExecutor(max_workers=cls.BatchWorkers,
+                                           thread_name_prefix="verfer")
+        return cls._Pool
+
     @staticmethod
     def _ed25519(sig, ser, key):
         """
@@ -3414,6 +3588,9 @@ class IndexerCodex:
     def __iter__(self):
         return iter(astuple(self))  # enables inclusion test with "in"
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 IdrDex = IndexerCodex()
 
@@ -3432,6 +3609,9 @@ class IndexedSigCodex:
     def __iter__(self):
         return iter(astuple(self))
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 IdxSigDex = IndexedSigCodex()  # Make instance
 
@@ -3483,6 +3663,10 @@ class Indexer:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first code char. Used for ._bexfil.
     Bards = ({b64ToB2(c): hs for c, hs in Hards.items()})
+    # Hardb table is Hards indexed by int of first code byte, 0 when unsupported.
+    # Sizeb table maps bytes of hard code to (code, Sizage). Used for ._exfil.
+    Hardb = hardsByOrd(Hards)
+    Sizeb = ({code.encode("utf-8"): (code, sizage) for code, sizage in Sizes.items()})
 
     def __init__(self, raw=None, code=IdrDex.Ed25519_Sig, index=0,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -3542,7 +3726,8 @@ class Indexer:
         elif qb64b is not None:
             self._exfil(qb64b)
             if strip:  # assumes bytearray
-                del qb64b[:len(self.qb64b)]  # may be variable length fs
+                hs, ss, fs, ls = self.Sizes[self.code]
+                del qb64b[:fs if fs else self.index * 4 + hs + ss]  # may be variable length fs
 
         elif qb64 is not None:
             self._exfil(qb64)
@@ -3557,6 +3742,26 @@ class Indexer:
                                      "(raw and code and index) or qb64b or "
                                      "qb64 or qb2.")
 
+    @classmethod
+    def fromQb64bFast(cls, qb64b, strip=False):
+        """
+        Returns instance of cls extracted from front of qualified Base64 stream
+        qb64b using the byte indexed .Hardb and .Sizeb tables of ._exfil with
+        no str conversion. A parsing.Cursor is compacted and its backing
+        bytearray extracted from directly so indexing and slicing do not go
+        through its python methods. Stripping the front of a bytearray only
+        advances its start. Used by parser. Subclass init still runs so its
+        checks and derived attributes apply.
+
+        Parameters:
+            qb64b (bytes | bytearray | memoryview | Cursor): stream of primitives
+            strip (bool): True means strip extracted primitive from stream
+        """
+        if hasattr(qb64b, "compact"):  # Cursor so use its backing bytearray
+            qb64b.compact()
+            qb64b = qb64b.buf
+        return cls(qb64b=qb64b, strip=strip)
+
     @classmethod
     def _rawSize(cls, code):
         """
@@ -3644,34 +3849,35 @@ class Indexer:
     def _exfil(self, qb64b):
         """
         Extracts self.code, self.index, and self.raw from qualified base64 bytes qb64b
+        Works on bytes directly using byte indexed .Hardb and .Sizeb tables so
+        only the extracted primitive is copied out of stream qb64b.
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
+        if hasattr(qb64b, "encode"):  # str so convert once
+            qb64b = qb64b.encode("utf-8")
+
+        hs = self.Hardb[qb64b[0]]  # get hard code size from first char selector
+        if not hs:
+            first = chr(qb64b[0])
+            if first == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Indexer.")
-            elif first[0] == '_':
+            elif first == '_':
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                             "while extracing Indexer.")
             else:
                 raise UnexpectedCodeError("Unsupported code start char={}.".format(first))
 
-        hs = self.Hards[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
-        hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
+        hard = bytes(qb64b[:hs])  # get hard code
+        if hard not in self.Sizeb:
+            raise UnexpectedCodeError("Unsupported code ={}.".format(hard.decode("utf-8")))
 
-        hs, ss, fs, ls = self.Sizes[hard]  # assumes hs in both tables consistent
+        hard, (hs, ss, fs, ls) = self.Sizeb[hard]  # assumes hs in both tables consistent
         cs = hs + ss  # both hard + soft code size
         # assumes that unit tests on Indexer and IndexerCodex ensure that
         # .Codes and .Sizes are well formed.
@@ -3680,10 +3886,7 @@ class Indexer:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs - len(qb64b)))
 
-        index = qb64b[hs:hs + ss]  # extract index chars
-        if hasattr(index, "decode"):
-            index = index.decode("utf-8")
-        index = b64ToInt(index)  # compute int index
+        index = b64bToInt(qb64b[hs:hs + ss])  # compute int index from index chars
 
         if not fs:  # compute fs from index
             if cs % 4:
@@ -3694,16 +3897,12 @@ class Indexer:
         if len(qb64b) < fs:  # need more bytes
             raise ShortageError("Need {} more chars.".format(fs - len(qb64b)))
 
-        qb64b = qb64b[:fs]  # fully qualified primitive code plus material
-        if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
-            qb64b = qb64b.encode("utf-8")
-
         # strip off prepended code and append pad characters
         ps = cs % 4  # pad size ps = cs mod 4
-        base = qb64b[cs:] + ps * BASE64_PAD
+        base = bytes(qb64b[cs:fs]) + ps * BASE64_PAD
         raw = decodeB64(base)
-        if len(raw) != (len(qb64b) - cs) * 3 // 4:  # exact lengths
-            raise ConversionError("Improperly qualified material = {}".format(qb64b))
+        if len(raw) != (fs - cs) * 3 // 4:  # exact lengths
+            raise ConversionError("Improperly qualified material = {}".format(bytes(qb64b[:fs])))
 
         self._code = hard
         self._index = index
@@ -3894,6 +4093,9 @@ class CounterCodex:
     def __iter__(self):
         return iter(astuple(self))  # enables inclusion test with "in"
 
+    def __contains__(self, code):
+        return code in codexCodes(type(self))  # precomputed not astuple per test
+
 
 CtrDex = CounterCodex()
 
@@ -3974,6 +4176,11 @@ class Counter:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first two code char. Used for ._bexfil.
     Bards = ({b64ToB2(c): hs for c, hs in Hards.items()})
+    # Hardb table is Hards indexed by int of second code byte after '-', 0 when
+    # unsupported. Sizeb table maps bytes of hard code to (code, Sizage).
+    # Used for ._exfil.
+    Hardb = hardsByOrd(Hards, lead='-')
+    Sizeb = ({code.encode("utf-8"): (code, sizage) for code, sizage in Sizes.items()})
 
     def __init__(self, code=None, count=1, qb64b=None, qb64=None,
                  qb2=None, strip=False):
@@ -4030,6 +4237,26 @@ class Counter:
                                      "(code and count) or qb64b or "
                                      "qb64 or qb2.")
 
+    @classmethod
+    def fromQb64bFast(cls, qb64b, strip=False):
+        """
+        Returns instance of cls extracted from front of qualified Base64 stream
+        qb64b using the byte indexed .Hardb and .Sizeb tables of ._exfil with
+        no str conversion. A parsing.Cursor is compacted and its backing
+        bytearray extracted from directly so indexing and slicing do not go
+        through its python methods. Stripping the front of a bytearray only
+        advances its start. Used by parser. Subclass init still runs so its
+        checks and derived attributes apply.
+
+        Parameters:
+            qb64b (bytes | bytearray | memoryview | Cursor): stream of primitives
+            strip (bool): True means strip extracted primitive from stream
+        """
+        if hasattr(qb64b, "compact"):  # Cursor so use its backing bytearray
+            qb64b.compact()
+            qb64b = qb64b.buf
+        return cls(qb64b=qb64b, strip=strip)
+
     @property
     def code(self):
         """
@@ -4101,31 +4328,32 @@ class Counter:
     def _exfil(self, qb64b):
         """
         Extracts self.code and self.count from qualified base64 bytes qb64b
+        Works on bytes directly using byte indexed .Hardb and .Sizeb tables.
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
-        first = qb64b[:2]  # extract first two char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
+        if hasattr(qb64b, "encode"):  # str so convert once
+            qb64b = qb64b.encode("utf-8")
+
+        # get hard code size from first two char selector
+        hs = self.Hardb[qb64b[1]] if qb64b[0] == 45 and len(qb64b) > 1 else 0  # 45 is '-'
+        if not hs:
+            first = bytes(qb64b[:2]).decode("utf-8")
             if first[0] == '_':
                 raise UnexpectedOpCodeError("Unexpected op code start"
                                             "while extracing Counter.")
             else:
                 raise UnexpectedCodeError("Unsupported code start ={}.".format(first))
 
-        hs = self.Hards[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
-        hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
+        hard = bytes(qb64b[:hs])  # get hard code
+        if hard not in self.Sizeb:
+            raise UnexpectedCodeError("Unsupported code ={}.".format(hard.decode("utf-8")))
 
-        hs, ss, fs, ls = self.Sizes[hard]  # assumes hs consistent in both tables
+        hard, (hs, ss, fs, ls) = self.Sizeb[hard]  # assumes hs consistent in both tables
         cs = hs + ss  # both hard + soft code size
 
         # assumes that unit tests on Counter and CounterCodex ensure that
@@ -4135,10 +4363,7 @@ class Counter:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs - len(qb64b)))
 
-        count = qb64b[hs:hs + ss]  # extract count chars
-        if hasattr(count, "decode"):
-            count = count.decode("utf-8")
-        count = b64ToInt(count)  # compute int count
+        count = b64bToInt(qb64b[hs:hs + ss])  # compute int count from count chars
 
         self._code = hard
         self._count = count
@@ -4245,11 +4470,16 @@ class Sadder:
           ._size is int of number of bytes in serialed event only
           ._code is default code for .diger
           ._diger is Diger instance of digest of .raw
+          ._derived is dict of primitives derived from .ked, reset whenever
+            .raw, .ked or .kind is assigned
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
+        Mutating .ked in place does not reset ._derived, assign .ked instead
 
     """
+    __slots__ = ('_code', '_raw', '_ked', '_ident', '_kind', '_version', '_size',
+                 '_saider', '_derived')
 
     def __init__(self, raw=b'', ked=None, kind=None, sad=None, code=MtrDex.Blake3_256):
         """
@@ -4347,6 +4577,7 @@ class Sadder:
         self._size = sad.size
         self._version = sad.version
         self._saider = sad.saider
+        self._derived = dict()
 
     @property
     def raw(self):
@@ -4364,6 +4595,7 @@ class Sadder:
         self._version = version
         self._size = size
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._derived = dict()
 
     @property
     def ked(self):
@@ -4382,6 +4614,7 @@ class Sadder:
         self._size = size
         self._version = version
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._derived = dict()
 
     @property
     def kind(self):
@@ -4400,6 +4633,7 @@ class Sadder:
         self._size = size
         self._version = version
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._derived = dict()
 
 
     @property
@@ -4495,11 +4729,14 @@ class Serder(Sadder):
           ._size is int of number of bytes in serialed event only
           ._code is default code for .diger
           ._diger is Diger instance of digest of .raw
+          ._derived is dict of memoized .verfers, .werfers, .nexter, .tholder,
+            .ntholder and .sn, reset whenever .raw, .ked or .kind is assigned
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
 
     """
+    __slots__ = ()
 
     def __init__(self, raw=b'', ked=None, kind=None, sad=None, code=MtrDex.Blake3_256):
         """
@@ -4531,12 +4768,15 @@ class Serder(Sadder):
         One for each key.
         verfers property getter
         """
-        if "k" in self.ked:  # establishment event
-            keys = self.ked["k"]
-        else:  # non-establishment event
-            keys = []
+        if (verfers := self._derived.get("verfers")) is None:
+            if "k" in self.ked:  # establishment event
+                keys = self.ked["k"]
+            else:  # non-establishment event
+                keys = []
+
+            verfers = self._derived["verfers"] = [Verfer(qb64=key) for key in keys]
 
-        return [Verfer(qb64=key) for key in keys]
+        return list(verfers)  # copy so callers may not alter memo
 
     @property
     def nexter(self):
@@ -4545,12 +4785,15 @@ class Serder(Sadder):
         One for each key.
         nkeys property getter
         """
-        if "n" in self.ked:  # establishment event
-            keys = self.ked["n"]
-        else:  # non-establishment event
-            keys = []
+        if (nexter := self._derived.get("nexter")) is None:
+            if "n" in self.ked:  # establishment event
+                keys = self.ked["n"]
+            else:  # non-establishment event
+                keys = []
+
+            nexter = self._derived["nexter"] = Nexter(digs=keys)
 
-        return Nexter(digs=keys)
+        return nexter
 
     @property
     def werfers(self):
@@ -4559,12 +4802,15 @@ class Serder(Sadder):
         One for each backer (witness).
         werfers property getter
         """
-        if "b" in self.ked:  # inception establishment event
-            wits = self.ked["b"]
-        else:  # non-establishment event
-            wits = []
+        if (werfers := self._derived.get("werfers")) is None:
+            if "b" in self.ked:  # inception establishment event
+                wits = self.ked["b"]
+            else:  # non-establishment event
+                wits = []
 
-        return [Verfer(qb64=wit) for wit in wits]
+            werfers = self._derived["werfers"] = [Verfer(qb64=wit) for wit in wits]
+
+        return list(werfers)  # copy so callers may not alter memo
 
     @property
     def tholder(self):
@@ -4572,7 +4818,9 @@ class Serder(Sadder):
         Returns Tholder instance as converted from .ked['kt'] or None if missing.
 
         """
-        return Tholder(sith=self.ked["kt"]) if "kt" in self.ked else None
+        if "tholder" not in self._derived:
+            self._derived["tholder"] = Tholder(sith=self.ked["kt"]) if "kt" in self.ked else None
+        return self._derived["tholder"]
 
     @property
     def ntholder(self):
@@ -4580,7 +4828,9 @@ class Serder(Sadder):
         Returns Tholder instance as converted from .ked['nt'] or None if missing.
 
         """
-        return Tholder(sith=self.ked["nt"]) if "nt" in self.ked else None
+        if "ntholder" not in self._derived:
+            self._derived["ntholder"] = Tholder(sith=self.ked["nt"]) if "nt" in self.ked else None
+        return self._derived["ntholder"]
 
     @property
     def sn(self):
@@ -4589,6 +4839,9 @@ class Serder(Sadder):
         Returns:
             sn (int): converts hex str .ked["s"] to non neg int
         """
+        if (sn := self._derived.get("sn")) is not None:
+            return sn
+
         sn = self.ked["s"]
 
         if len(sn) > 32:
@@ -4598,6 +4851,7 @@ class Serder(Sadder):
         if sn < 0:
             raise ValueError("Negative sn={}.".format(sn))
 
+        self._derived["sn"] = sn
         return (sn)
 
     @property
@@ -460,31 +460,68 @@ def verifySigs(raw, sigers, verfers):
         verfers is list of Verfer instance (public keys)
 
     """
-    if sigers is None:
-        sigers = []
-    # Ensure no duplicate sigers by using set math on sigers' sigs otherwise
-    # indices count for threshold will be erroneous. Does not modify in place
-    # passed in sigers list, but instead depends on caller to use indices to
-    # modify its copy to filter out unverifiable or duplicate sigers
-    usigs = oset([siger.qb64 for siger in sigers])
-    usigers = [Siger(qb64=sig) for sig in usigs]
-
-    # verify indexes of attached signatures against verifiers and assign
-    # verfer to each siger
-    for siger in usigers:
-        if siger.index >= len(verfers):
-            logger.info("Skipped sig: Index=%s to large.\n", siger.index)
-        siger.verfer = verfers[siger.index]  # assign verfer
+    return verifySigsBatch([(raw, sigers, verfers)])[0]
+
+
+def verifySigsBatch(batch):
+    """
+    Returns list of (vsigers, vindices) tuples, one for each (raw, sigers, verfers)
+    triple in batch, where:
+        vsigers is list  of unique verified sigers with assigned verfer
+        vindices is list of indices from those verified sigers
+
+    Same as verifySigs but verifies the signatures of every triple in batch,
+    such as the controller and witness signatures of an event or the signatures
+    of a whole parsed batch of events, with one call to Verfer.verifyMany.
+
+    Parameters:
+        batch (Iterable): of (raw, sigers, verfers) triples where:
+            raw (bytes) signed data
+            sigers is list of indexed Siger instances (signatures)
+            verfers is list of Verfer instance (public keys)
+
+    """
+    groups = []  # unique sigers with assigned verfers per triple in batch
+    triples = []  # (verfer, sig, ser) triples for all groups
+    for raw, sigers, verfers in batch:
+        if sigers is None:
+            sigers = []
+        # Ensure no duplicate sigers by using set math on sigers' raw sigs
+        # otherwise indices count for threshold will be erroneous. Index is
+        # part of dedupe key so same key repeated at different indices still
+        # counts. Does not modify in place passed in sigers list, but instead
+        # depends on caller to use indices to modify its copy to filter out
+        # unverifiable or duplicate sigers
+        usigers = {}
+        for siger in sigers:
+            key = (siger.index, bytes(siger.raw))
+            if key in usigers:
+                continue
+            if siger.index >= len(verfers):
+                logger.info("Skipped sig: Index=%s to large.\n", siger.index)
+                continue
+            # copy from raw so no reparse of qb64 and caller's siger unchanged
+            usigers[key] = Siger(raw=siger.raw, code=siger.code, index=siger.index,
+                                 verfer=verfers[siger.index])  # assign verfer
+
+        usigers = list(usigers.values())
+        groups.append(usigers)
+        triples.extend((siger.verfer, siger.raw, raw) for siger in usigers)
+
+    verifieds = iter(Verfer.verifyMany(triples))
 
     # create lists of unique verified signatures and indices
-    vindices = []
-    vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, raw):
-            vindices.append(siger.index)
-            vsigers.append(siger)
+    results = []
+    for usigers in groups:
+        vindices = []
+        vsigers = []
+        for siger in usigers:
+            if next(verifieds):
+                vindices.append(siger.index)
+                vsigers.append(siger)
+        results.append((vsigers, vindices))
 
-    return (vsigers, vindices)
+    return results
 
 
 def validateSigs(serder, sigers, verfers, tholder):
@@ -520,7 +557,7 @@ def validateSigs(serder, sigers, verfers, tholder):
                                         [verfer.qb64 for verfer in verfers]))
 
     # get unique verified sigers and indices lists from sigers list
-    sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+    (sigers, indices), = verifySigsBatch([(serder.raw, sigers, verfers)])
     # sigers  now have .verfer assigned
 
     # check if satisfies threshold for fully signed
@@ -1680,10 +1717,25 @@ class Kever:
         .kevers (dict): reference to self.db.kevers
         .transferable (bool): True if nexter is not none and pre is transferable
 
+    Kever reloaded from key state keeps the raw state message in ._ksn and the
+    raw current event in ._evt. The primitive attributes .prefixer, .dater,
+    .tholder, .ntholder, .verfers, .nexter and .serder are only built on first
+    access from those. Assigning any of them materializes the rest and drops
+    ._ksn since the state is no longer the one loaded.
+
     """
     EstOnly = False
     DoNotDelegate = False
 
+    __slots__ = ('db', 'cues', 'prefixes', 'local', 'version', 'sn', 'fn',
+                 'ilk', 'toad', 'wits', 'cuts', 'adds', 'estOnly',
+                 'doNotDelegate', 'lastEst', 'delegator', 'delegated',
+                 '_ksn', '_kind', '_evt', '_prefixer', '_dater', '_tholder',
+                 '_ntholder', '_verfers', '_nexter', '_serder')
+
+    Lazies = ('_prefixer', '_dater', '_tholder', '_ntholder', '_verfers',
+              '_nexter', '_serder')  # slots built on first access after reload
+
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, seqner=None, saider=None, firner=None, dater=None,
                  cues=None, prefixes=None, local=False,
@@ -1731,6 +1783,12 @@ class Kever:
             raise ValueError("Missing required arguments. Need state or serder"
                              " and sigers")
 
+        for lazy in self.Lazies:
+            setattr(self, lazy, None)
+        self._ksn = None
+        self._kind = None
+        self._evt = None
+
         if db is None:
             db = basing.Baser(reopen=True)  # default name = "main"
         self.db = db
@@ -1811,45 +1869,141 @@ class Kever:
     def reload(self, state):
         """
         Reload Kever attributes (aka its state) from state serder
+        Only plain attributes are set here, primitives are built when accessed
 
         Parameters:
             state (Serder): instance of key stat notice 'ksn' message body
 
         """
+        ked = state.ked
         for k in KSN_LABELS:
-            if k not in state.ked:
+            if k not in ked:
                 raise ValidationError("Missing element = {} from {} event."
                                       " evt = {}.".format(k, Ilks.ksn,
                                                           state.pretty()))
 
+        if (raw := self.db.getEvt(key=dgKey(pre=ked["i"], dig=ked['d']))) is None:
+            raise MissingEntryError("Corresponding event for state={} not found."
+                                    "".format(state.pretty()))
+
+        for lazy in self.Lazies:
+            setattr(self, lazy, None)
+        self._ksn = bytes(state.raw)
+        self._kind = state.kind
+        self._evt = bytes(raw)
+
         self.version = state.version
-        self.prefixer = Prefixer(qb64=state.pre)
         self.sn = state.sn
-        self.fn = int(state.ked["f"], 16)
-        self.dater = Dater(dts=state.ked["dt"])
-        self.ilk = state.ked["et"]
-        self.tholder = Tholder(sith=state.ked["kt"])
-        self.ntholder = Tholder(sith=state.ked["nt"])
-        self.verfers = [Verfer(qb64=key) for key in state.ked["k"]]
-        self.nexter = coring.Nexter(digs=state.ked["n"])
-        self.toad = int(state.ked["bt"], 16)
-        self.wits = state.ked["b"]
-        self.cuts = state.ked["ee"]["br"]
-        self.adds = state.ked["ee"]["ba"]
-        self.estOnly = False
-        self.doNotDelegate = True if "DND" in state.ked["c"] else False
-        self.estOnly = True if "EO" in state.ked["c"] else False
-        self.lastEst = LastEstLoc(s=int(state.ked['ee']['s'], 16),
-                                  d=state.ked['ee']['d'])
-        self.delegator = state.ked['di'] if state.ked['di'] else None
+        self.fn = int(ked["f"], 16)
+        self.ilk = ked["et"]
+        self.toad = int(ked["bt"], 16)
+        self.wits = ked["b"]
+        self.cuts = ked["ee"]["br"]
+        self.adds = ked["ee"]["ba"]
+        self.doNotDelegate = True if "DND" in ked["c"] else False
+        self.estOnly = True if "EO" in ked["c"] else False
+        self.lastEst = LastEstLoc(s=int(ked['ee']['s'], 16),
+                                  d=ked['ee']['d'])
+        self.delegator = ked['di'] if ked['di'] else None
         self.delegated = True if self.delegator else False
 
-        if (raw := self.db.getEvt(key=dgKey(pre=self.prefixer.qb64,
-                                            dig=state.ked['d']))) is None:
-            raise MissingEntryError("Corresponding event for state={} not found."
-                                    "".format(state.pretty()))
-        self.serder = Serder(raw=bytes(raw))
-        # May want to do additional checks here
+    def _lazy(self, name):
+        """
+        Returns value of lazy slot name, building it from ._ksn or ._evt
+        when not yet built
+        """
+        if (val := getattr(self, name)) is not None or self._ksn is None:
+            return val
+
+        if name == '_serder':
+            val = Serder(raw=self._evt)
+            self._evt = None
+        else:
+            ked = coring.loads(self._ksn, kind=self._kind)
+            if name == '_prefixer':
+                val = Prefixer(qb64=ked["i"])
+            elif name == '_dater':
+                val = Dater(dts=ked["dt"])
+            elif name == '_tholder':
+                val = Tholder(sith=ked["kt"])
+            elif name == '_ntholder':
+                val = Tholder(sith=ked["nt"])
+            elif name == '_verfers':
+                val = [Verfer(qb64=key) for key in ked["k"]]
+            else:  # '_nexter'
+                val = coring.Nexter(digs=ked["n"])
+        setattr(self, name, val)
+        return val
+
+    def _assign(self, name, val):
+        """
+        Assigns val to lazy slot name after building all other lazy slots
+        since ._ksn no longer represents current state once assigned
+        """
+        if self._ksn is not None:
+            for lazy in self.Lazies:
+                if lazy != name:
+                    self._lazy(lazy)
+            self._ksn = None
+            self._kind = None
+        setattr(self, name, val)
+
+    @property
+    def prefixer(self):
+        return self._lazy('_prefixer')
+
+    @prefixer.setter
+    def prefixer(self, prefixer):
+        self._assign('_prefixer', prefixer)
+
+    @property
+    def dater(self):
+        return self._lazy('_dater')
+
+    @dater.setter
+    def dater(self, dater):
+        self._assign('_dater', dater)
+
+    @property
+    def tholder(self):
+        return self._lazy('_tholder')
+
+    @tholder.setter
+    def tholder(self, tholder):
+        self._assign('_tholder', tholder)
+
+    @property
+    def ntholder(self):
+        return self._lazy('_ntholder')
+
+    @ntholder.setter
+    def ntholder(self, ntholder):
+        self._assign('_ntholder', ntholder)
+
+    @property
+    def verfers(self):
+        return self._lazy('_verfers')
+
+    @verfers.setter
+    def verfers(self, verfers):
+        self._assign('_verfers', verfers)
+
+    @property
+    def nexter(self):
+        return self._lazy('_nexter')
+
+    @nexter.setter
+    def nexter(self, nexter):
+        self._assign('_nexter', nexter)
+
+    @property
+    def serder(self):
+        return self._lazy('_serder')
+
+    @serder.setter
+    def serder(self, serder):
+        self._assign('_serder', serder)
+        self._evt = None
 
     def incept(self, serder, estOnly=None):
         """
@@ -2277,14 +2431,13 @@ class Kever:
                                             [verfer.qb64 for verfer in verfers],
                                             serder.ked))
 
-        # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
-        # sigers  now have .verfer assigned
-
         werfers = [Verfer(qb64=wit) for wit in wits]
 
-        # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers)
+        # get unique verified sigers and indices lists from sigers list and
+        # unique verified wigers and windices lists from wigers list in one batch
+        (sigers, indices), (wigers, windices) = verifySigsBatch(
+            [(serder.raw, sigers, verfers), (serder.raw, wigers, werfers)])
+        # sigers  now have .verfer assigned
         # each wiger now has werfer of corresponding wit
 
         # check if fully signed
@@ -2363,6 +2516,7 @@ class Kever:
         # during initial delegation we just escrow the delcept event
         if seqner is None and saider is None and delegator is not None:
             self.escrowPSEvent(serder=serder, sigers=sigers, wigers=wigers)
+            self.db.waitEscrow(delegator, "pses", snKey(serder.preb, serder.sn))
             raise MissingDelegationError("No delegation seal for delegator {} "
                                          "with evt = {}.".format(delegator, serder.ked))
 
@@ -2381,6 +2535,7 @@ class Kever:
             sn = validateSN(sn=serder.ked["s"], inceptive=inceptive)
             self.escrowPSEvent(serder=serder, sigers=sigers, wigers=wigers)
             self.escrowPACouple(serder=serder, seqner=seqner, saider=saider)
+            self.db.waitEscrow(delegator, "pses", snKey(serder.preb, serder.sn))
             raise MissingDelegationError("No delegating event from {} at {} for "
                                          "evt = {}.".format(delegator,
                                                             saider.qb64,
@@ -2456,39 +2611,42 @@ class Kever:
                 If cloned mode then dater maybe provided (not None)
                 When dater provided then use dater for first seen datetime
         """
-        fn = None
-        dgkey = dgKey(serder.preb, serder.saidb)
-        dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:
-                    self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
-                                          fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                            serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                        serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
-        logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                    serder.preb, serder.pretty())
-        return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
+        with self.db.transact():  # commit all writes for event at once
+            fn = None
+            dgkey = dgKey(serder.preb, serder.saidb)
+            dtsb = helping.nowIso8601().encode("utf-8")
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:
+                        self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
+                                              fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                serder.preb, fn, firner.sn, serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                            serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            self.db.indexSeals(serder)  # index anchored seals for anchor lookup
+            self.db.wakeEvent(serder.preb, serder.sn)  # wake escrows depending on event
+            logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
+                        serder.preb, serder.pretty())
+            return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
 
     def escrowPSEvent(self, serder, sigers, wigers=None):
         """
@@ -2501,15 +2659,21 @@ class Kever:
             wigers is optional list of Siger instance of indexed witness sigs
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.db.putEvt(dgkey, serder.raw)
-        snkey = snKey(serder.preb, serder.sn)
-        self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
-        logger.info("Kever state: Escrowed partially signed or delegated "
-                    "event = %s\n", serder.ked)
+        cnt = self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        with self.db.transact():  # commit all writes for event at once
+            self.db.putDts(dgkey, dtsb)  # idempotent
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putEvt(dgkey, serder.raw)
+            snkey = snKey(serder.preb, serder.sn)
+            self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
+            self.db.indexEscrow("pses", snkey, serder.saidb, dtsb)
+            logger.info("Kever state: Escrowed partially signed or delegated "
+                        "event = %s\n", serder.ked)
+        if cnt and self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey) > cnt:
+            self.db.wakeEscrow("pses", snkey)  # escrowed before and gained sigs
 
     def escrowPACouple(self, serder, seqner, saider):
         """
@@ -2545,19 +2709,27 @@ class Kever:
             saider is Diger instance of digest of delegator/issuer
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if seqner and saider:
-            couple = seqner.qb64b + saider.qb64b
-            self.db.putPde(dgkey, couple)
+        cnt = self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        with self.db.transact():  # commit all writes for event at once
+            self.db.putDts(dgkey, dtsb)  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if seqner and saider:
+                couple = seqner.qb64b + saider.qb64b
+                self.db.putPde(dgkey, couple)
 
-        self.db.putEvt(dgkey, serder.raw)
-        logger.info("Kever state: Escrowed partially witnessed "
-                    "event = %s\n", serder.ked)
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+            self.db.putEvt(dgkey, serder.raw)
+            logger.info("Kever state: Escrowed partially witnessed "
+                        "event = %s\n", serder.ked)
+            added = self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+            self.db.indexEscrow("pwes", snKey(serder.preb, serder.sn), serder.saidb, dtsb)
+        if cnt and self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey) > cnt:
+            # escrowed before and gained sigs
+            self.db.wakeEscrow("pwes", snKey(serder.preb, serder.sn))
+        return added
 
     def state(self, kind=Serials.json):
         """
@@ -2566,6 +2738,9 @@ class Kever:
         Parameters:
             kind is serialization kind for message json, cbor, mgpk
         """
+        if self._ksn is not None and kind == self._kind:  # unchanged since reload
+            return Serder(raw=self._ksn)
+
         eevt = StateEstEvent(s="{:x}".format(self.lastEst.s),
                              d=self.lastEst.d,
                              br=self.cuts,
@@ -2651,6 +2826,7 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    TimeoutSweep = 60  # seconds between full escrow walks when processing woken escrows
 
     def __init__(self, *, evts=None, cues=None, db=None, rvy=None,
                  lax=True, local=False, cloned=False, direct=True, check=False):
@@ -2688,6 +2864,7 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.swept = None  # datetime of last full walk of escrows
 
     @property
     def kevers(self):
@@ -2831,13 +3008,9 @@ class Kevery:
                     # raises ValidationError if no valid sig
                     kever = self.kevers[pre]  # get key state
                     # get unique verified lists of sigers and indices from sigers
-                    sigers, indices = verifySigs(raw=serder.raw,
-                                                 sigers=sigers,
-                                                 verfers=eserder.verfers)
-
-                    wigers, windices = verifySigs(raw=serder.raw,
-                                                  sigers=wigers,
-                                                  verfers=eserder.werfers)
+                    (sigers, indices), (wigers, windices) = verifySigsBatch(
+                        [(serder.raw, sigers, eserder.verfers),
+                         (serder.raw, wigers, eserder.werfers)])
 
                     if sigers or wigers:  # at least one verified sig or wig so log evt
                         # not first seen inception so ignore return
@@ -2887,16 +3060,12 @@ class Kevery:
                         # may have attached valid signature not yet logged
                         # raises ValidationError if no valid sig
                         kever = self.kevers[pre]
-                        # get unique verified lists of sigers and indices from sigers
-                        sigers, indices = verifySigs(raw=serder.raw,
-                                                     sigers=sigers,
-                                                     verfers=eserder.verfers)
-
                         wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                         werfers = [Verfer(qb64=wit) for wit in wits]
-                        wigers, windices = verifySigs(raw=serder.raw,
-                                                      sigers=wigers,
-                                                      verfers=werfers)
+                        # get unique verified lists of sigers and indices from sigers
+                        (sigers, indices), (wigers, windices) = verifySigsBatch(
+                            [(serder.raw, sigers, eserder.verfers),
+                             (serder.raw, wigers, werfers)])
 
                         if sigers or wigers:  # at least one verified sig or wig so log evt
                             # not first seen update so ignore return
@@ -2947,6 +3116,7 @@ class Kevery:
 
             # process each couple verify sig and write to db
             wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
+            vwigers = []  # wigers eligible for verification
             for wiger in wigers:
                 # assign verfers from witness list
                 if wiger.index >= len(wits):
@@ -2966,9 +3136,15 @@ class Kevery:
                                     " on nonlocal event receipt=\n%s\n", serder.pretty())
                         continue  # skip own receipt attachment on non-local event
 
-                if wiger.verfer.verify(wiger.raw, lserder.raw):
+                vwigers.append(wiger)
+
+            verifieds = Verfer.verifyMany([(wiger.verfer, wiger.raw, lserder.raw)
+                                           for wiger in vwigers])
+            for wiger, verified in zip(vwigers, verifieds):
+                if verified:
                     # write receipt indexed sig to database
                     self.db.addWig(key=dgkey, val=wiger.qb64b)
+                    self.db.wakeReceipt(pre, sn)
 
         else:  # no events to be receipted yet at that sn so escrow
             # get digest from receipt message not receipted event
@@ -3037,6 +3213,7 @@ class Kevery:
                         # create witness indexed signature
                         wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
                         self.db.addWig(key=dgkey, val=wiger.qb64b)  # write to db
+                        self.db.wakeReceipt(pre, sn)
                     else:  # write receipt couple to database
                         couple = cigar.verfer.qb64b + cigar.qb64b
                         self.db.addRct(key=dgkey, val=couple)
@@ -3105,6 +3282,7 @@ class Kevery:
                     # create witness indexed signature and write to db
                     wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
                     self.db.addWig(key=dgKey(pre, ldig), val=wiger.qb64b)
+                    self.db.wakeReceipt(pre, sn)
                 else:  # write receipt couple to database
                     couple = cigar.verfer.qb64b + cigar.qb64b
                     self.db.addRct(key=dgKey(pre, ldig), val=couple)
@@ -3943,10 +4121,12 @@ class Kevery:
             wigers (list): of witness signatures
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        self.db.putDts(dgkey, dtsb)
         self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
         self.db.putEvt(dgkey, serder.raw)
         self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.indexEscrow("ooes", snKey(serder.preb, serder.sn), serder.saidb, dtsb)
         if wigers:
             self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
         if seqner and saider:
@@ -3968,10 +4148,13 @@ class Kevery:
         """
         cigars = cigars if cigars is not None else []
         dgkey = dgKey(prefixer.qb64b, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        self.db.putDts(dgkey, dtsb)
         self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
         self.db.putEvt(dgkey, serder.raw)
         self.db.addQnf(dgkey, serder.saidb)
+        self.db.indexEscrow("qnfs", dgkey, serder.saidb, dtsb)
+        self.db.waitEscrow(serder.ked["q"]["i"], "qnfs", dgkey)  # wait on queried KEL
 
         for cigar in cigars:
             self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
@@ -3989,10 +4172,12 @@ class Kevery:
             sigers is list of Siger instance for  event
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        self.db.putDts(dgkey, dtsb)
         self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
         self.db.putEvt(dgkey, serder.raw)
         self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.indexEscrow("ldes", snKey(serder.preb, serder.sn), serder.saidb, dtsb)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -4022,13 +4207,16 @@ class Kevery:
         # so can compare digs from receipt and in database for receipted event
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+        dgkey = dgKey(serder.preb, said)
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        self.db.putDts(dgkey, dtsb)
         for wiger in wigers:  # escrow each couple
             # don't know witness pre yet without witness list so no verfer in wiger
             # if wiger.verfer.transferable:  # skip transferable verfers
             # continue  # skip invalid triplets
             couple = said.encode("utf-8") + wiger.qb64b
             self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+            self.db.indexEscrow("uwes", snKey(serder.preb, serder.sn), couple, dtsb)
         # log escrowed
         logger.info("Kevery process: escrowed unverified witness indexed receipt"
                     " of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4054,12 +4242,15 @@ class Kevery:
         # so can compare digs from receipt and in database for receipted event
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+        dgkey = dgKey(serder.preb, said)
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        self.db.putDts(dgkey, dtsb)
         for cigar in cigars:  # escrow each triple
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid triplets
             triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
             self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+            self.db.indexEscrow("ures", snKey(serder.preb, serder.sn), triple, dtsb)
         # log escrowed
         logger.info("Kevery process: escrowed unverified receipt of pre= %s "
                     " sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4096,7 +4287,9 @@ class Kevery:
         # lookup last event by sn not by dig.
         for tsg in tsgs:
             prefixer, seqner, saider, sigers = tsg
-            self.db.putDts(dgKey(serder.preb, serder.saidb), helping.nowIso8601().encode("utf-8"))
+            dgkey = dgKey(serder.preb, serder.saidb)
+            dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+            self.db.putDts(dgkey, dtsb)
             # since serder of of receipt not receipted event must use dig in
             # serder.ked["d"] not serder.dig
             prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
@@ -4104,6 +4297,8 @@ class Kevery:
             for siger in sigers:  # escrow each quintlet
                 quintuple = prelet + siger.qb64b  # quintuple
                 self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+                self.db.indexEscrow("vres", snKey(serder.preb, serder.sn), quintuple, dtsb)
+            self.db.waitEscrow(prefixer.qb64b, "vres", snKey(serder.preb, serder.sn))
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                         "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4138,7 +4333,9 @@ class Kevery:
         # and sig stored at kel pre, sn so can compare digs
         # with different algos.  Can't lookup by dig for the same reason. Must
         # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, serder.saidb), helping.nowIso8601().encode("utf-8"))
+        dgkey = dgKey(serder.preb, serder.saidb)
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        self.db.putDts(dgkey, dtsb)
         # since serder of of receipt not receipted event must use dig in
         # serder.ked["d"] not serder.dig
         prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
@@ -4146,6 +4343,8 @@ class Kevery:
         for siger in sigers:  # escrow each quintlet
             quintuple = prelet + siger.qb64b  # quintuple
             self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.db.indexEscrow("vres", snKey(serder.preb, serder.sn), quintuple, dtsb)
+        self.db.waitEscrow(prefixer.qb64b, "vres", snKey(serder.preb, serder.sn))
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                     "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4175,32 +4374,57 @@ class Kevery:
         # and sig stored at kel pre, sn so can compare digs
         # with different algos.  Can't lookup by dig for the same reason. Must
         # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, serder.said), helping.nowIso8601().encode("utf-8"))
+        dgkey = dgKey(serder.preb, serder.said)
+        dtsb = bytes(self.db.getDts(dgkey) or helping.nowIso8601().encode("utf-8"))
+        self.db.putDts(dgkey, dtsb)
         quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
                      saider.qb64b + siger.qb64b)
         self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.db.indexEscrow("vres", snKey(serder.preb, serder.sn), quintuple, dtsb)
+        self.db.waitEscrow(sprefixer.qb64b, "vres", snKey(serder.preb, serder.sn))
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
                     "receipt of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn,
                     serder.said)
 
-    def processEscrows(self):
+    def processEscrows(self, woke=False):
         """
         Iterate throush escrows and process any that may now be finalized
 
         Parameters:
+            woke (bool): True means only reprocess escrow entries woken by
+                satisfied dependencies since last pass, see .db.woke, and walk
+                all escrows only once every .TimeoutSweep seconds in order to
+                unescrow stale entries. False means walk all escrows.
         """
 
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processEscrowKeyState()
-            self.processQueryNotFound()
+            now = helping.nowUTC()
+            if (not woke or self.swept is None or
+                    (now - self.swept) > datetime.timedelta(seconds=self.TimeoutSweep)):
+                self.swept = now
+                self.db.woke.clear()  # full walk reprocesses every entry
+                self.processEscrowOutOfOrders()
+                self.processEscrowUnverWitness()
+                self.processEscrowUnverNonTrans()
+                self.processEscrowUnverTrans()
+                self.processEscrowPartialWigs()
+                self.processEscrowPartialSigs()
+                self.processEscrowDuplicitous()
+                self.processEscrowKeyState()
+                self.processQueryNotFound()
+
+            else:
+                while self.db.woke:  # until no more entries woken by last pass
+                    self.processEscrowOutOfOrders(keys=self.db.popWoke("ooes"))
+                    self.processEscrowUnverWitness(keys=self.db.popWoke("uwes"))
+                    self.processEscrowUnverNonTrans(keys=self.db.popWoke("ures"))
+                    self.processEscrowUnverTrans(keys=self.db.popWoke("vres"))
+                    self.processEscrowPartialWigs(keys=self.db.popWoke("pwes"))
+                    self.processEscrowPartialSigs(keys=self.db.popWoke("pses"))
+                    self.processEscrowDuplicitous(keys=self.db.popWoke("ldes"))
+                    self.processQueryNotFound(keys=self.db.popWoke("qnfs"))
+                self.processEscrowKeyState()
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -4209,7 +4433,35 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+    @staticmethod
+    def _escrowItems(nexter, keys=None):
+        """
+        Returns generator of (key, val) escrow items in insertion order at each
+        key given by escrow items next iterator method nexter of .db such as
+        .db.getOoeItemsNextIter
+
+        Parameters:
+            nexter (Callable): escrow items next iterator method of .db
+            keys (Iterable | None): of escrow keys to get items at.
+                None means walk all items in escrow
+        """
+        if keys is None:
+            key = ekey = b''  # both start same. when not same means escrows found
+            while True:  # break when done
+                for ekey, val in nexter(key=key):
+                    yield ekey, val
+                if ekey == key:  # still same so no escrows found on last while iteration
+                    break
+                key = ekey  # setup next while iteration, with key after ekey
+
+        else:
+            for key in keys:
+                for ekey, val in nexter(key=key, skip=False):
+                    if bytes(ekey) != key:  # no items left at key so at next key
+                        break
+                    yield ekey, val
+
+    def processEscrowOutOfOrders(self, keys=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -4245,107 +4497,86 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
-        """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
 
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-
-                    #  get wigs
-                    wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
-
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except OutOfOrderError as ex:
-                    # still waiting on missing prior event to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        """
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        self.db.pruneEscrows(timeouts={"ooes": self.TimeoutOOE})  # unescrow stale
+        for ekey, edig in self._escrowItems(self.db.getOoeItemsNextIter, keys=keys):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+
+                #  get wigs
+                wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
+                wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+
+                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
+
+                # If process does NOT validate event with sigs, becasue it is
+                # still out of order then process will attempt to re-escrow
+                # and then raise OutOfOrderError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Ooe escrow is called by
+                # Kevery.self.escrowOOEvent Which calls
+                # self.db.addOoe(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed ooe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except OutOfOrderError as ex:
+                # still waiting on missing prior event to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, keys=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -4378,133 +4609,113 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
+
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPseItemsNextIter(key=key):
-                eserder = None
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    dgkey = dgKey(pre, bytes(edig))
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgkey)
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgkey)
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgkey)
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # seal source (delegator issuer if any)
-                    seqner = saider = None
-                    couple = self.db.getPde(dgkey)
-                    if couple is not None:
-                        seqner, saider = deSourceCouple(couple)
-                    elif eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                        if eserder.pre in self.kevers:
-                            delpre = self.kevers[eserder.pre].delegator
-                        else:
-                            delpre = eserder.ked["di"]
-
-                        anchor = dict(i=eserder.ked["i"], s=eserder.sn, d=eserder.said)
-                        srdr = self.db.findAnchoringEvent(pre=delpre, anchor=anchor)
-                        if srdr is not None:
-                            seqner = coring.Seqner(sn=srdr.sn)
-                            saider = srdr.saider
-                            couple = seqner.qb64b + saider.qb64b
-                            self.db.putPde(dgkey, couple)
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    self.processEvent(serder=eserder, sigers=sigers,
-                                      seqner=seqner, saider=saider)
-
-                    # If process does NOT validate sigs or delegation seal (when delegated),
-                    # but there is still one valid signature then process will
-                    # attempt to re-escrow and then raise MissingSignatureError
-                    # or MissingDelegationSealError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pse escrow is called by
-                    # Kever.self.escrowPSEvent Which calls
-                    # self.db.addPse(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pse db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except (MissingSignatureError, MissingDelegationError) as ex:
-                    # still waiting on missing sigs or missing seal to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+        self.db.pruneEscrows(timeouts={"pses": self.TimeoutPSE})  # unescrow stale
+        for ekey, edig in self._escrowItems(self.db.getPseItemsNextIter, keys=keys):
+            eserder = None
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                dgkey = dgKey(pre, bytes(edig))
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgkey)
+                if eraw is None:
+                    # no event so so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgkey)
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                # seal source (delegator issuer if any)
+                seqner = saider = None
+                couple = self.db.getPde(dgkey)
+                if couple is not None:
+                    seqner, saider = deSourceCouple(couple)
+                elif eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                    if eserder.pre in self.kevers:
+                        delpre = self.kevers[eserder.pre].delegator
                     else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+                        delpre = eserder.ked["di"]
+
+                    anchor = dict(i=eserder.ked["i"], s=eserder.sn, d=eserder.said)
+                    srdr = self.db.findAnchoringEvent(pre=delpre, anchor=anchor)
+                    if srdr is not None:
+                        seqner = coring.Seqner(sn=srdr.sn)
+                        saider = srdr.saider
+                        couple = seqner.qb64b + saider.qb64b
+                        self.db.putPde(dgkey, couple)
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                self.processEvent(serder=eserder, sigers=sigers,
+                                  seqner=seqner, saider=saider)
+
+                # If process does NOT validate sigs or delegation seal (when delegated),
+                # but there is still one valid signature then process will
+                # attempt to re-escrow and then raise MissingSignatureError
+                # or MissingDelegationSealError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Pse escrow is called by
+                # Kever.self.escrowPSEvent Which calls
+                # self.db.addPse(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed pse db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except (MissingSignatureError, MissingDelegationError) as ex:
+                # still waiting on missing sigs or missing seal to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than waiting on sigs or seal so remove from escrow
+                self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
 
-                    if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                        self.cues.append(dict(kin="psUnescrow", serder=eserder))
+                if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                    self.cues.append(dict(kin="psUnescrow", serder=eserder))
 
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                with self.db.transact():  # remove both escrows at once
                     self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
                     self.db.delPde(dgkey)  # remove escrow if any
 
-                    if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                        self.cues.append(dict(kin="psUnescrow", serder=eserder))
+                if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                    self.cues.append(dict(kin="psUnescrow", serder=eserder))
 
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, keys=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -4539,127 +4750,106 @@ class Kevery:
                         Get and Attach Witness Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
-        """
-
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
 
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
 
-                    #  get sigs
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
-                    if not sigs:  # empty list
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    #  get wigs
-                    wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-
-                    if not wigs:  # empty list
-                        # wigs maybe empty while waiting for first witness signature
-                        # which may not arrive until some time after event is fully signed
-                        # so just log for debugging but do not unescrow by raising
-                        # ValidationError
-                        logger.info("Kevery unescrow wigs: No event wigs yet at."
-                                    "dig = %s\n", bytes(edig))
-
-                        # raise ValidationError("Missing escrowed evt wigs at "
-                        # "dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
-
-                    # seal source (delegator issuer if any)
-                    seqner = saider = None
-                    couple = self.db.getPde(dgKey(pre, bytes(edig)))
-                    if couple is not None:
-                        seqner, saider = deSourceCouple(couple)
-
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers, seqner=seqner, saider=saider)
-
-                    # If process does NOT validate wigs then process will attempt
-                    # to re-escrow and then raise MissingWitnessSignatureError
-                    # (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pwe escrow is called by
-                    # Kever.self.escrowPWEvent Which calls
-                    # self.db.addPwe(snKey(pre, sn), serder.digb)
-                    # which in turn will NOT enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pwe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-                    # Assumes that controller signature validation and delegation
-                    # validation will be successful as event would not be in
-                    # partially witnessed escrow unless they had already validated
-
-                except MissingWitnessSignatureError as ex:
-                    # still waiting on missing witness sigs
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        """
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        self.db.pruneEscrows(timeouts={"pwes": self.TimeoutPWE})  # unescrow stale
+        for ekey, edig in self._escrowItems(self.db.getPweItemsNextIter, keys=keys):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
+                if not sigs:  # empty list
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                #  get wigs
+                wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
+
+                if not wigs:  # empty list
+                    # wigs maybe empty while waiting for first witness signature
+                    # which may not arrive until some time after event is fully signed
+                    # so just log for debugging but do not unescrow by raising
+                    # ValidationError
+                    logger.info("Kevery unescrow wigs: No event wigs yet at."
+                                "dig = %s\n", bytes(edig))
+
+                    # raise ValidationError("Missing escrowed evt wigs at "
+                    # "dig = {}.".format(bytes(edig)))
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+
+                # seal source (delegator issuer if any)
+                seqner = saider = None
+                couple = self.db.getPde(dgKey(pre, bytes(edig)))
+                if couple is not None:
+                    seqner, saider = deSourceCouple(couple)
+
+                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers, seqner=seqner, saider=saider)
+
+                # If process does NOT validate wigs then process will attempt
+                # to re-escrow and then raise MissingWitnessSignatureError
+                # (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Pwe escrow is called by
+                # Kever.self.escrowPWEvent Which calls
+                # self.db.addPwe(snKey(pre, sn), serder.digb)
+                # which in turn will NOT enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed pwe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+                # Assumes that controller signature validation and delegation
+                # validation will be successful as event would not be in
+                # partially witnessed escrow unless they had already validated
+
+            except MissingWitnessSignatureError as ex:
+                # still waiting on missing witness sigs
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than waiting on sigs or seal so remove from escrow
+                self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, keys=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4706,83 +4896,62 @@ class Kevery:
                         compare dig so same event
                         verify wigs via wigers
                         If successful then remove from escrow table
-        """
-
-        ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
-                    #  get escrowed receipt's rdiger of receipted event and
-                    # wiger indexed signature of receipted event
-                    rdiger, wiger = deWitnessCouple(ecouple)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(rdiger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", rdiger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(rdiger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", rdiger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(rdiger.qb64b))
-
-                    # lookup database dig of the receipted event in pwes escrow
-                    # using pre and sn lastEvt
-                    found = self._processEscrowFindUnver(pre=pre,
-                                                         sn=sn,
-                                                         rsaider=rdiger,
-                                                         wiger=wiger)
-
-                    if not found:  # no partial witness escrow of event found
-                        # so keep in escrow by raising UnverifiedWitnessReceiptError
-                        logger.info("Kevery unescrow error: Missing witness "
-                                    "receipted evt at pre=%s sn=%x\n", (pre, sn))
 
-                        raise UnverifiedWitnessReceiptError("Missing witness "
-                                                            "receipted evt at pre={}  sn={:x}".format(pre, sn))
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
 
-                except UnverifiedWitnessReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        """
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        ims = bytearray()
+        self.db.pruneEscrows(timeouts={"uwes": self.TimeoutUWE})  # unescrow stale
+        for ekey, ecouple in self._escrowItems(self.db.getUweItemsNextIter, keys=keys):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
+                #  get escrowed receipt's rdiger of receipted event and
+                # wiger indexed signature of receipted event
+                rdiger, wiger = deWitnessCouple(ecouple)
+
+                # lookup database dig of the receipted event in pwes escrow
+                # using pre and sn lastEvt
+                found = self._processEscrowFindUnver(pre=pre,
+                                                     sn=sn,
+                                                     rsaider=rdiger,
+                                                     wiger=wiger)
+
+                if not found:  # no partial witness escrow of event found
+                    # so keep in escrow by raising UnverifiedWitnessReceiptError
+                    logger.info("Kevery unescrow error: Missing witness "
+                                "receipted evt at pre=%s sn=%x\n", (pre, sn))
+
+                    raise UnverifiedWitnessReceiptError("Missing witness "
+                                                        "receipted evt at pre={}  sn={:x}".format(pre, sn))
+
+            except UnverifiedWitnessReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event pre=%s "
-                                "sn=%s\n", pre, sn)
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event pre=%s "
+                            "sn=%s\n", pre, sn)
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, keys=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4827,135 +4996,114 @@ class Kevery:
                         compare dig so same event
                         verify sigs via cigars
                         If successful then remove from escrow table
+
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
+
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
-                    cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(rsaider.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", rsaider.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(rsaider.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", rsaider.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(rsaider.qb64b))
-
-                    # Is receipt for unverified witnessed event in .Pwes escrow
-                    # if found then try else clause will remove from escrow
-                    found = self._processEscrowFindUnver(pre=pre,
-                                                         sn=sn,
-                                                         rsaider=rsaider,
-                                                         cigar=cigar)
-
-                    if not found:  # no partial witness escrow of event found
-                        # so process as escrow of receipt for accept event
-                        # not two stage witnessed event escrow
-                        # get dig of receipted accepted event in kel using lastEvt
-                        # at pre and sn
-
-                        dig = self.db.getKeLast(snKey(pre, sn))
-                        if dig is None:  # no receipted event so keep in escrow
-                            logger.info("Kevery unescrow error: Missing receipted "
-                                        "event at pre=%s sn=%x\n", pre, sn)
-
-                            raise UnverifiedReceiptError("Missing receipted evt "
-                                                         "at pre={} sn={:x}".format(pre, sn))
-
-                        # get receipted event using pre and edig
-                        raw = self.db.getEvt(dgKey(pre, dig))
-                        if raw is None:  # receipted event superseded so remove from escrow
-                            logger.info("Kevery unescrow error: Invalid receipted "
-                                        "event refereance at pre=%s sn=%x\n", pre, sn)
-
-                            raise ValidationError("Invalid receipted evt reference"
-                                                  " at pre={} sn={:x}".format(pre, sn))
-
-                        serder = Serder(raw=bytes(raw))  # receipted event
-
-                        #  compare digs
-                        if rsaider.qb64b != serder.saidb:
-                            logger.info("Kevery unescrow error: Bad receipt dig."
-                                        "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
-
-                            raise ValidationError("Bad escrowed receipt dig at "
-                                                  "pre={} sn={:x} receipter={}."
-                                                  "".format(pre, sn, sprefixer.qb64))
-
-                        #  verify sig verfer key is prefixer from triple
-                        if not cigar.verfer.verify(cigar.raw, serder.raw):
-                            # no sigs so raise ValidationError which unescrows below
-                            logger.info("Kevery unescrow error: Bad receipt sig."
-                                        "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
-
-                            raise ValidationError("Bad escrowed receipt sig at "
-                                                  "pre={} sn={:x} receipter={}."
-                                                  "".format(pre, sn, sprefixer.qb64))
-
-                        # get current wits from kever state assuming not stale
-                        # receipt. Need function here to compute wits for actual
-                        # state at pre, sn. XXXX
-                        wits = self.kevers[serder.pre].wits
-                        rpre = cigar.verfer.qb64  # prefix of receiptor
-                        if rpre in wits:  # its a witness receipt
-                            # this only works for extra receipts that come in later
-                            # after event is out of .Pwes escrow
-                            index = wits.index(rpre)
-                            # create witness indexed signature and write to db
-                            wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
-                        else:  # write receipt couple to database
-                            couple = cigar.verfer.qb64b + cigar.qb64b
-                            self.db.addRct(key=dgKey(pre, serder.said), val=couple)
-
-
-                except UnverifiedReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        self.db.pruneEscrows(timeouts={"ures": self.TimeoutURE})  # unescrow stale
+        for ekey, etriplet in self._escrowItems(self.db.getUreItemsNextIter, keys=keys):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
+                cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
+
+                # Is receipt for unverified witnessed event in .Pwes escrow
+                # if found then try else clause will remove from escrow
+                found = self._processEscrowFindUnver(pre=pre,
+                                                     sn=sn,
+                                                     rsaider=rsaider,
+                                                     cigar=cigar)
+
+                if not found:  # no partial witness escrow of event found
+                    # so process as escrow of receipt for accept event
+                    # not two stage witnessed event escrow
+                    # get dig of receipted accepted event in kel using lastEvt
+                    # at pre and sn
+
+                    dig = self.db.getKeLast(snKey(pre, sn))
+                    if dig is None:  # no receipted event so keep in escrow
+                        logger.info("Kevery unescrow error: Missing receipted "
+                                    "event at pre=%s sn=%x\n", pre, sn)
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+                        raise UnverifiedReceiptError("Missing receipted evt "
+                                                     "at pre={} sn={:x}".format(pre, sn))
+
+                    # get receipted event using pre and edig
+                    raw = self.db.getEvt(dgKey(pre, dig))
+                    if raw is None:  # receipted event superseded so remove from escrow
+                        logger.info("Kevery unescrow error: Invalid receipted "
+                                    "event refereance at pre=%s sn=%x\n", pre, sn)
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event pre=%s "
-                                "sn=%s\n", pre, sn)
+                        raise ValidationError("Invalid receipted evt reference"
+                                              " at pre={} sn={:x}".format(pre, sn))
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+                    serder = Serder(raw=bytes(raw))  # receipted event
+
+                    #  compare digs
+                    if rsaider.qb64b != serder.saidb:
+                        logger.info("Kevery unescrow error: Bad receipt dig."
+                                    "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                        raise ValidationError("Bad escrowed receipt dig at "
+                                              "pre={} sn={:x} receipter={}."
+                                              "".format(pre, sn, sprefixer.qb64))
+
+                    #  verify sig verfer key is prefixer from triple
+                    if not cigar.verfer.verify(cigar.raw, serder.raw):
+                        # no sigs so raise ValidationError which unescrows below
+                        logger.info("Kevery unescrow error: Bad receipt sig."
+                                    "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                        raise ValidationError("Bad escrowed receipt sig at "
+                                              "pre={} sn={:x} receipter={}."
+                                              "".format(pre, sn, sprefixer.qb64))
+
+                    # get current wits from kever state assuming not stale
+                    # receipt. Need function here to compute wits for actual
+                    # state at pre, sn. XXXX
+                    wits = self.kevers[serder.pre].wits
+                    rpre = cigar.verfer.qb64  # prefix of receiptor
+                    if rpre in wits:  # its a witness receipt
+                        # this only works for extra receipts that come in later
+                        # after event is out of .Pwes escrow
+                        index = wits.index(rpre)
+                        # create witness indexed signature and write to db
+                        wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
+                        self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+                        self.db.wakeReceipt(pre, sn)
+                    else:  # write receipt couple to database
+                        couple = cigar.verfer.qb64b + cigar.qb64b
+                        self.db.addRct(key=dgKey(pre, serder.said), val=couple)
+
+            except UnverifiedReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event pre=%s "
+                            "sn=%s\n", pre, sn)
 
-    def processQueryNotFound(self):
+    def processQueryNotFound(self, keys=None):
         """
         Process qry events escrowed by Kevery for KELs that have not yet met the criteria of the query.
         A missing KEL or criteria for an event in a KEL at a particular sequence number or an event containing a
@@ -4978,96 +5126,76 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
+
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
         pre = b''
         sn = 0
-        while True:  # break when done
-            for ekey, edig in self.db.getQnfItemsNextIter(key=key):
-                try:
-                    pre, _ = splitKey(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutQNF):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale qry event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale qry event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
+        self.db.pruneEscrows(timeouts={"qnfs": self.TimeoutQNF})  # unescrow stale
+        for ekey, edig in self._escrowItems(self.db.getQnfItemsNextIter, keys=keys):
+            try:
+                pre, _ = splitKey(ekey)  # get pre and sn from escrow item
 
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
 
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
 
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
 
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
 
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
 
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
 
-                    #  get wigs
-                    cigars = []
-                    cigs = self.db.getRcts(dgKey(pre, bytes(edig)))  # list of wigs
-                    for cig in cigs:
-                        (_, cigar) = deReceiptCouple(cig)
-                        cigars.append(cigar)
+                #  get wigs
+                cigars = []
+                cigs = self.db.getRcts(dgKey(pre, bytes(edig)))  # list of wigs
+                for cig in cigs:
+                    (_, cigar) = deReceiptCouple(cig)
+                    cigars.append(cigar)
 
-                    source = coring.Prefixer(qb64b=pre)
-                    self.processQuery(serder=eserder, source=source, sigers=sigers, cigars=cigars)
+                source = coring.Prefixer(qb64b=pre)
+                self.processQuery(serder=eserder, source=source, sigers=sigers, cigars=cigars)
 
-                except QueryNotFoundError as ex:
-                    # still waiting on missing prior event to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+            except QueryNotFoundError as ex:
+                # still waiting on missing prior event to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
     def _processEscrowFindUnver(self, pre, sn, rsaider, wiger=None, cigar=None):
         """
@@ -5081,7 +5209,6 @@ class Kevery:
            found (bool): True means found matching event in .Pwes and added wig
                         to .Wigs. False means dig not find matching event in .Pwes
 
-
         Raises:
             Validation error if found matching event but signature does not verify
 
@@ -5172,12 +5299,13 @@ class Kevery:
                                       " at pre={} sn={:x}."
                                       "".format(pre, sn))
             self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+            self.db.wakeReceipt(pre, sn)
             # processEscrowPartialWigs removes from this .Pwes escrow
             # when fully witnessed using self.db.delPwe(snkey, dig)
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, keys=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -5211,7 +5339,6 @@ class Kevery:
                 dig is dig in receipt of receipted event
                 sigers is list of Siger instances for receipted event
 
-
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -5220,145 +5347,123 @@ class Kevery:
                         compare dig so same event
                         verify sigs via sigers
                         If successful then remove from escrow table
+
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
+
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(esaider.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", esaider.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(esaider.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", esaider.qb64b)
+        self.db.pruneEscrows(timeouts={"vres": self.TimeoutVRE})  # unescrow stale
+        for ekey, equinlet in self._escrowItems(self.db.getVreItemsNextIter, keys=keys):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
 
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(esaider.qb64b))
+                # get dig of the receipted event using pre and sn lastEvt
+                raw = self.db.getKeLast(snKey(pre, sn))
+                if raw is None:
+                    # no event so keep in escrow
+                    logger.info("Kevery unescrow error: Missing receipted "
+                                "event at pre=%s sn=%x\n", pre, sn)
 
-                    # get dig of the receipted event using pre and sn lastEvt
-                    raw = self.db.getKeLast(snKey(pre, sn))
-                    if raw is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                    "event at pre=%s sn=%x\n", pre, sn)
+                    raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
+                                                             " sn={:x}".format(pre, sn))
 
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                                                 " sn={:x}".format(pre, sn))
+                dig = bytes(raw)
+                # get receipted event using pre and edig
+                raw = self.db.getEvt(dgKey(pre, dig))
+                if raw is None:  # receipted event superseded so remove from escrow
+                    logger.info("Kevery unescrow error: Invalid receipted "
+                                "event referenace at pre=%s sn=%x\n", pre, sn)
 
-                    dig = bytes(raw)
-                    # get receipted event using pre and edig
-                    raw = self.db.getEvt(dgKey(pre, dig))
-                    if raw is None:  # receipted event superseded so remove from escrow
-                        logger.info("Kevery unescrow error: Invalid receipted "
-                                    "event referenace at pre=%s sn=%x\n", pre, sn)
+                    raise ValidationError("Invalid receipted evt reference "
+                                          "at pre={} sn={:x}".format(pre, sn))
 
-                        raise ValidationError("Invalid receipted evt reference "
-                                              "at pre={} sn={:x}".format(pre, sn))
+                serder = Serder(raw=bytes(raw))  # receipted event
 
-                    serder = Serder(raw=bytes(raw))  # receipted event
+                #  compare digs
+                if esaider.qb64b != serder.saidb:
+                    logger.info("Kevery unescrow error: Bad receipt dig."
+                                "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
 
-                    #  compare digs
-                    if esaider.qb64b != serder.saidb:
-                        logger.info("Kevery unescrow error: Bad receipt dig."
-                                    "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
+                    raise ValidationError("Bad escrowed receipt dig at "
+                                          "pre={} sn={:x} receipter={}."
+                                          "".format(pre, sn, sprefixer.qb64))
 
-                        raise ValidationError("Bad escrowed receipt dig at "
-                                              "pre={} sn={:x} receipter={}."
-                                              "".format(pre, sn, sprefixer.qb64))
+                # get receipter's last est event
+                # retrieve dig of last event at sn of receipter.
+                sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
+                                                   sn=sseqner.sn))
+                if sdig is None:
+                    # no event so keep in escrow
+                    logger.info("Kevery unescrow error: Missing receipted "
+                                "event at pre=%s sn=%x\n", pre, sn)
 
-                    # get receipter's last est event
-                    # retrieve dig of last event at sn of receipter.
-                    sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
-                                                       sn=sseqner.sn))
-                    if sdig is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                    "event at pre=%s sn=%x\n", pre, sn)
+                    raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
+                                                             " sn={:x}".format(pre, sn))
 
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                                                 " sn={:x}".format(pre, sn))
-
-                    # retrieve last event itself of receipter
-                    sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                    # assumes db ensures that sraw must not be none because sdig was in KE
-                    sserder = Serder(raw=bytes(sraw))
-                    if not sserder.compare(said=ssaider.qb64):  # seal dig not match event
-                        # this unescrows
-                        raise ValidationError("Bad chit seal at sn = {} for rct = {}."
-                                              "".format(sseqner.sn, sserder.ked))
-
-                    # verify sigs and if so write quadruple to database
-                    verfers = sserder.verfers
-                    if not verfers:
-                        raise ValidationError("Invalid seal est. event dig = {} for "
-                                              "receipt from pre ={} no keys."
-                                              "".format(ssaider.qb64, sprefixer.qb64))
-
-                    # Set up quadruple
-                    sealet = sprefixer.qb64b + sseqner.qb64b + ssaider.qb64b
-
-                    if siger.index >= len(verfers):
-                        raise ValidationError("Index = {} to large for keys."
-                                              "".format(siger.index))
-
-                    siger.verfer = verfers[siger.index]  # assign verfer
-                    if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
-                        logger.info("Kevery unescrow error: Bad trans receipt sig."
-                                    "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+                # retrieve last event itself of receipter
+                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
+                # assumes db ensures that sraw must not be none because sdig was in KE
+                sserder = Serder(raw=bytes(sraw))
+                if not sserder.compare(said=ssaider.qb64):  # seal dig not match event
+                    # this unescrows
+                    raise ValidationError("Bad chit seal at sn = {} for rct = {}."
+                                          "".format(sseqner.sn, sserder.ked))
 
-                        raise ValidationError("Bad escrowed trans receipt sig at "
-                                              "pre={} sn={:x} receipter={}."
-                                              "".format(pre, sn, sprefixer.qb64))
+                # verify sigs and if so write quadruple to database
+                verfers = sserder.verfers
+                if not verfers:
+                    raise ValidationError("Invalid seal est. event dig = {} for "
+                                          "receipt from pre ={} no keys."
+                                          "".format(ssaider.qb64, sprefixer.qb64))
 
-                    # good sig so write receipt quadruple to database
-                    quadruple = sealet + siger.qb64b
-                    self.db.addVrc(key=dgKey(pre, serder.said), val=quadruple)
+                # Set up quadruple
+                sealet = sprefixer.qb64b + sseqner.qb64b + ssaider.qb64b
+
+                if siger.index >= len(verfers):
+                    raise ValidationError("Index = {} to large for keys."
+                                          "".format(siger.index))
 
+                siger.verfer = verfers[siger.index]  # assign verfer
+                if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+                    logger.info("Kevery unescrow error: Bad trans receipt sig."
+                                "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
-                except UnverifiedTransferableReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+                    raise ValidationError("Bad escrowed trans receipt sig at "
+                                          "pre={} sn={:x} receipter={}."
+                                          "".format(pre, sn, sprefixer.qb64))
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+                # good sig so write receipt quadruple to database
+                quadruple = sealet + siger.qb64b
+                self.db.addVrc(key=dgKey(pre, serder.said), val=quadruple)
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
+            except UnverifiedTransferableReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
 
-    def processEscrowDuplicitous(self):
+    def processEscrowDuplicitous(self, keys=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -5393,98 +5498,77 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
-        """
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getLdeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
 
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    self.processEvent(serder=eserder, sigers=sigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except LikelyDuplicitousError as ex:
-                    # still can't determine if duplicitous
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than likely duplicitous so remove from escrow
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        Parameters:
+            keys (Iterable | None): of escrow keys of woken entries to
+                reprocess. None means walk all entries in escrow
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+        """
+        self.db.pruneEscrows(timeouts={"ldes": self.TimeoutLDE})  # unescrow stale
+        for ekey, edig in self._escrowItems(self.db.getLdeItemsNextIter, keys=keys):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                self.processEvent(serder=eserder, sigers=sigers)
+
+                # If process does NOT validate event with sigs, becasue it is
+                # still out of order then process will attempt to re-escrow
+                # and then raise OutOfOrderError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Ooe escrow is called by
+                # Kevery.self.escrowOOEvent Which calls
+                # self.db.addOoe(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed ooe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except LikelyDuplicitousError as ex:
+                # still can't determine if duplicitous
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than likely duplicitous so remove from escrow
+                self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
     def duplicity(self, serder, sigers):
         """
@@ -6,11 +6,13 @@ message stream parsing support
 """
 
 import logging
-from collections import namedtuple
+from collections import namedtuple, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, astuple
 
 from .coring import (Ilks, CtrDex, Counter, Seqner, Siger, Cigar, Dater, Verfer,
                      Prefixer, Serder, Saider, Pather, Idents, Sadder)
+from . import coring
 from .. import help
 from .. import kering
 from ..vc.proving import Creder
@@ -65,6 +67,116 @@ ColdDex = ColdCodex()  # Make instance
 Coldage = namedtuple("Coldage", 'msg txt bny')  # stream cold start status
 Colds = Coldage(msg='msg', txt='txt', bny='bny')
 
+# lists of attachments extracted for one message
+Attachage = namedtuple("Attachage", 'sigers wigers cigars trqs tsgs ssgs frcs sscs '
+                                    'sadtsgs sadcigs pathed')
+
+
+class Cursor:
+    """
+    Cursor is an incoming message stream buffer that provides the subset of the
+    bytearray interface used by Parser and by the primitive extractors of
+    Matter, Indexer, Counter and Sadder. Stripping parsed bytes from the front
+    with del cursor[:n] only advances a read offset into the backing bytearray
+    instead of shifting all the remaining bytes. So consuming a stream of n
+    bytes costs O(n) instead of O(n**2). The consumed front of the backing
+    bytearray is compacted only once it exceeds .compaction bytes and is at
+    least half of the backing bytearray.
+
+    Slices return bytearray copies of just the sliced bytes so extracting a
+    primitive or message only copies out its own bytes.
+
+    Attributes:
+        buf (bytearray): backing buffer, bytes before .offset are consumed
+        offset (int): read offset of first unconsumed byte in .buf
+        compaction (int): min consumed bytes before compacting .buf
+
+    Usage:
+        ims = Cursor(msgs)
+        ims.extend(more)  # append received bytes
+        Parser().parse(ims=ims, kvy=kvy)
+
+    """
+    Compaction = 65536  # default min consumed bytes before compacting
+
+    def __init__(self, ims=b'', compaction=None):
+        """
+        Initialize instance
+
+        Parameters:
+            ims (bytes | bytearray): initial contents, copied
+            compaction (int): min consumed bytes before compacting .buf
+                None means use .Compaction
+        """
+        self.buf = bytearray(ims)
+        self.offset = 0
+        self.compaction = compaction if compaction is not None else self.Compaction
+
+    def __len__(self):
+        return len(self.buf) - self.offset
+
+    def __bool__(self):
+        return len(self.buf) > self.offset
+
+    def __bytes__(self):
+        return bytes(self.buf[self.offset:])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({bytes(self)!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, Cursor):
+            other = bytes(other)
+        return bytes(self) == other
+
+    def __getitem__(self, key):
+        size = len(self)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(size)
+            if step != 1:
+                return self.buf[self.offset:][key]
+            return self.buf[self.offset + start:self.offset + max(start, stop)]
+
+        if key < 0:
+            key += size
+        if not 0 <= key < size:
+            raise IndexError("Cursor index out of range.")
+        return self.buf[self.offset + key]
+
+    def __delitem__(self, key):
+        if isinstance(key, slice) and key.start in (None, 0) and key.step in (None, 1):
+            start, stop, _ = key.indices(len(self))
+            self.offset += stop  # consume from front
+            if self.offset == len(self.buf):  # all consumed so reset
+                del self.buf[:]
+                self.offset = 0
+            elif self.offset >= self.compaction and self.offset * 2 >= len(self.buf):
+                self.compact()
+        else:  # arbitrary deletion so compact first then delete
+            self.compact()
+            del self.buf[key]
+
+    def __iadd__(self, data):
+        self.extend(data)
+        return self
+
+    def extend(self, data):
+        """
+        Append bytes in data to end of unconsumed bytes
+
+        Parameters:
+            data (bytes | bytearray | memoryview): bytes to append
+        """
+        self.buf.extend(data)
+
+    def compact(self):
+        """
+        Remove consumed bytes from front of .buf and reset .offset
+        """
+        if self.offset:
+            del self.buf[:self.offset]
+            self.offset = 0
+
 
 class Parser:
     """
@@ -82,21 +194,30 @@ class Parser:
     Has the following public attributes and properties:
 
     Attributes:
-        ims (bytearray): incoming message stream
+        ims (Cursor | bytearray): incoming message stream
         framed (bool): True means stream is packet framed
         pipeline (bool): True means use pipeline processor to process
                 whenever stream includes pipelined count codes.
         kvy (Kevery): route KEL message types to this instance
         tvy (Tevery): route TEL message types to this instance
+        pipes (deque): of (future, routes) duples of extracted messages awaiting
+                dispatch in stream order behind pipelined groups still in flight
+
+    Class Attributes:
+        PipelineWorkers (int): max worker threads for pipelined group extraction
 
     """
+    PipelineWorkers = 4  # max threads in shared pipeline pool
+    _Pool = None  # shared pipeline ThreadPoolExecutor created on first use
 
     def __init__(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
         """
         Initialize instance:
 
         Parameters:
-            ims (bytearray): incoming message stream
+            ims (Cursor | bytearray): incoming message stream. Cursor means
+                parse by advancing its read offset instead of deleting from
+                the front of a bytearray. Default is empty Cursor.
             framed (bool): True means ims contains only one msg body plus
                 its foot of attachments, not multiple sets of msg body plus foot
             pipeline (bool): True means use pipeline processor to process
@@ -107,7 +228,7 @@ class Parser:
             rvy (Revery): reply (RPY) message handler
             vry (Verfifier): credential verifier with wallet storage
         """
-        self.ims = ims if ims is not None else bytearray()
+        self.ims = ims if ims is not None else Cursor()
         self.framed = True if framed else False  # extract until end-of-stream
         self.pipeline = True if pipeline else False  # process as pipelined
         self.kvy = kvy
@@ -115,6 +236,7 @@ class Parser:
         self.exc = exc
         self.rvy = rvy
         self.vry = vry
+        self.pipes = deque()  # (future, routes) of pipelined msgs in stream order
 
     @staticmethod
     def sniff(ims):
@@ -160,11 +282,11 @@ class Parser:
     def extract(ims, klas, cold=Colds.txt):
         """
         Extract and return instance of klas from input message stream, ims, given
-        stream state, cold, is txt or bny. Inits klas from ims using qb64b or
-        qb2 parameter based on cold.
+        stream state, cold, is txt or bny. Inits klas from ims using
+        .fromQb64bFast or qb2 parameter based on cold.
         """
         if cold == Colds.txt:
-            return klas(qb64b=ims, strip=True)
+            return klas.fromQb64bFast(ims, strip=True)
         elif cold == Colds.bny:
             return klas(qb2=ims, strip=True)
         else:
@@ -187,7 +309,7 @@ class Parser:
         while True:
             try:
                 if cold == Colds.txt:
-                    return klas(qb64b=ims, strip=True)
+                    return klas.fromQb64bFast(ims, strip=True)
                 elif cold == Colds.bny:
                     return klas(qb2=ims, strip=True)
                 else:
@@ -447,8 +569,8 @@ class Parser:
             attachments. So even when framed==True must still have counters.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
+            if not isinstance(ims, (bytearray, Cursor)):
+                ims = Cursor(ims)  # so make Cursor copy
         else:
             ims = self.ims  # use instance attribute by default
 
@@ -494,6 +616,7 @@ class Parser:
                     logger.error("Parser msg non-extraction error: %s\n", ex)
             yield
 
+        self._drain(wait=True)  # dispatch any pipelined msgs still in flight
         return True
 
     def onceParsator(self, ims=None, framed=None, pipeline=None, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
@@ -523,8 +646,8 @@ class Parser:
             attachments. So even when framed==True must still have counters.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
+            if not isinstance(ims, (bytearray, Cursor)):
+                ims = Cursor(ims)  # so make Cursor copy
         else:
             ims = self.ims  # use instance attribute by default
 
@@ -572,6 +695,7 @@ class Parser:
             finally:
                 done = True
 
+        self._drain(wait=True)  # dispatch any pipelined msgs still in flight
         return done
 
     def parsator(self, ims=None, framed=None, pipeline=None, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
@@ -605,8 +729,8 @@ class Parser:
             attachments. So even when framed==True must still have counters.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
+            if not isinstance(ims, (bytearray, Cursor)):
+                ims = Cursor(ims)  # so make Cursor copy
         else:
             ims = self.ims  # use instance attribute by default
 
@@ -654,6 +778,131 @@ class Parser:
 
         return True  # should never return
 
+    @staticmethod
+    def _exts():
+        """
+        Returns Attachage of empty lists, one for each kind of extracted attachment
+        """
+        return Attachage(
+            sigers=[],  # list of Siger instances of attached indexed controller signatures
+            wigers=[],  # list of Siger instance of attached indexed witness signatures
+            cigars=[],  # List of cigars to hold nontrans rct couplets
+            # List of tuples from extracted transferable receipt (vrc) quadruples
+            trqs=[],  # each converted quadruple is (prefixer, seqner, diger, siger)
+            # List of tuples from extracted transferable indexed sig groups
+            tsgs=[],  # each converted group is tuple of (i,s,d) triple plus list of sigs
+            # List of tuples from extracted signer seals sig groups
+            ssgs=[],  # each converted group is the identifier prefix plus list of sigs
+            # List of tuples from extracted first seen replay couples
+            frcs=[],  # each converted couple is (seqner, dater)
+            # List of tuples from extracted source seal couples (delegator or issuer)
+            sscs=[],  # each converted couple is (seqner, diger) for delegating/issuing event
+            # List of tuples from extracted SAD path sig groups from transferable identifiers
+            sadtsgs=[],  # each converted group is tuple of (path, i, s, d) quad plus list of sigs
+            # List of tuples from extracted SAD path sig groups from non-trans identifiers
+            sadcigs=[],  # each converted group is path plus list of non-trans sigs
+            pathed=[],  # grouped attachments targetting a subpath
+        )
+
+    @classmethod
+    def _pool(cls):
+        """
+        Returns shared ThreadPoolExecutor for pipelined group extraction,
+        creating it on first use
+        """
+        if cls._Pool is None:
+            cls._Pool = ThreadPoolExecutor(max_workers=cls.PipelineWorkers,
+                                           thread_name_prefix="parser")
+        return cls._Pool
+
+    def _pipelineGroup(self, sadder, ims, cold, pags):
+        """
+        Returns duple (sadder, exts) where exts is Attachage of attachments
+        extracted from whole pipelined group frame ims of message sadder.
+        Runs on pipeline pool worker thread so touches no shared state other
+        than the Verfer preverification memo.
+
+        Parameters:
+            sadder (Sadder): extracted message
+            ims (bytearray): whole pipelined group frame already stripped from stream
+            cold (str): Colds.txt or Colds.bny of pipelined group
+            pags (int): size of pipelined group frame in bytes
+
+        Raises SizedGroupError when frame is malformed. Frame already stripped
+        from stream so no need to flush.
+        """
+        exts = self._exts()
+        try:
+            ctr = self.extract(ims, Counter, cold=cold)
+            for _ in self._attachator(ctr=ctr, ims=ims, exts=exts, cold=cold,
+                                      pipelined=True):  # whole frame never short
+                raise kering.ShortageError("Truncated pipelined group.")
+        except kering.ExtractionError as ex:
+            raise kering.SizedGroupError("Error processing pipelined size"
+                                         "attachment group of size={}.".format(pags))
+
+        self._preverify(sadder, exts)
+        return sadder, exts
+
+    @staticmethod
+    def _preverify(sadder, exts):
+        """
+        Preverifies those attached signatures of sadder whose verification keys
+        are given by the message itself so not dependent on key state.
+        Results are memoized by Verfer.preverify for later processing.
+
+        Parameters:
+            sadder (Sadder): extracted message
+            exts (Attachage): extracted attachments of sadder
+        """
+        if sadder.ident != Idents.keri:
+            return
+
+        serder = Serder(sad=sadder)
+        ilk = serder.ked["t"]
+        triples = []
+        if ilk in (Ilks.icp, Ilks.rot, Ilks.dip, Ilks.drt):  # signed by own keys
+            verfers = serder.verfers
+            triples.extend((verfers[siger.index], siger.raw, serder.raw)
+                           for siger in exts.sigers if siger.index < len(verfers))
+        if ilk in (Ilks.icp, Ilks.dip):  # witnessed by own backers
+            werfers = serder.werfers
+            triples.extend((werfers[wiger.index], wiger.raw, serder.raw)
+                           for wiger in exts.wigers if wiger.index < len(werfers))
+        if ilk in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt, Ilks.rpy):
+            triples.extend((cigar.verfer, cigar.raw, serder.raw)  # nontrans couples
+                           for cigar in exts.cigars)
+        if triples:
+            Verfer.preverify(triples)
+
+    def _drain(self, wait=False):
+        """
+        Dispatches, in stream order, messages at front of .pipes whose pipelined
+        extraction has completed. Stops at first message still in flight unless
+        wait is True.
+        Errors are logged per message so one bad message does not stop the rest.
+
+        Parameters:
+            wait (bool): True means block until all of .pipes dispatched
+        """
+        while self.pipes and (wait or self.pipes[0][0].done()):
+            future, routes = self.pipes.popleft()
+            try:
+                sadder, exts = future.result()
+                self._dispatch(sadder, exts, **routes)
+
+            except kering.SizedGroupError as ex:  # pipelined group already flushed
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Parser msg extraction error: %s\n", ex.args[0])
+                else:
+                    logger.error("Parser msg extraction error: %s\n", ex.args[0])
+
+            except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Parser msg non-extraction error: %s\n", ex)
+                else:
+                    logger.error("Parser msg non-extraction error: %s\n", ex)
+
     def msgParsator(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
         """
         Returns generator that upon each iteration extracts and parses msg
@@ -703,6 +952,7 @@ class Parser:
             ims = self.ims
 
         while not ims:
+            self._drain()  # dispatch completed pipelined msgs while idle
             yield
 
         cold = self.sniff(ims)  # check for spurious counters at front of stream
@@ -713,31 +963,18 @@ class Parser:
         # Otherwise its a message cold start
         while True:  # extract and deserialize message from ims
             try:
-                sadder = Sadder(raw=ims)
+                if isinstance(ims, Cursor):  # only copy out bytes of message
+                    _, _, _, size = coring.sniff(ims[:coring.MINSNIFFSIZE])
+                    sadder = Sadder(raw=ims[:size])
+                else:
+                    sadder = Sadder(raw=ims)
             except kering.ShortageError as ex:  # need more bytes
                 yield
             else:  # extracted successfully
                 del ims[:sadder.size]  # strip off event from front of ims
                 break
 
-        sigers = []  # list of Siger instances of attached indexed controller signatures
-        wigers = []  # list of Siger instance of attached indexed witness signatures
-        cigars = []  # List of cigars to hold nontrans rct couplets
-        # List of tuples from extracted transferable receipt (vrc) quadruples
-        trqs = []  # each converted quadruple is (prefixer, seqner, diger, siger)
-        # List of tuples from extracted transferable indexed sig groups
-        tsgs = []  # each converted group is tuple of (i,s,d) triple plus list of sigs
-        # List of tuples from extracted signer seals sig groups
-        ssgs = []  # each converted group is the identifier prefix plus list of sigs
-        # List of tuples from extracted first seen replay couples
-        frcs = []  # each converted couple is (seqner, dater)
-        # List of tuples from extracted source seal couples (delegator or issuer)
-        sscs = []  # each converted couple is (seqner, diger) for delegating/issuing event
-        # List of tuples from extracted SAD path sig groups from transferable identifiers
-        sadtsgs = []  # each converted group is tuple of (path, i, s, d) quad plus list of sigs
-        # List of tuples from extracted SAD path sig groups from non-trans identifiers
-        sadcigs = []  # each converted group is path plus list of non-trans sigs
-        pathed = []  # grouped attachments targetting a subpath
+        exts = self._exts()  # extracted attachments
         pipelined = False  # all attachments in one big pipeline counted group
         # extract and deserialize attachments
         try:  # catch errors here to flush only counted part of stream
@@ -758,204 +995,28 @@ class Parser:
                     del ims[:pags]  # strip off from ims
                     ims = pims  # now just process substream as one counted frame
 
-                    if pipeline:
-                        pass  # pass extracted ims to pipeline processor
-                        return
+                    if pipeline:  # pass extracted ims to pipeline processor
+                        future = self._pool().submit(self._pipelineGroup,
+                                                     sadder=sadder,
+                                                     ims=pims,
+                                                     cold=cold,
+                                                     pags=pags)
+                        self.pipes.append((future, dict(kvy=kvy, tvy=tvy, exc=exc,
+                                                        rvy=rvy, vry=vry)))
+                        self._drain()
+                        return True
 
                     ctr = yield from self._extractor(ims=ims,
                                                      klas=Counter,
                                                      cold=cold,
                                                      abort=pipelined)
 
-                # iteratively process attachment counters (all non pipelined)
-                while True:  # do while already extracted first counter is ctr
-                    if ctr.code == CtrDex.ControllerIdxSigs:
-                        for i in range(ctr.count):  # extract each attached signature
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            sigers.append(siger)
-
-                    elif ctr.code == CtrDex.WitnessIdxSigs:
-                        for i in range(ctr.count):  # extract each attached signature
-                            wiger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            wigers.append(wiger)
-
-                    elif ctr.code == CtrDex.NonTransReceiptCouples:
-                        # extract attached rct couplets into list of sigvers
-                        # verfer property of cigar is the identifier prefix
-                        # cigar itself has the attached signature
-                        for cigar in self._nonTransReceiptCouples(ctr=ctr, ims=ims, cold=cold, pipelined=pipelined):
-                            cigars.append(cigar)
-
-                    elif ctr.code == CtrDex.TransReceiptQuadruples:
-                        # extract attaced trans receipt vrc quadruple
-                        # spre+ssnu+sdig+sig
-                        # spre is pre of signer of vrc
-                        # ssnu is sn of signer's est evt when signed
-                        # sdig is dig of signer's est event when signed
-                        # sig is indexed signature of signer on this event msg
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            prefixer = yield from self._extractor(ims,
-                                                                  klas=Prefixer,
-                                                                  cold=cold,
-                                                                  abort=pipelined)
-                            seqner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            saider = yield from self._extractor(ims,
-                                                                klas=Saider,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            trqs.append((prefixer, seqner, saider, siger))
-
-                    elif ctr.code == CtrDex.TransIdxSigGroups:
-                        # extract attaced trans indexed sig groups each made of
-                        # triple pre+snu+dig plus indexed sig group
-                        # pre is pre of signer (endorser) of msg
-                        # snu is sn of signer's est evt when signed
-                        # dig is dig of signer's est event when signed
-                        # followed by counter for ControllerIdxSigs with attached
-                        # indexed sigs from trans signer (endorser).
-                        for (prefixer, seqner, saider, isigers) in self._transIdxSigGroups(ctr, ims, cold=cold,
-                                                                                           pipelined=pipelined):
-                            tsgs.append((prefixer, seqner, saider, isigers))
-
-                    elif ctr.code == CtrDex.TransLastIdxSigGroups:
-                        # extract attaced signer seal indexed sig groups each made of
-                        # identifier pre plus indexed sig group
-                        # pre is pre of signer (endorser) of msg
-                        # followed by counter for ControllerIdxSigs with attached
-                        # indexed sigs from trans signer (endorser).
-                        for i in range(ctr.count):  # extract each attached groups
-                            prefixer = yield from self._extractor(ims,
-                                                                  klas=Prefixer,
-                                                                  cold=cold,
-                                                                  abort=pipelined)
-                            ictr = ctr = yield from self._extractor(ims=ims,
-                                                                    klas=Counter,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                            if ctr.code != CtrDex.ControllerIdxSigs:
-                                raise kering.UnexpectedCountCodeError("Wrong "
-                                                                      "count code={}.Expected code={}."
-                                                                      "".format(ictr.code, CtrDex.ControllerIdxSigs))
-                            isigers = []
-                            for i in range(ictr.count):  # extract each attached signature
-                                isiger = yield from self._extractor(ims=ims,
-                                                                    klas=Siger,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                                isigers.append(isiger)
-                            ssgs.append((prefixer, isigers))
-
-                    elif ctr.code == CtrDex.FirstSeenReplayCouples:
-                        # extract attached first seen replay couples
-                        # snu+dtm
-                        # snu is fn (first seen ordinal) of event
-                        # dtm is dt of event
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            firner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            dater = yield from self._extractor(ims,
-                                                               klas=Dater,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            frcs.append((firner, dater))
-
-                    elif ctr.code == CtrDex.SealSourceCouples:
-                        # extract attached first seen replay couples
-                        # snu+dig
-                        # snu is sequence number  of event
-                        # dig is digest of event
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            seqner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            saider = yield from self._extractor(ims,
-                                                                klas=Saider,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            sscs.append((seqner, saider))
-
-                    elif ctr.code == CtrDex.SadPathSigGroup:
-                        path = yield from self._extractor(ims,
-                                                          klas=Pather,
-                                                          cold=cold,
-                                                          abort=pipelined)
-                        for i in range(ctr.count):
-                            ictr = yield from self._extractor(ims=ims,
-                                                              klas=Counter,
-                                                              cold=cold,
-                                                              abort=pipelined)
-                            for code, sigs in self._sadPathSigGroup(ctr=ictr,
-                                                                    ims=ims,
-                                                                    root=path,
-                                                                    cold=cold,
-                                                                    pipelined=pipelined):
-                                if code == CtrDex.TransIdxSigGroups:
-                                    sadtsgs.append(sigs)
-                                else:
-                                    sadcigs.append(sigs)
-
-                    elif ctr.code == CtrDex.SadPathSig:
-                        for code, sigs in self._sadPathSigGroup(ctr=ctr,
-                                                                ims=ims,
-                                                                cold=cold,
-                                                                pipelined=pipelined):
-                            if code == CtrDex.TransIdxSigGroups:
-                                sadtsgs.append(sigs)
-                            else:
-                                sadcigs.append(sigs)
-
-                    elif ctr.code == CtrDex.PathedMaterialQuadlets:  # pathed ctr?
-                        # compute pipelined attached group size based on txt or bny
-                        pags = ctr.count * 4 if cold == Colds.txt else ctr.count * 3
-                        while len(ims) < pags:  # wait until rx full pipelned group
-                            yield
-
-                        pims = ims[:pags]  # copy out substream pipeline group
-                        del ims[:pags]  # strip off from ims
-                        pathed.append(pims)
-
-                    else:
-                        raise kering.UnexpectedCountCodeError("Unsupported count"
-                                                              " code={}.".format(ctr.code))
-
-                    if pipelined:  # process to end of stream (group)
-                        if not ims:  # end of pipelined group frame
-                            break
-
-                    elif framed:
-                        # because not all in one pipeline group, each attachment
-                        # group may switch stream state txt or bny
-                        if not ims:  # end of frame
-                            break
-                        cold = self.sniff(ims)
-                        if cold == Colds.msg:  # new message so attachments done
-                            break  # finished attachments since new message
-                    else:  # process until next message
-                        # because not all in one pipeline group, each attachment
-                        # group may switch stream state txt or bny
-                        while not ims:
-                            yield  # no frame so must wait for next message
-                        cold = self.sniff(ims)  # ctr or msg
-                        if cold == Colds.msg:  # new message
-                            break  # finished attachments since new message
-
-                    ctr = yield from self._extractor(ims=ims, klas=Counter, cold=cold)
+                yield from self._attachator(ctr=ctr,
+                                            ims=ims,
+                                            exts=exts,
+                                            cold=cold,
+                                            framed=framed,
+                                            pipelined=pipelined)
 
         except kering.ExtractionError as ex:
             if pipelined:  # extracted pipelined group is preflushed
@@ -963,6 +1024,242 @@ class Parser:
                                              "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        if self.pipes:  # keep stream order behind in flight pipelined groups
+            future = Future()
+            future.set_result((sadder, exts))
+            self.pipes.append((future, dict(kvy=kvy, tvy=tvy, exc=exc,
+                                            rvy=rvy, vry=vry)))
+            self._drain()
+            return True
+
+        return self._dispatch(sadder, exts, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy, vry=vry)
+
+    def _attachator(self, ctr, ims, exts, cold=Colds.txt, framed=True, pipelined=False):
+        """
+        Returns generator that extracts attachments from ims into exts starting
+        with already extracted counter ctr and continuing with each following
+        counter until end of frame or next message.
+
+        Parameters:
+            ctr (Counter): first already extracted attachment group counter
+            ims (Cursor | bytearray): serialized incoming message stream
+            exts (Attachage): of attachment lists from ._exts to append to
+            cold (str): next charater Coldage type indicator
+            framed (bool) True means ims contains only one frame of msg plus
+                counted attachments instead of stream with multiple messages
+            pipelined (bool) True means ims is whole pipelined group frame so
+                extraction errors abort instead of waiting for more bytes
+        """
+        (sigers, wigers, cigars, trqs, tsgs, ssgs, frcs, sscs, sadtsgs, sadcigs,
+         pathed) = exts
+
+        # iteratively process attachment counters (all non pipelined)
+        while True:  # do while already extracted first counter is ctr
+            if ctr.code == CtrDex.ControllerIdxSigs:
+                for i in range(ctr.count):  # extract each attached signature
+                    siger = yield from self._extractor(ims=ims,
+                                                       klas=Siger,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    sigers.append(siger)
+
+            elif ctr.code == CtrDex.WitnessIdxSigs:
+                for i in range(ctr.count):  # extract each attached signature
+                    wiger = yield from self._extractor(ims=ims,
+                                                       klas=Siger,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    wigers.append(wiger)
+
+            elif ctr.code == CtrDex.NonTransReceiptCouples:
+                # extract attached rct couplets into list of sigvers
+                # verfer property of cigar is the identifier prefix
+                # cigar itself has the attached signature
+                for cigar in self._nonTransReceiptCouples(ctr=ctr, ims=ims, cold=cold, pipelined=pipelined):
+                    cigars.append(cigar)
+
+            elif ctr.code == CtrDex.TransReceiptQuadruples:
+                # extract attaced trans receipt vrc quadruple
+                # spre+ssnu+sdig+sig
+                # spre is pre of signer of vrc
+                # ssnu is sn of signer's est evt when signed
+                # sdig is dig of signer's est event when signed
+                # sig is indexed signature of signer on this event msg
+                for i in range(ctr.count):  # extract each attached quadruple
+                    prefixer = yield from self._extractor(ims,
+                                                          klas=Prefixer,
+                                                          cold=cold,
+                                                          abort=pipelined)
+                    seqner = yield from self._extractor(ims,
+                                                        klas=Seqner,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    saider = yield from self._extractor(ims,
+                                                        klas=Saider,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    siger = yield from self._extractor(ims=ims,
+                                                       klas=Siger,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    trqs.append((prefixer, seqner, saider, siger))
+
+            elif ctr.code == CtrDex.TransIdxSigGroups:
+                # extract attaced trans indexed sig groups each made of
+                # triple pre+snu+dig plus indexed sig group
+                # pre is pre of signer (endorser) of msg
+                # snu is sn of signer's est evt when signed
+                # dig is dig of signer's est event when signed
+                # followed by counter for ControllerIdxSigs with attached
+                # indexed sigs from trans signer (endorser).
+                for (prefixer, seqner, saider, isigers) in self._transIdxSigGroups(ctr, ims, cold=cold,
+                                                                                   pipelined=pipelined):
+                    tsgs.append((prefixer, seqner, saider, isigers))
+
+            elif ctr.code == CtrDex.TransLastIdxSigGroups:
+                # extract attaced signer seal indexed sig groups each made of
+                # identifier pre plus indexed sig group
+                # pre is pre of signer (endorser) of msg
+                # followed by counter for ControllerIdxSigs with attached
+                # indexed sigs from trans signer (endorser).
+                for i in range(ctr.count):  # extract each attached groups
+                    prefixer = yield from self._extractor(ims,
+                                                          klas=Prefixer,
+                                                          cold=cold,
+                                                          abort=pipelined)
+                    ictr = ctr = yield from self._extractor(ims=ims,
+                                                            klas=Counter,
+                                                            cold=cold,
+                                                            abort=pipelined)
+                    if ctr.code != CtrDex.ControllerIdxSigs:
+                        raise kering.UnexpectedCountCodeError("Wrong "
+                                                              "count code={}.Expected code={}."
+                                                              "".format(ictr.code, CtrDex.ControllerIdxSigs))
+                    isigers = []
+                    for i in range(ictr.count):  # extract each attached signature
+                        isiger = yield from self._extractor(ims=ims,
+                                                            klas=Siger,
+                                                            cold=cold,
+                                                            abort=pipelined)
+                        isigers.append(isiger)
+                    ssgs.append((prefixer, isigers))
+
+            elif ctr.code == CtrDex.FirstSeenReplayCouples:
+                # extract attached first seen replay couples
+                # snu+dtm
+                # snu is fn (first seen ordinal) of event
+                # dtm is dt of event
+                for i in range(ctr.count):  # extract each attached quadruple
+                    firner = yield from self._extractor(ims,
+                                                        klas=Seqner,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    dater = yield from self._extractor(ims,
+                                                       klas=Dater,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    frcs.append((firner, dater))
+
+            elif ctr.code == CtrDex.SealSourceCouples:
+                # extract attached first seen replay couples
+                # snu+dig
+                # snu is sequence number  of event
+                # dig is digest of event
+                for i in range(ctr.count):  # extract each attached quadruple
+                    seqner = yield from self._extractor(ims,
+                                                        klas=Seqner,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    saider = yield from self._extractor(ims,
+                                                        klas=Saider,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    sscs.append((seqner, saider))
+
+            elif ctr.code == CtrDex.SadPathSigGroup:
+                path = yield from self._extractor(ims,
+                                                  klas=Pather,
+                                                  cold=cold,
+                                                  abort=pipelined)
+                for i in range(ctr.count):
+                    ictr = yield from self._extractor(ims=ims,
+                                                      klas=Counter,
+                                                      cold=cold,
+                                                      abort=pipelined)
+                    for code, sigs in self._sadPathSigGroup(ctr=ictr,
+                                                            ims=ims,
+                                                            root=path,
+                                                            cold=cold,
+                                                            pipelined=pipelined):
+                        if code == CtrDex.TransIdxSigGroups:
+                            sadtsgs.append(sigs)
+                        else:
+                            sadcigs.append(sigs)
+
+            elif ctr.code == CtrDex.SadPathSig:
+                for code, sigs in self._sadPathSigGroup(ctr=ctr,
+                                                        ims=ims,
+                                                        cold=cold,
+                                                        pipelined=pipelined):
+                    if code == CtrDex.TransIdxSigGroups:
+                        sadtsgs.append(sigs)
+                    else:
+                        sadcigs.append(sigs)
+
+            elif ctr.code == CtrDex.PathedMaterialQuadlets:  # pathed ctr?
+                # compute pipelined attached group size based on txt or bny
+                pags = ctr.count * 4 if cold == Colds.txt else ctr.count * 3
+                while len(ims) < pags:  # wait until rx full pipelned group
+                    yield
+
+                pims = ims[:pags]  # copy out substream pipeline group
+                del ims[:pags]  # strip off from ims
+                pathed.append(pims)
+
+            else:
+                raise kering.UnexpectedCountCodeError("Unsupported count"
+                                                      " code={}.".format(ctr.code))
+
+            if pipelined:  # process to end of stream (group)
+                if not ims:  # end of pipelined group frame
+                    break
+
+            elif framed:
+                # because not all in one pipeline group, each attachment
+                # group may switch stream state txt or bny
+                if not ims:  # end of frame
+                    break
+                cold = self.sniff(ims)
+                if cold == Colds.msg:  # new message so attachments done
+                    break  # finished attachments since new message
+            else:  # process until next message
+                # because not all in one pipeline group, each attachment
+                # group may switch stream state txt or bny
+                while not ims:
+                    yield  # no frame so must wait for next message
+                cold = self.sniff(ims)  # ctr or msg
+                if cold == Colds.msg:  # new message
+                    break  # finished attachments since new message
+
+            ctr = yield from self._extractor(ims=ims, klas=Counter, cold=cold)
+
+    def _dispatch(self, sadder, exts, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+        """
+        Dispatches processing of message sadder with its extracted attachments
+        exts to the handler for its ident and ilk.
+
+        Parameters:
+            sadder (Sadder): extracted message
+            exts (Attachage): of attachment lists from ._exts
+            kvy (Kevery) route KERI KEL message types to this instance
+            tvy (Tevery) route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier) ACDC credential processor
+        """
+        (sigers, wigers, cigars, trqs, tsgs, ssgs, frcs, sscs, sadtsgs, sadcigs,
+         pathed) = exts
+
         if sadder.ident == Idents.keri:
             serder = Serder(sad=sadder)
 
@@ -23,6 +23,12 @@ class Router:
     Reply message router that accepts registration of route `r` handlers and dispatches
     reply messages to the appropriate handler.
 
+    Registered route templates are compiled into an exact match table for static routes
+    and a segment trie for templated routes so finding the route of a message does not
+    depend on the number of registered routes. Templates with fields that are not whole
+    path segments fall back to a linear regex search. The first registered route that
+    matches wins as with a linear search of all routes in registration order.
+
     """
 
     defaultResourceFunc = "processReply"
@@ -34,7 +40,13 @@ class Router:
             routes (list): preregistered routes for this router
 
         """
-        self.routes = routes if routes is not None else list()
+        self.routes = list()
+        self.statics = dict()  # static route to (order, Route)
+        self.trie = _Node()  # segment trie of templated routes
+        self.rest = list()  # (order, Route) of routes only matched by regex
+        self.lowest = None  # lowest order of non static routes if any
+        for route in (routes if routes is not None else []):
+            self._index(route)
 
     def addRoute(self, routeTemplate, resource, suffix=None):
         """ Add a route between a route template and a resource
@@ -50,7 +62,40 @@ class Router:
         """
 
         fields, regex = compile_uri_template(routeTemplate)
-        self.routes.append(Route(regex=regex, fields=fields, resource=resource, suffix=suffix))
+        self._index(Route(regex=regex, fields=fields, resource=resource, suffix=suffix,
+                          template=routeTemplate))
+
+    def _index(self, route):
+        """ Append route and index it by its template into statics, trie or rest
+
+        Parameters:
+            route (Route): route to register
+        """
+        order = len(self.routes)
+        self.routes.append(route)
+
+        segs = _segments(route.template) if route.template is not None else None
+        if segs is None:  # no template or fields inside segments so regex only
+            self.rest.append((order, route))
+        elif not any(name for _, name in segs):  # static route
+            self.statics.setdefault("/".join(seg for seg, _ in segs), (order, route))
+            return
+        else:
+            node = self.trie
+            names = []
+            for seg, name in segs:
+                if name:
+                    names.append(name)
+                    if node.param is None:
+                        node.param = _Node()
+                    node = node.param
+                else:
+                    node = node.children.setdefault(seg, _Node())
+            if node.leaf is None:  # first registered of same shape always wins
+                node.leaf = (order, route, names)
+
+        if self.lowest is None:
+            self.lowest = order
 
     def dispatch(self, serder, saider, cigars, tsgs):
         """
@@ -67,7 +112,7 @@ class Router:
         ked = serder.ked
         # Dispatch based on route
         r = ked["r"]
-        route, match = self._find(route=r)
+        route, kwargs = self.find(route=r)
         if route is None:
             raise kering.ValidationError(f"No resource is registered to handle route {r}")
 
@@ -75,7 +120,6 @@ class Router:
         if route.suffix is not None:
             fname += route.suffix
 
-        kwargs = match.groupdict()
         for name in route.fields:
             if name not in kwargs:
                 raise kering.ValidationError(f"parameter {name} not found in route {r}")
@@ -83,25 +127,46 @@ class Router:
         fn = getattr(route.resource, fname, self.processRouteNotFound)
         fn(serder=serder, saider=saider, route=r, cigars=cigars, tsgs=tsgs, **kwargs)
 
-    def _find(self, route):
-        """ Linear seach thru added routes, returning the first one that matchs
+    def find(self, route):
+        """ Finds first added route that matches route
 
-        Searches through the registered routes until a regex in one of the routes matches
-        the provided route and returns the Route object along with the re.Match object.
+        Looks up static routes by exact match, then walks the segment trie of templated
+        routes and searches the regex of any remaining routes. Returns the matching
+        Route with the lowest registration order along with its matched parameters.
 
         Parameters:
             route (str): the route from the `r` of the reply message
 
         Returns:
             Route: the Route object with the resource that is registered to process this rpy message
-            re.Match:  the regular expression match that contains the grouping of matched parameters.
+            dict:  the matched parameters of the route by field name.
 
         """
-        for r in self.routes:
+        if not isinstance(route, str) or not route.startswith("/"):
+            return None, None
+
+        segs = route.split("/")[1:]
+        best = self.statics.get("/".join(segs).lower())
+        if best is not None and (self.lowest is None or best[0] < self.lowest):
+            return best[1], dict()  # fast path static route registered before others
+        best = (best[0], best[1], dict()) if best is not None else None
+
+        found = self.trie.find(segs, 0, [])
+        if found is not None and (best is None or found[0] < best[0]):
+            order, r, names, values = found
+            best = (order, r, dict(zip(names, values)))
+
+        for order, r in self.rest:
+            if best is not None and order > best[0]:
+                break  # rest in order so no earlier match left
             if res := r.regex.search(route):
-                return r, res
+                best = (order, r, res.groupdict())
+                break
+
+        if best is None:
+            return None, None
 
-        return None, None
+        return best[1], best[2]
 
     def processRouteNotFound(self, *, serder, saider, route,
                              cigars=None, tsgs=None, **kwargs):
@@ -525,7 +590,7 @@ class Route:
 
     """
 
-    def __init__(self, regex, fields, resource, suffix=None):
+    def __init__(self, regex, fields, resource, suffix=None, template=None):
         """ Initialize instance of route
 
         Parameters:
@@ -533,12 +598,78 @@ class Route:
             fields(set): field names for matches in regex
             resource(object): the handler for this route
             suffix(Optional(str)): a suffix to be applied to the handler method
+            template(Optional(str)): the uri template regex was compiled from
 
         """
         self.regex = regex
         self.fields = fields
         self.resource = resource
         self.suffix = suffix
+        self.template = template
+
+
+class _Node:
+    """ Segment trie node of templated routes in Router
+
+    Properties:
+        .children(dict): lowercase static segment to child _Node
+        .param(Optional(_Node)): child _Node for a field segment
+        .leaf(Optional(tuple)): (order, Route, field names) of route ending here
+
+    """
+
+    __slots__ = ("children", "param", "leaf")
+
+    def __init__(self):
+        self.children = dict()
+        self.param = None
+        self.leaf = None
+
+    def find(self, segs, i, values):
+        """ Returns (order, Route, names, values) of lowest order route matching
+        segs from index i on or None
+
+        Parameters:
+            segs(list): route path segments
+            i(int): index of next segment to match
+            values(list): field values matched so far
+        """
+        if i == len(segs):
+            return (*self.leaf, list(values)) if self.leaf is not None else None
+
+        best = None
+        child = self.children.get(segs[i].lower())
+        if child is not None:
+            best = child.find(segs, i + 1, values)
+        if self.param is not None and segs[i]:
+            values.append(segs[i])
+            found = self.param.find(segs, i + 1, values)
+            values.pop()
+            if found is not None and (best is None or found[0] < best[0]):
+                best = found
+        return best
+
+
+def _segments(template):
+    """ Returns list of (segment, field name) of uri template path segments
+    where field name is None for static segments, or None when a segment
+    mixes fields with static text so template can only be matched by regex.
+
+    Parameters:
+        template(str): uri template as accepted by compile_uri_template
+    """
+    if template != '/' and template.endswith('/'):
+        template = template[:-1]
+
+    segs = []
+    for seg in template.split("/")[1:]:
+        if m := re.fullmatch(r'{([a-zA-Z]\w*)}', seg):
+            segs.append((None, m.group(1)))
+        elif "{" in seg or "}" in seg:
+            return None
+        else:
+            segs.append((seg.lower(), None))
+    return segs
 
 
 def compile_uri_template(template):
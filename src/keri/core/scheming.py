@@ -6,6 +6,7 @@ self-addressing and schema support
 """
 
 import json
+from collections import OrderedDict
 
 import cbor2 as cbor
 import jsonschema
@@ -24,14 +25,17 @@ class CacheResolver:
 
     """
 
-    def __init__(self, db):
+    def __init__(self, db, capacity=None):
         """ Create a jsonschema resolver that can be used for loading references to schema remotely.
 
         Parameters:
             db (Baser) is a database instance to store and retrieve json schema SADs
+            capacity (int): maximum number of schema and compiled validators kept in memory
 
         """
         self.db = db
+        self.typ = JSONSchema(resolver=self, capacity=capacity)
+        self.schemers = OrderedDict()  # LRU of Schemer keyed by schema SAID
 
     def add(self, key, schema):
         """ Add schema to cache for resolution
@@ -45,6 +49,49 @@ class CacheResolver:
             return
 
         self.db.schema.pin(key, schemer)
+        self.schemers.pop(key, None)
+
+    def schemer(self, said):
+        """ Returns cached Schemer for said sharing compiled validators or None if not in db
+
+        Parameters:
+            said (str): SAID of schema
+        """
+        if (schemer := self.schemers.get(said)) is not None:
+            self.schemers.move_to_end(said)
+            return schemer
+
+        schemer = self.db.schema.get(said)
+        if schemer is None:
+            return None
+
+        schemer.typ = self.typ
+        self.schemers[said] = schemer
+        while len(self.schemers) > self.typ.capacity:
+            self.schemers.popitem(last=False)
+
+        return schemer
+
+    def warm(self):
+        """ Load and compile validators for schema in db up to capacity
+
+        Returns:
+            int: number of schema compiled
+        """
+        count = 0
+        for (said,), _ in self.db.schema.getItemIter():
+            if count >= self.typ.capacity:
+                break
+            if (schemer := self.schemer(said)) is None:
+                continue
+            try:
+                self.typ.validator(schemer.sed)
+            except kering.ValidationError as ex:
+                logger.error(f"unable to compile schema {said}: {ex}")
+                continue
+            count += 1
+
+        return count
 
     def resolve(self, uri):
         schemer = self.db.schema.get(uri)
@@ -87,15 +134,19 @@ class JSONSchema:
     """ JSON Schema support class
     """
     id_ = Ids.dollar  # ID Field Label
+    Capacity = 256  # default maximum number of compiled validators
 
-    def __init__(self, resolver=None):
+    def __init__(self, resolver=None, capacity=None):
         """ Initialize instance
 
         Parameters:
             resolver(Optional(Resolver)): instance used by JSONSchema parsing to resolve external refs
+            capacity (int): maximum number of compiled validators kept, least recently used evicted
 
         """
         self.resolver = resolver
+        self.capacity = capacity if capacity is not None else self.Capacity
+        self.validators = OrderedDict()  # LRU of compiled validators keyed by schema SAID
 
     def resolve(self, uri):
         """ Resolve remote reference to schema
@@ -209,6 +260,68 @@ class JSONSchema:
 
         return True
 
+    def validator(self, schema):
+        """ Returns compiled validator for schema, compiling and checking schema only once per SAID
+
+        Parameters:
+            schema (dict): is the JSON schema to compile
+
+        Raises:
+            ValidationError: if schema is not valid JSON Schema
+        """
+        said = schema.get(self.id_) if isinstance(schema, dict) else None
+        if said and (validator := self.validators.get(said)) is not None:
+            self.validators.move_to_end(said)
+            return validator
+
+        try:
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            kwargs = dict()
+            if self.resolver is not None:
+                kwargs["resolver"] = self.resolver.resolver(scer=schema)
+            validator = cls(schema, **kwargs)
+        except jsonschema.exceptions.SchemaError as ex:
+            raise kering.ValidationError(f'Schema exception: {ex}')
+
+        if said:
+            self.validators[said] = validator
+            while len(self.validators) > self.capacity:
+                self.validators.popitem(last=False)
+
+        return validator
+
+    def errors(self, schema=b'', raw=b''):
+        """ Returns list of validation errors of raw JSON against schema, empty if valid
+
+        Each error is a dict with the JSON pointer path of the failing value,
+        the failing schema keyword and a message.
+
+        Parameters:
+            schema (dict): is the schema use for validation
+            raw (bytes): is JSON to validate against the Schema
+
+        Raises:
+            ValidationError: if schema is not valid JSON Schema
+        """
+        validator = self.validator(schema)
+
+        try:
+            d = json.loads(raw)
+        except (json.decoder.JSONDecodeError, UnicodeDecodeError) as ex:
+            return [dict(path="", keyword="json", message=f"Credential JSON exception: {ex}")]
+
+        errors = []
+        try:
+            for error in validator.iter_errors(d):
+                errors.append(dict(path="/" + "/".join(str(part) for part in error.absolute_path),
+                                   keyword=error.validator,
+                                   message=error.message))
+        except Exception as ex:
+            errors.append(dict(path="", keyword="exception", message=f"Credential Exception: {ex}"))
+
+        return errors
+
     def verify_json(self, schema=b'', raw=b''):
         """ Verify the raw content against the schema for JSON that conforms to the schema
 
@@ -218,27 +331,31 @@ class JSONSchema:
 
         Returns:
             boolean: True if the JSON passes validation against the
-                   provided complaint Draft 7 JSON Schema.  Returns False
+                   provided complaint Draft 7 JSON Schema.  Raises ValidationError
                    if raw is not valid JSON, schema is not valid JSON Schema or
                    the validation fails
         """
-        try:
-            d = json.loads(raw)
-            kwargs = dict()
-            if self.resolver is not None:
-                kwargs["resolver"] = self.resolver.resolver(scer=raw)
-            jsonschema.validate(instance=d, schema=schema, **kwargs)
-        except jsonschema.exceptions.ValidationError as ex:
-            raise kering.ValidationError(f'Credential validation exception: {ex}')
-        except jsonschema.exceptions.SchemaError as ex:
-            raise kering.ValidationError(f'Schema exception: {ex}')
-        except json.decoder.JSONDecodeError as ex:
-            raise kering.ValidationError(f"Credential JSON exception: {ex}")
-        except Exception as ex:
-            raise kering.ValidationError(f"Credential Exception: {ex}")
+        if errors := self.errors(schema=schema, raw=raw):
+            error = errors[0]
+            if error["keyword"] in ("json", "exception"):
+                raise kering.ValidationError(error["message"])
+            raise kering.ValidationError(f'Credential validation exception: {error["path"]}: '
+                                         f'{error["message"]}')
 
         return True
 
+    def verifyMany(self, schema, raws):
+        """ Validate many JSON documents against one schema compiled once
+
+        Parameters:
+            schema (dict): is the schema use for validation
+            raws (Iterable): of bytes JSON to validate against the Schema
+
+        Returns:
+            list: of error lists one per raw in order, see .errors. Empty list means valid
+        """
+        return [self.errors(schema=schema, raw=raw) for raw in raws]
+
 
 class Schemer:
     """ Schemer is KERI schema serializer-deserializer class
@@ -266,7 +383,7 @@ class Schemer:
 
     """
 
-    def __init__(self, raw=b'', sed=None, kind=None, typ=JSONSchema(), code=MtrDex.Blake3_256):
+    def __init__(self, raw=b'', sed=None, kind=None, typ=None, code=MtrDex.Blake3_256):
         """  Initialize instance of Schemer
 
         Deserialize if raw provided
@@ -277,7 +394,7 @@ class Schemer:
           raw (bytes): of serialized schema
           sed (dict): dict or None
             if None its deserialized from raw
-          typ (JSONSchema): type of schema
+          typ (JSONSchema): type of schema, sniffed from raw or JSONSchema if None
           kind (serialization): kind string value or None (see namedtuple coring.Serials)
             supported kinds are 'json', 'cbor', 'msgpack', 'binary'
             if kind (None): then its extracted from ked or raw
@@ -286,10 +403,11 @@ class Schemer:
         """
 
         self._code = code
+        self.typ = typ
         if raw:
             self.raw = raw
         elif sed:
-            self.typ = typ
+            self.typ = typ if typ is not None else JSONSchema()
             self._kind = kind
             self.sed = sed
         else:
@@ -308,7 +426,8 @@ class Schemer:
             raw: JSON to load
 
         """
-        self.typ = self._sniff(raw)
+        if self.typ is None:
+            self.typ = self._sniff(raw)
         sed, kind, saider = self.typ.load(raw=raw)
 
         return sed, kind, saider
@@ -409,6 +528,16 @@ class Schemer:
 
         return self.typ.verify_json(schema=self.sed, raw=raw)
 
+    def verifyMany(self, raws):
+        """
+        Returns list of error lists, one per raw in order, of validating each raw
+        against this schema. Empty error list means valid. Schema compiled once.
+
+        Parameters:
+            raws (Iterable): of bytes serialised JSON content to verify against schema
+        """
+        return self.typ.verifyMany(schema=self.sed, raws=raws)
+
     def pretty(self, *, size=1024):
         """
         Returns str JSON of .sed with pretty formatting
@@ -19,6 +19,7 @@ So only need to set dupsort first time opened each other opening does not
 need to call it
 """
 
+import datetime
 import os
 import shutil
 from contextlib import contextmanager
@@ -36,36 +37,69 @@ from .. import kering
 from ..core import coring, eventing, parsing
 
 from .. import help
+from ..help import helping
 
 logger = help.ogler.getLogger()
 
+ChunkSize = 65536  # default minimum bytes per chunk of a streamed replay
+
 
 class dbdict(dict):
     """
     Subclass of dict that has db as attribute and employs read through cash
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    When .capacity is not None the cache is bounded to .capacity items by CLOCK
+    eviction. Each hit sets a reference bit for its key. Evicting sweeps from
+    the oldest item, giving referenced and pinned items a second chance by
+    clearing the bit and moving them to the newest end. So dict insertion order
+    only changes when evicting. Pinned keys are those in .db.prefixes, the
+    local prefixes, which are never evicted. Evicted items are reloaded from
+    the database on next access. Reloaded kevers are local only when in
+    .db.prefixes and get the cues of the Kevery that next processes their events.
+
+    Attributes:
+        db (Baser): database of states for read through
+        capacity (int | None): max items held in memory, None means unbounded
+        refs (set): keys referenced since last eviction sweep passed them
+        hits (int): count of accesses found in memory
+        misses (int): count of accesses reloaded from or missing in database
+        evictions (int): count of evicted items
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'capacity', 'refs', 'hits', 'misses', 'evictions')  # no .__dict__
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, capacity=None, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.capacity = capacity
+        self.refs = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            val = super(dbdict, self).__getitem__(k)
+            self.hits += 1
+            if self.capacity is not None:
+                self.refs.add(k)
+            return val
         except KeyError as ex:
-            if not self.db:
-                raise ex  # reraise KeyError
-            if (state := self.db.states.get(keys=k)) is None:
+            self.misses += 1
+            if (val := self._load(k)) is None:
                 raise ex  # reraise KeyError
-            try:
-                kever = eventing.Kever(state=state, db=self.db)
-            except kering.MissingEntryError:  # no kel event for keystate
-                raise ex  # reraise KeyError
-            self.__setitem__(k, kever)
-            return kever
+            dbdict.__setitem__(self, k, val)  # not subclass, val from db already
+            return val
+
+    def __setitem__(self, k, v):
+        super(dbdict, self).__setitem__(k, v)
+        if self.capacity is not None and len(self) > self.capacity:
+            self._evict(keep=k)
+
+    def __delitem__(self, k):
+        super(dbdict, self).__delitem__(k)
+        self.refs.discard(k)
 
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
@@ -83,6 +117,55 @@ class dbdict(dict):
         else:
             return self.__getitem__(k)
 
+    def clear(self):
+        super(dbdict, self).clear()
+        self.refs.clear()
+
+    def _load(self, k):
+        """
+        Returns Kever reloaded from key state of k in .db or None if missing
+        """
+        if not self.db:
+            return None
+        if (state := self.db.states.get(keys=k)) is None:
+            return None
+        try:
+            return eventing.Kever(state=state, db=self.db,
+                                  local=k in self.db.prefixes)
+        except kering.MissingEntryError:  # no kel event for keystate
+            return None
+
+    def _pinned(self, k, v):
+        """
+        Returns True if item k, v must stay in memory, i.e. is a local prefix
+        """
+        return bool(self.db) and k in self.db.prefixes
+
+    def _evicted(self, k, v):
+        """
+        Hook called with each evicted item. Kever state is already in database.
+        """
+
+    def _evict(self, keep=None):
+        """
+        Evicts items by CLOCK sweep until at most .capacity items or only
+        pinned items are left
+
+        Parameters:
+            keep (str | None): key just set that is not evicted by this sweep
+        """
+        chances = len(self)  # bound sweep when all items are pinned
+        while len(self) > self.capacity and chances >= 0:
+            k = next(iter(self))  # oldest
+            v = super(dbdict, self).pop(k)
+            if k == keep or k in self.refs or self._pinned(k, v):  # second chance
+                self.refs.discard(k)
+                super(dbdict, self).__setitem__(k, v)  # move to newest
+                chances -= 1
+                continue
+            self.evictions += 1
+            self._evicted(k, v)
+
 
 @dataclass
 class OobiQueryRecord:  # information for responding to OOBI query
@@ -346,6 +429,28 @@ def reopenDB(db, clear=False, **kwa):
         db.close(clear=clear)
 
 
+def chunkify(msgs, size=None):
+    """
+    Returns generator of bytearray chunks coalesced in order from the messages
+    in msgs. Every chunk but the last holds at least size bytes so a replay can
+    be sent or written incrementally instead of built as one bytearray.
+
+    Parameters:
+        msgs (Iterable): of bytes or bytearray messages with attachments
+        size (int): minimum bytes per chunk, defaults to ChunkSize
+    """
+    size = size if size is not None else ChunkSize
+    chunk = bytearray()
+    for msg in msgs:
+        chunk.extend(msg)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = bytearray()
+
+    if chunk:
+        yield chunk
+
+
 class Baser(dbing.LMDBer):
     """
     Baser sets up named sub databases with Keri Event Logs within main database
@@ -355,6 +460,15 @@ class Baser(dbing.LMDBer):
 
         kevers (dict): Kever instances indexed by identifier prefix qb64
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        woke (dict): of OrderedSets of escrow keys indexed by escrow name, such as
+            "ooes", of escrow entries whose dependencies have been satisfied
+            since last escrow processing pass so are worth reprocessing
+        waits (dict): of OrderedSets of (escrow name, escrow key) duples indexed
+            by identifier prefix qb64b of escrow entries waiting on events of
+            that prefix such as delegated events waiting on delegator's seal
+        waited (dict): of OrderedSets of identifier prefixes qb64b indexed by
+            (escrow name, escrow key) duple, reverse of .waits so entries are
+            dropped from .waits when their escrow entries are removed
 
         .evts is named sub DB whose values are serialized events
             dgKey
@@ -510,11 +624,23 @@ class Baser(dbing.LMDBer):
             DB is keyed by identifer prefix plus sequence number of key event
             More than one value per DB key is allowed
 
+        .exps is named sub DB of escrow expiry index that maps escrow name,
+            escrow datetime and escrow key to escrowed vals so that stale
+            escrow entries are found by range scan instead of a full walk.
+            name|dts|key
+            Values are escrowed vals without insertion ordering proem
+            More than one value per DB key is allowed
+
         .fons is named subDB instance of MatterSuber that maps
             (prefix, digest) e.g. dgKey to fn value (first seen ordinal number) of
             the associated event. So one can lookup event digest, get its fn here
             and then use fn to fetch event by fn from .fels.
 
+        .seals is named subDB instance of CatCesrSuber that maps an anchored
+            event seal keyed by (anchoring pre, seal i, seal s, seal d) to the
+            (Seqner, Saider) of the anchoring event in the KEL of anchoring pre.
+            So one can find the anchoring event of a seal without a KEL walk.
+
         .states (stts) is named subDB instance of SerderSuber that maps a prefix
             to the latest keystate for that prefix. Used by ._kevers.db for read
             through cache of key state to reload kevers in memory
@@ -593,6 +719,9 @@ class Baser(dbing.LMDBer):
 
 
     """
+    KeverCapacity = 16384  # max kevers held in memory, None means unbounded
+    EscrowsIndexed = "__exps__"  # .hbys key of datetime escrows were indexed in .exps
+    ReindexChunk = 1024  # max escrow entries read per read transaction when reindexing
 
     def __init__(self, headDirPath=None, reopen=False, **kwa):
         """
@@ -613,8 +742,11 @@ class Baser(dbing.LMDBer):
 
         """
         self.prefixes = oset()
-        self._kevers = dbdict()
+        self._kevers = dbdict(capacity=self.KeverCapacity)
         self._kevers.db = self  # assign db for read thorugh cache of kevers
+        self.woke = dict()  # escrow keys woken since last escrow pass by escrow name
+        self.waits = dict()  # (escrow name, escrow key) duples by prefix depended on
+        self.waited = dict()  # prefixes depended on by (escrow name, escrow key)
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -666,9 +798,13 @@ class Baser(dbing.LMDBer):
         self.dels = self.env.open_db(key=b'dels.', dupsort=True)
         self.ldes = self.env.open_db(key=b'ldes.', dupsort=True)
         self.qnfs = self.env.open_db(key=b'qnfs.', dupsort=True)
+        self.exps = self.env.open_db(key=b'exps.', dupsort=True)
 
         # events as ordered by first seen ordinals
         self.fons = subing.CesrSuber(db=self, subkey='fons.', klas=coring.Seqner)
+        # anchoring events of seals keyed by (anchoring pre, seal i, seal s, seal d)
+        self.seals = subing.CatCesrSuber(db=self, subkey='seals.',
+                                         klas=(coring.Seqner, coring.Saider))
         # Kever state
         self.states = subing.SerderSuber(db=self, subkey='stts.')  # key states
         self.wits = subing.CesrIoSetSuber(db=self, subkey="wits.", klas=coring.Prefixer)
@@ -821,6 +957,13 @@ class Baser(dbing.LMDBer):
         self.cfld = subing.Suber(db=self,
                                  subkey="cfld.")
 
+        # Inverted index of contact field values to prefixes. Keyed by field/value
+        # with unit separator since values may contain any printable char.
+        # Values longer than key space are truncated, dup vals are prefixes
+        self.cidx = subing.DupSuber(db=self,
+                                    subkey="cidx.",
+                                    sep="\x1f")
+
         # Global settings for the Habery environment
         self.hbys = subing.Suber(db=self, subkey='hbys.')
         # Signed contact data, keys by prefix
@@ -834,6 +977,10 @@ class Baser(dbing.LMDBer):
 
         self.reload()
 
+        if not self.readonly and self.hbys.get(self.EscrowsIndexed) is None:
+            self.reindexEscrows()  # one time migration of escrows from before .exps
+            self.hbys.pin(self.EscrowsIndexed, helping.nowIso8601())
+
         return self.env
 
     def reload(self):
@@ -959,6 +1106,99 @@ class Baser(dbing.LMDBer):
                 continue  # skip this event
             yield msg
 
+    def clonePreChunkIter(self, pre, fn=0, size=None):
+        """
+        Returns generator of chunks of the replay of .clonePreIter for the
+        identifier prefix pre starting at first seen order number, fn. Every
+        chunk but the last holds at least size bytes. Each chunk is read in its
+        own read transaction that is closed before the chunk is yielded, the
+        next one resuming at the fn after the last event read, so a slow
+        consumer such as an HTTP response does not hold a read transaction open.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix
+            fn (int): first seen ordering number to start replay at
+            size (int): minimum bytes per chunk, defaults to ChunkSize
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+        size = size if size is not None else ChunkSize
+
+        while True:
+            chunk = bytearray()
+            last = None
+            items = self.getFelItemPreIter(pre, fn=fn)
+            try:
+                for last, dig in items:
+                    try:
+                        chunk.extend(self.cloneEvtMsg(pre=pre, fn=last, dig=dig))
+                    except Exception:
+                        continue  # skip this event
+                    if len(chunk) >= size:
+                        break
+            finally:
+                items.close()  # end read transaction before chunk is yielded
+
+            if chunk:
+                yield chunk
+            if last is None or len(chunk) < size:  # end of FEL
+                return
+            fn = last + 1
+
+    def knownFn(self, pre, eid):
+        """
+        Returns first seen ordinal of the latest event of identifier prefix pre
+        that remote identifier eid is known to hold or None if there is no evidence
+        that eid holds any event of pre.
+
+        Evidence is an indexed witness signature from eid on an event for which eid
+        was a witness, a non-indexed receipt from eid on an event, or a key state
+        notice from eid for pre. Any of these imply eid holds every prior event.
+
+        Parameters:
+            pre (str): qb64 identifier prefix of KEL
+            eid (str): qb64 identifier prefix of remote holder of KEL
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode("utf-8")
+        eidb = eid.encode("utf-8")
+
+        known = None
+        if (saider := self.knas.get(keys=(pre, eid))) is not None:
+            if (seqner := self.fons.get(keys=(pre, saider.qb64))) is not None:
+                known = seqner.sn
+
+        # Scan backwards from latest event and stop at first proof. Witness list
+        # of an event is only known once its establishment event is reached so
+        # events since then are pending until it is.
+        found = None  # latest fn with receipt from eid
+        pending = []  # (fn, dgkey) latest first above found with unknown witness list
+        for fn, dig in self.getFelItemPreBackIter(pre.encode("utf-8")):
+            if known is not None and fn <= known and not pending:
+                break  # nothing later than known left to prove
+
+            dgkey = dbing.dgKey(pre, dig)
+            if found is None and (known is None or fn > known):
+                if any(bytes(couple).startswith(eidb) for couple in self.getRctsIter(dgkey)):
+                    found = fn
+                else:
+                    pending.append((fn, dgkey))
+
+            if ewits := self.wits.get(keys=dgkey):  # establishment event so witness list changes
+                wits = [prefixer.qb64 for prefixer in ewits]
+                if eid in wits:
+                    index = wits.index(eid)
+                    for pfn, pkey in pending:
+                        if any(coring.Siger(qb64b=bytes(wig)).index == index
+                               for wig in self.getWigsIter(pkey)):
+                            return pfn
+                pending = []
+
+            if found is not None and not pending:
+                return found
+
+        return found if found is not None else known
+
     def cloneAllPreIter(self, key=b''):
         """
         Returns iterator of first seen event messages with attachments for all
@@ -1050,31 +1290,323 @@ class Baser(dbing.LMDBer):
         msg.extend(atc)
         return msg
 
+    @staticmethod
+    def _sealKeys(pre, seal):
+        """
+        Returns keys tuple into .seals for event seal dict seal anchored in KEL
+        of pre or None when seal is not an event seal with i, s, d fields.
+        Seal sn s may be hex str as in anchored seals or int.
+        """
+        if not isinstance(seal, dict) or not all(k in seal for k in ("i", "s", "d")):
+            return None
+        if not isinstance(seal["i"], str) or not isinstance(seal["d"], str):
+            return None
+        try:
+            sn = seal["s"]
+            sn = int(sn, 16) if isinstance(sn, str) else int(sn)
+            return (pre, seal["i"], coring.Seqner(sn=sn).qb64, seal["d"])
+        except (TypeError, ValueError):  # not an event seal sn
+            return None
+
+    def indexSeals(self, serder):
+        """
+        Adds event seals anchored in the "a" field of event serder to .seals
+        so .findAnchoringEvent looks up the anchoring event directly.
+        The first anchoring event of a seal in a KEL is kept.
+        Returns count of seals written.
+
+        Parameters:
+            serder (Serder): accepted key event
+        """
+        count = 0
+        for seal in serder.ked.get("a", []):
+            keys = self._sealKeys(serder.pre, seal)
+            if keys is not None and self.seals.put(keys=keys,
+                                                   val=(coring.Seqner(sn=serder.sn),
+                                                        serder.saider)):
+                count += 1
+        return count
+
+    def reindexSeals(self):
+        """
+        Backfills .seals from all accepted events in every KEL in database.
+        Used once on databases whose KELs were logged before .seals existed.
+        Returns count of events indexed.
+        """
+        count = 0
+        with self.transact():
+            for pre, fn, dig in self.getFelItemAllPreIter():
+                raw = self.getEvt(dbing.dgKey(pre, dig))
+                if raw is None:
+                    continue
+                serder = coring.Serder(raw=bytes(raw))
+                if self.indexSeals(serder):
+                    count += 1
+        return count
+
     def findAnchoringEvent(self, pre, anchor):
         """
-        Search through a KEL for the event that contains a specific anchor.
-        Returns the Serder of the first event with the anchor, None if not found
+        Looks up the event in a KEL that contains a specific anchor in .seals.
+        Returns the Serder of the first event with the anchor if it is fully
+        witnessed, None if not found
 
         Parameters:
             pre is qb64 identifier of the KEL to search
             anchor is dict of anchor to find
 
         """
-        for evt in self.clonePreIter(pre=pre):
-            srdr = coring.Serder(raw=evt)
-            if "a" in srdr.ked:
-                ancs = srdr.ked["a"]
-                for anc in ancs:
-                    spre = anc["i"]
-                    ssn = int(anc["s"])
-                    sdig = anc["d"]
+        keys = self._sealKeys(pre, anchor)
+        if keys is None or (couple := self.seals.get(keys=keys)) is None:
+            return None
 
-                    if spre == anchor["i"] and ssn == int(anchor["s"]) \
-                            and anchor["d"] == sdig and self.fullyWitnessed(srdr):
-                        return srdr
+        seqner, saider = couple
+        raw = self.getEvt(dbing.dgKey(pre, saider.qb64b))
+        if raw is None:
+            return None
+        srdr = coring.Serder(raw=bytes(raw))
+        if self.fullyWitnessed(srdr):
+            return srdr
 
         return None
 
+    def wakeEscrow(self, name, key):
+        """
+        Wakes escrow entries at key of escrow name so that next escrow
+        processing pass of woken entries reprocesses them.
+
+        Parameters:
+            name (str): escrow name such as "ooes"
+            key (bytes): escrow key such as snKey(pre, sn)
+        """
+        self.woke.setdefault(name, oset()).add(key)
+
+    def waitEscrow(self, pre, name, key):
+        """
+        Registers escrow entries at key of escrow name as waiting on events of
+        identifier prefix pre so they are woken when such an event is accepted.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix depended on
+            name (str): escrow name such as "pses"
+            key (bytes): escrow key such as snKey(pre, sn)
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        self.waits.setdefault(pre, oset()).add((name, key))
+        self.waited.setdefault((name, key), oset()).add(pre)
+
+    def unwaitEscrow(self, name, key):
+        """
+        Drops escrow entries at key of escrow name from .waits once no entry
+        remains at key so waits on prefixes that never appear do not accumulate.
+
+        Parameters:
+            name (str): escrow name such as "pses"
+            key (bytes): escrow key such as snKey(pre, sn)
+        """
+        if (name, key) not in self.waited:
+            return
+
+        db = getattr(self, name)
+        if self._txn is not None:  # read pending deletes of shared write transaction
+            if self._txn.cursor(db=db).set_key(key):
+                return
+        elif self.cntIoVals(db, key):
+            return
+
+        for pre in self.waited.pop((name, key)):
+            if (waits := self.waits.get(pre)) is not None:
+                waits.discard((name, key))
+                if not waits:
+                    del self.waits[pre]
+
+    def wakeWaits(self, pre):
+        """
+        Wakes escrow entries registered by .waitEscrow as waiting on events of
+        identifier prefix pre.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        for name, key in self.waits.pop(pre, ()):
+            if (pres := self.waited.get((name, key))) is not None:
+                pres.discard(pre)
+                if not pres:
+                    del self.waited[(name, key)]
+            self.wakeEscrow(name, key)
+
+    def wakeEvent(self, pre, sn):
+        """
+        Wakes escrow entries that depend on accepted event at pre, sn. These are
+        out of order event at sn + 1, receipts of, partial escrows of and
+        duplicitous escrows of event at sn, and waits on events of pre.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix of accepted event
+            sn (int): sequence number of accepted event
+        """
+        self.wakeEscrow("ooes", dbing.snKey(pre, sn + 1))
+        key = dbing.snKey(pre, sn)
+        for name in ("uwes", "ures", "vres", "pwes", "pses", "ldes"):
+            self.wakeEscrow(name, key)
+        self.wakeWaits(pre)
+
+    def wakeReceipt(self, pre, sn):
+        """
+        Wakes escrow entries that depend on witness receipts of event at pre, sn.
+        These are partially witnessed escrows of event at sn and waits on
+        events of pre such as queries waiting for full witnessing.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix of receipted event
+            sn (int): sequence number of receipted event
+        """
+        self.wakeEscrow("pwes", dbing.snKey(pre, sn))
+        self.wakeWaits(pre)
+
+    def popWoke(self, name):
+        """
+        Returns OrderedSet of woken escrow keys of escrow name and clears them
+        so that entries woken while reprocessing these are kept for next pass.
+
+        Parameters:
+            name (str): escrow name such as "ooes"
+        """
+        return self.woke.pop(name, oset())
+
+    def indexEscrow(self, name, key, val, dts):
+        """
+        Adds escrowed val at key of escrow name to escrow expiry index .exps
+        under escrow datetime dts so .pruneEscrows finds it once stale.
+
+        Parameters:
+            name (str): escrow name such as "ooes"
+            key (bytes): escrow key such as snKey(pre, sn)
+            val (bytes): escrowed val without insertion ordering proem
+            dts (str | bytes): ISO-8601 datetime of escrow from .nowIso8601
+        """
+        if hasattr(dts, "encode"):
+            dts = dts.encode("utf-8")
+        return self.addVal(self.exps, b'%s|%s|%s' % (name.encode("utf-8"), dts, key), val)
+
+    def reindexEscrows(self, now=None):
+        """
+        Backfills escrow expiry index .exps for escrow entries that have no
+        index row such as entries escrowed before .exps existed. Each entry is
+        indexed under the dts of its escrowed event. Entries without a dts are
+        given dts now so they become stale one timeout later.
+        Run once by .reopen on databases whose .hbys lacks .EscrowsIndexed.
+        Reads at most .ReindexChunk entries per read transaction.
+        Returns count of escrow entries indexed.
+
+        Parameters:
+            now (str): ISO-8601 datetime for entries without dts, defaults to
+                helping.nowIso8601()
+        """
+        now = (now if now is not None else helping.nowIso8601()).encode("utf-8")
+        count = 0
+        for name in ("ooes", "pses", "pwes", "uwes", "ures", "vres", "ldes", "qnfs"):
+            for key, val in self._escrowItemIter(getattr(self, name)):
+                if name == "qnfs":  # qnfs is keyed by dgkey already
+                    dgkey = key
+                else:  # escrowed val starts with dig of escrowed event
+                    pre, _ = dbing.splitKeySN(key)
+                    dgkey = dbing.dgKey(pre, coring.Diger(qb64b=val).qb64b)
+                if (dts := self.getDts(dgkey)) is None:
+                    dts = now
+                    self.putDts(dgkey, dts)
+                if self.indexEscrow(name, key, val, bytes(dts)):  # False when indexed
+                    count += 1
+
+        return count
+
+    def _escrowItemIter(self, db):
+        """
+        Returns iterator of (key, val) of all entries of escrow db with
+        insertion ordering proem stripped from val. Reads .ReindexChunk entries
+        at a time each in its own read transaction so no read transaction is
+        held open while the caller writes. Resumes at last key read skipping
+        its dups already returned.
+
+        Parameters:
+            db (lmdb._Database): escrow sub db with dupsort==True
+        """
+        resume = b''
+        seen = set()  # vals already returned at key resume
+        while True:
+            items = []
+            for key, val in self.getAllItemIter(db, key=resume, split=False):
+                val = bytes(val[33:])  # strip insertion ordering proem
+                if key == resume and val in seen:
+                    continue
+                items.append((key, val))
+                if len(items) >= self.ReindexChunk:
+                    break
+
+            yield from items
+
+            if len(items) < self.ReindexChunk:
+                return
+            last = items[-1][0]
+            if last != resume:
+                seen = set()
+                resume = last
+            seen.update(val for key, val in items if key == last)
+
+    def pruneEscrows(self, now=None, timeouts=None):
+        """
+        Removes stale escrow entries whose escrow datetime is older than the
+        timeout of their escrow. Range scans the escrow expiry index .exps up
+        to the cutoff of each escrow so only stale entries are visited.
+        Returns count of escrow entries removed.
+
+        Parameters:
+            now (datetime.datetime): current time, defaults to helping.nowUTC()
+            timeouts (dict): seconds of timeout keyed by escrow name,
+                defaults to Kevery timeouts of every indexed escrow
+        """
+        now = now if now is not None else helping.nowUTC()
+        if timeouts is None:
+            timeouts = dict(ooes=eventing.Kevery.TimeoutOOE,
+                            pses=eventing.Kevery.TimeoutPSE,
+                            pwes=eventing.Kevery.TimeoutPWE,
+                            uwes=eventing.Kevery.TimeoutUWE,
+                            ures=eventing.Kevery.TimeoutURE,
+                            vres=eventing.Kevery.TimeoutVRE,
+                            ldes=eventing.Kevery.TimeoutLDE,
+                            qnfs=eventing.Kevery.TimeoutQNF)
+
+        count = 0
+        for name, timeout in timeouts.items():
+            top = b'%s|' % name.encode("utf-8")
+            cutoff = top + helping.toIso8601(now - datetime.timedelta(seconds=timeout)).encode("utf-8")
+            stale = []
+            for ikey, val in self.getTopItemIter(self.exps, top):
+                if ikey >= cutoff:  # index is in datetime order so rest is fresh
+                    break
+                stale.append((ikey, bytes(val)))
+
+            if not stale:
+                continue
+
+            db = getattr(self, name)
+            with self.transact():  # unescrow all stale entries at once
+                for ikey, val in stale:
+                    key = ikey.split(b'|', 2)[2]
+                    if self.delIoVal(db, key, val):
+                        count += 1
+                        if name == "pses":  # remove partial delegation of event
+                            pre, _ = dbing.splitKeySN(key)
+                            self.delPde(dbing.dgKey(pre, val))
+                        logger.info("Kevery unescrow error: Stale event escrow "
+                                    " at %s key = %s.\n", name, key)
+                    self.delVals(self.exps, ikey, val)
+                    self.unwaitEscrow(name, key)
+
+        return count
+
     def fullyWitnessed(self, serder):
         """ Verify the witness threshold on the event
 
@@ -1197,6 +1729,19 @@ class Baser(dbing.LMDBer):
         """
         return self.getAllOrdItemPreIter(db=self.fels, pre=pre, on=fn)
 
+    def getFelItemPreBackIter(self, pre, fn=None):
+        """
+        Returns iterator of all (fn, dig) duples in reverse first seen order
+        for all events with same prefix, pre, in database. Latest first.
+
+        Raises StopIteration Error when empty.
+
+        Parameters:
+            pre is bytes of itdentifier prefix
+            fn is int fn to resume backwards replay. None means start at latest
+        """
+        return self.getAllOrdItemPreBackIter(db=self.fels, pre=pre, on=fn)
+
     def getFelItemAllPreIter(self, key=b''):
         """
         Returns iterator of all (pre, fn, dig) triples in first seen order for
@@ -1716,7 +2261,9 @@ class Baser(dbing.LMDBer):
         Deletes all values at key in db.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.vres, key)
+        result = self.delIoVals(self.vres, key)
+        self.unwaitEscrow("vres", key)
+        return result
 
     def delVre(self, key, val):
         """
@@ -1728,7 +2275,9 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.vres, key, val)
+        result = self.delIoVal(self.vres, key, val)
+        self.unwaitEscrow("vres", key)
+        return result
 
     def putKes(self, key, vals):
         """
@@ -1929,7 +2478,9 @@ class Baser(dbing.LMDBer):
         Deletes all values at key in db.
         Returns True If key  exists in db Else False
         """
-        return self.delIoVals(self.pses, key)
+        result = self.delIoVals(self.pses, key)
+        self.unwaitEscrow("pses", key)
+        return result
 
     def delPse(self, key, val):
         """
@@ -1941,7 +2492,9 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.pses, key, val)
+        result = self.delIoVal(self.pses, key, val)
+        self.unwaitEscrow("pses", key)
+        return result
 
     def putPde(self, key, val):
         """
@@ -2352,7 +2905,9 @@ class Baser(dbing.LMDBer):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.qnfs, key)
+        result = self.delIoVals(self.qnfs, key)
+        self.unwaitEscrow("qnfs", key)
+        return result
 
     def delQnf(self, key, val):
         """
@@ -2365,7 +2920,9 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.qnfs, key, val)
+        result = self.delIoVal(self.qnfs, key, val)
+        self.unwaitEscrow("qnfs", key)
+        return result
 
     def putDes(self, key, vals):
         """
@@ -2593,3 +3150,36 @@ class BaserDoer(doing.Doer):
     def exit(self):
         """"""
         self.baser.close(clear=self.baser.temp)
+
+
+class PruneDoer(doing.Doer):
+    """
+    Baser escrow pruning Doer that periodically removes stale escrow entries
+    via the escrow expiry index so escrow processing never walks them.
+
+    Attributes:
+        .baser is Baser instance
+        .timeouts (dict): escrow timeouts in seconds keyed by escrow name or
+            None for Kevery defaults
+
+    """
+
+    def __init__(self, baser, timeouts=None, tock=60.0, **kwa):
+        """
+        Inherited Parameters:
+           tymist is Tymist instance
+           tock is float seconds between prunes
+
+        Parameters:
+           baser is Baser instance
+           timeouts (dict): escrow timeouts in seconds keyed by escrow name
+        """
+        super(PruneDoer, self).__init__(tock=tock, **kwa)
+        self.baser = baser
+        self.timeouts = timeouts
+
+    def recur(self, tyme):
+        """ Prune stale escrow entries each run """
+        if self.baser.opened:
+            self.baser.pruneEscrows(timeouts=self.timeouts)
+        return False  # never done
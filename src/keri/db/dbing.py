@@ -346,6 +346,7 @@ class LMDBer(filing.Filer):
         """
         self.env = None
         self.readonly = True if readonly else False
+        self._txn = None  # active shared write transaction if any see .transact
         super(LMDBer, self).__init__(**kwa)
 
 
@@ -399,10 +400,58 @@ class LMDBer(filing.Filer):
                 pass
 
         self.env = None
+        self._txn = None
 
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @contextmanager
+    def transact(self):
+        """
+        Context manager that opens one LMDB write transaction shared by every
+        write made through this LMDBer, including its Suber and Komer sub dbs,
+        inside the with block. The writes are committed together when the
+        block exits normally and are all aborted when it raises so readers
+        never see a partially written set of writes. Nested calls join the
+        outermost transaction.
+
+        Each write method runs in a child transaction of the shared one so
+        that it may use its own named sub db. Reads are not made in the shared
+        transaction so they see the state as of the last commit, not the
+        pending writes inside the with block.
+
+        Usage:
+            with db.transact():
+                db.putEvt(key, raw)
+                db.addKe(snkey, dig)
+
+        """
+        if self._txn is not None:  # nested so join outer transaction
+            yield self._txn
+            return
+
+        with self.env.begin(write=True, buffers=True) as txn:
+            self._txn = txn
+            try:
+                yield txn
+            finally:
+                self._txn = None
+
+
+    def _begin(self, db, write=False):
+        """
+        Returns transaction on db. When write and a shared write transaction
+        is active from .transact then returns child transaction of it.
+
+        Parameters:
+            db is opened named sub db
+            write (bool): True means write transaction False means read only
+        """
+        if write and self._txn is not None:
+            return self.env.begin(db=db, write=True, buffers=True, parent=self._txn)
+        return self.env.begin(db=db, write=write, buffers=True)
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     def putVal(self, db, key, val):
         """
@@ -416,7 +465,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.put(key, val, overwrite=False))
 
 
@@ -431,7 +480,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.put(key, val))
 
 
@@ -458,7 +507,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.delete(key))
 
 
@@ -564,7 +613,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
@@ -599,7 +648,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(key):  # max is past end of database
@@ -659,6 +708,39 @@ class LMDBer(filing.Filer):
                 yield (cn, val)  # (on, dig) of event
 
 
+    def getAllOrdItemPreBackIter(self, db, pre, on=None):
+        """
+        Returns iterator of duple item, (on, dig), at each key over all ordinal
+        numbered keys with same prefix, pre, in db in reverse order. Values are
+        sorted by onKey(pre, on) where on is ordinal number int, latest first.
+        Returned items are duples of (on, dig) where on is ordinal number int
+        and dig is event digest for lookup in .evts sub db.
+
+        Raises StopIteration Error when empty.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            pre is bytes of itdentifier prefix
+            on is int ordinal number to resume backwards replay, None means
+                start at latest
+        """
+        with self.env.begin(db=db, write=False, buffers=True) as txn:
+            cursor = txn.cursor()
+            # key just after last entry at or before on for pre, '/' follows '.'
+            key = onKey(pre, on + 1) if on is not None else pre + b'/'
+            if cursor.set_range(key):  # moves to val at key >= key
+                if not cursor.prev():  # so back up to val at key < key
+                    return  # no values before key
+            elif not cursor.last():  # no key >= key so start at last
+                return  # no values empty db
+
+            for key, val in cursor.iterprev():  # get key, val at cursor
+                cpre, cn = splitKeyON(key)
+                if cpre != pre:  # past first event for pre
+                    break  # done
+                yield (cn, val)  # (on, dig) of event
+
+
     def getAllOrdItemAllPreIter(self, db, key=b''):
         """
         Returns iterator of triple item, (pre, on, dig), at each key over all
@@ -711,7 +793,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -751,7 +833,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -790,7 +872,7 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
@@ -814,7 +896,7 @@ class LMDBer(filing.Filer):
         """
         ion = 0  # default is zeroth insertion at key
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -986,7 +1068,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1029,7 +1111,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1107,7 +1189,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return txn.delete(iokey)
 
 
@@ -1128,7 +1210,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = True
             for val in vals:
                 result = result and txn.put(key, val, dupdata=True)
@@ -1154,10 +1236,13 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        dups = set(self.getVals(db, key))  #get preexisting dups if any
-        result = False
-        if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
+            dups = set()
+            cursor = txn.cursor()
+            if cursor.set_key(key):  # get preexisting dups if any
+                dups = set(bytes(dup) for dup in cursor.iternext_dup())
+            result = False
+            if val not in dups:
                 result = txn.put(key, val, dupdata=True)
         return result
 
@@ -1202,7 +1287,7 @@ class LMDBer(filing.Filer):
             return val
 
 
-    def getValsIter(self, db, key):
+    def getValsIter(self, db, key, after=b''):
         """
         Return iterator of all dup values at key in db
         Raises StopIteration error when done or if empty
@@ -1212,14 +1297,34 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
+            after is bytes of dup value to start after when not empty so
+                iteration may resume from last value returned
         """
         with self.env.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
-            vals = []
-            if cursor.set_key(key):  # moves to first_dup
+            if after:
+                if not cursor.set_range_dup(key, after):  # first dup >= after
+                    return
+                if bytes(cursor.value()) == after and not cursor.next_dup():
+                    return
+                yield from cursor.iternext_dup()
+            elif cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
                     yield val
 
+    def hasVal(self, db, key, val):
+        """
+        Returns True if val is one of the dup values at key in db else False
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            key is bytes of key within sub db's keyspace
+            val is bytes of dup value
+        """
+        with self.env.begin(db=db, write=False, buffers=True) as txn:
+            cursor = txn.cursor()
+            return cursor.set_key_dup(key, val)
+
 
     def cntVals(self, db, key):
         """
@@ -1274,7 +1379,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.delete(key, val))
 
 
@@ -1305,11 +1410,14 @@ class LMDBer(filing.Filer):
         """
 
         result = False
-        dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
+            dups = set()
             cursor = txn.cursor()
             if cursor.set_key(key): # move to key if any
+                # get preexisting dups if any in same txn so sees pending writes
+                dups = set(bytes(val[33:]) for val in cursor.iternext_dup())
+                cursor.set_key(key)
                 if cursor.last_dup(): # move to last dup
                     idx = 1 + int(bytes(cursor.value()[:32]), 16)  # get last index as int
 
@@ -1494,7 +1602,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.delete(key))
 
 
@@ -1527,7 +1635,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()
             if cursor.set_key(key):  # move to first_dup
                 for proval in cursor.iternext_dup():  #  value with proem
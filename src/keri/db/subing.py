@@ -1358,7 +1358,7 @@ class DupSuber(SuberBase):
         return self._des(val) if val is not None else val
 
 
-    def getIter(self, keys: Union[str, Iterable]):
+    def getIter(self, keys: Union[str, Iterable], after: Union[str, bytes]=b''):
         """
         Gets dup vals iterator at key made from keys
 
@@ -1366,12 +1366,14 @@ class DupSuber(SuberBase):
 
         Parameters:
             keys (tuple): of key strs to be combined in order to form key
+            after (Union[str, bytes]): dup val to start after when not empty
 
         Returns:
             iterator:  vals each of str. Raises StopIteration when done
 
         """
-        for val in self.db.getValsIter(db=self.sdb, key=self._tokey(keys)):
+        for val in self.db.getValsIter(db=self.sdb, key=self._tokey(keys),
+                                       after=self._ser(after)):
             yield self._des(val)
 
 
@@ -1385,6 +1387,17 @@ class DupSuber(SuberBase):
         return (self.db.cntVals(db=self.sdb, key=self._tokey(keys)))
 
 
+    def has(self, keys: Union[str, Iterable], val: Union[bytes, str]):
+        """
+        Returns True if val is a dup value at key made from keys, False otherwise
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+            val (Union[str, bytes]): dup value
+        """
+        return (self.db.hasVal(db=self.sdb, key=self._tokey(keys), val=self._ser(val)))
+
+
     def rem(self, keys: Union[str, Iterable], val=b''):
         """
         Removes entry at keys
@@ -1521,7 +1534,7 @@ class CesrDupSuber(DupSuber):
 
 
 
-    def getIter(self, keys: Union[str, Iterable]):
+    def getIter(self, keys: Union[str, Iterable], after: Union[str, bytes]=b''):
         """
         Gets dup vals iterator at key made from keys
 
@@ -1529,14 +1542,27 @@ class CesrDupSuber(DupSuber):
 
         Parameters:
             keys (tuple): of key strs to be combined in order to form key
+            after (Union[str, bytes]): qb64 dup val to start after when not empty
 
         Returns:
             iterator:  vals each of self.klas. Raises StopIteration when done
 
         """
-        for val in self.db.getValsIter(db=self.sdb, key=self._tokey(keys)):
+        if hasattr(after, "encode"):
+            after = after.encode("utf-8")
+        for val in self.db.getValsIter(db=self.sdb, key=self._tokey(keys), after=after):
             yield self.klas(qb64b=bytes(val))
 
+    def has(self, keys: Union[str, Iterable], val: coring.Matter):
+        """
+        Returns True if val is a dup value at key made from keys, False otherwise
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+            val (coring.Matter): dup value
+        """
+        return (self.db.hasVal(db=self.sdb, key=self._tokey(keys), val=val.qb64b))
+
 
     def rem(self, keys: Union[str, Iterable], val=None):
         """
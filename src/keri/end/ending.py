@@ -5,6 +5,8 @@ keri.end.ending module
 ReST API endpoints
 
 """
+import heapq
+import itertools
 import json
 import os
 import re
@@ -399,19 +401,22 @@ class OOBIEnd:
 
     Attributes:
         .hby (Habery): database access
+        .size (int): minimum bytes per chunk of streamed replies
 
     """
 
-    def __init__(self, hby: habbing.Habery, default=None):
+    def __init__(self, hby: habbing.Habery, default=None, size=None):
         """  End point for responding to OOBIs
 
         Parameters:
             hby (Habery): database environment
             default (str) qb64 AID of the 'self' of the node for
+            size (int): minimum bytes per chunk of streamed replies, defaults to basing.ChunkSize
 
         """
         self.hby = hby
         self.default = default
+        self.size = size
 
     def on_get(self, req, rep, aid=None, role=None, eid=None):
         """  GET endoint for OOBI resource
@@ -452,12 +457,15 @@ class OOBIEnd:
         if eid:
             eids.append(eid)
 
-        msgs = hab.replyToOobi(aid=aid, role=role, eids=eids)
-        if msgs:
+        chunks = hab.replyToOobiIter(aid=aid, role=role, eids=eids, size=self.size)
+        if (chunk := next(chunks, None)) is not None:
             rep.status = falcon.HTTP_200  # This is the default status
             rep.set_header(OOBI_AID_HEADER, aid)
             rep.content_type = "application/json+cesr"
-            rep.data = bytes(msgs)
+            if (more := next(chunks, None)) is None:  # fits in one chunk so send with content length
+                rep.data = bytes(chunk)
+            else:  # stream a long KEL one chunk at a time instead of as one body
+                rep.stream = (bytes(c) for c in itertools.chain([chunk, more], chunks))
         else:
             rep.status = falcon.HTTP_NOT_FOUND
 
@@ -549,14 +557,41 @@ def setup(name="who", temp=False, tymth=None, sith=None, count=1,
 class Oobiery(doing.DoDoer):
     """ Resolver for OOBIs
 
+    Reads the .oobis table like an escrow, resolving at most .concurrency OOBIs at a time.
+    Requests to the same host share one keep-alive client, an OOBI whose CID is already in
+    flight waits for that request to finish, and OOBIs that are not found or time out are
+    retried with exponential backoff.  Response bodies are parsed a bounded number of
+    messages per tock so one large KEL does not starve the other responses.
+
+    Attributes:
+        concurrency (int): maximum number of OOBI requests in flight
+        batch (int): maximum number of .oobis entries examined per pass
+        chunk (int): maximum number of parser steps per tock
+        clients (dict): (hostname, port) keyed (client, clientDoer, tyme last used) pool
+        flights (dict): url keyed (host key, OobiRecord, tyme requested) of requests in flight
+        cids (dict): cid keyed url of the request in flight for that CID
+        retries (dict): url keyed number of failed attempts
+        backoffs (list): heap of (tyme due, url) of OOBIs waiting in .eoobi
+
     """
 
-    def __init__(self, hby, cues=None):
+    Concurrency = 16  # default maximum number of requests in flight
+    Batch = 64  # default maximum number of oobis entries examined per pass
+    Chunk = 64  # default maximum number of parser steps per tock
+    Timeout = 30.0  # seconds to wait for a response before retrying
+    Linger = 2.0  # seconds an idle host client is kept open for reuse
+    RetryDelay = 10.0  # seconds before first retry
+    RetryMax = 600.0  # ceiling on retry backoff in seconds
+
+    def __init__(self, hby, cues=None, concurrency=None, batch=None, chunk=None):
         """  DoDoer to handle the request and parsing of OOBIs
 
         Parameters:
             hby (Habery): database environment
             cues (decking.Deck): outbound cues from processing oobis
+            concurrency (int): maximum number of OOBI requests in flight
+            batch (int): maximum number of .oobis entries examined per pass
+            chunk (int): maximum number of parser steps per tock
         """
 
         self.hby = hby
@@ -568,15 +603,25 @@ class Oobiery(doing.DoDoer):
         self.parser = parsing.Parser(framed=True, kvy=kvy, rvy=rvy)
 
         self.cues = cues if cues is not None else decking.Deck()
+        self.concurrency = concurrency if concurrency is not None else self.Concurrency
+        self.batch = batch if batch is not None else self.Batch
+        self.chunk = chunk if chunk is not None else self.Chunk
+
         self.clients = dict()
+        self.flights = dict()
+        self.cids = dict()
+        self.retries = dict()
+        self.backoffs = []
+        self.parsings = decking.Deck()
 
         super(Oobiery, self).__init__(doers=[doing.doify(self.scoobiDo), doing.doify(self.clientsDo),
-                                             doing.doify(self.retryDo)])
+                                             doing.doify(self.parseDo), doing.doify(self.retryDo)])
 
     def scoobiDo(self, tymth, tock=0.0):
         """ Scooby-Dooby-Doo!
 
-        Process OOBI URLs by requesting from the endpoint and parsing the results
+        Process OOBI URLs by requesting from the endpoint and parsing the results.  Only reads the
+        .oobis table while there is room for more requests in flight.
 
         Parameters:
             tymth (function): injected function wrapper closure returned by .tymen() of
@@ -588,52 +633,87 @@ class Oobiery(doing.DoDoer):
         self.tock = tock
         yield self.tock
 
+        # requests left in coobi by a previous run have no client so start them over
+        for (url, ), obr in self.hby.db.coobi.getItemIter():
+            self.hby.db.coobi.rem(keys=(url,))
+            self.hby.db.oobis.pin(keys=(url,), val=obr)
+
         while True:
             # There should be only one OOBIERY that minds the OOBI table, this should read from the table
             # like an escrow
-            for (url, ), obr in self.hby.db.oobis.getItemIter():
-                try:
-                    purl = parse.urlparse(url)
+            room = self.concurrency - len(self.flights)
+            if room > 0:
+                pending = []
+                invalids = []  # removed so they do not starve later OOBIs
+                for i, ((url, ), obr) in enumerate(self.hby.db.oobis.getItemIter()):
+                    if len(pending) >= room or i >= self.batch:
+                        break
+
+                    if url in self.flights:
+                        continue
+
+                    try:
+                        purl = parse.urlparse(url)
+                        if not self.prepare(purl, obr):
+                            raise ValueError(f"unrecognized OOBI URL {url}")
+
+                    except ValueError as ex:
+                        print("error requesting invalid OOBI URL {}", url)
+                        invalids.append(url)
+                        continue
+
+                    if obr.cid and obr.cid in self.cids:  # same CID in flight so wait for it
+                        continue
+
+                    pending.append((url, purl, obr))
+
+                for url, purl, obr in pending:
+                    try:
+                        self.request(url, purl, obr)
+                    except ValueError as ex:
+                        print("error requesting invalid OOBI URL {}", url)
+                        invalids.append(url)
 
-                    if purl.path == "/oobi":  # Self and Blinded Introductions
-                        params = parse.parse_qs(purl.query)
+                for url in invalids:
+                    self.hby.db.oobis.rem(keys=(url,))
+                    self.cues.append(dict(kin="failed", oobi=url))
 
-                        # If name is hinted in query string, use it as alias if not provided in OOBIRecord
-                        if "name" in params and obr.oobialias is None:
-                            obr.oobialias = params["name"][0]
+            yield self.tock
 
-                        self.request(url, purl, obr)
+    @staticmethod
+    def prepare(purl, obr):
+        """ Fill in obr from the OOBI URL
 
-                    elif (match := OOBI_RE.match(purl.path)) is not None:  # Full CID and optional EID
-                        obr.cid = match.group("cid")
-                        obr.eid = match.group("eid")
-                        obr.role = match.group("role")
-                        params = parse.parse_qs(purl.query)
+        Parameters:
+            purl (ParseResult): parsed OOBI URL
+            obr (OobiRecord): record to update with cid, eid, role, said and alias hints
 
-                        # If name is hinted in query string, use it as alias if not provided in OOBIRecord
-                        if "name" in params and obr.oobialias is None:
-                            obr.oobialias = params["name"][0]
+        Returns:
+            bool: True if purl is a recognized OOBI URL
 
-                        self.request(url, purl, obr)
+        """
+        params = parse.parse_qs(purl.query)
 
-                    elif (match := DOOBI_RE.match(purl.path)) is not None:  # Full CID and optional EID
-                        obr.said = match.group("said")
-                        self.request(url, purl, obr)
+        if purl.path == "/oobi":  # Self and Blinded Introductions
+            pass
 
-                    elif purl.path.startswith("/.well-known/keri/oobi"):  # Well Known
-                        params = parse.parse_qs(purl.query)
+        elif (match := OOBI_RE.match(purl.path)) is not None:  # Full CID and optional EID
+            obr.cid = match.group("cid")
+            obr.eid = match.group("eid")
+            obr.role = match.group("role")
 
-                        # If name is hinted in query string, use it as alias if not provided in OOBIRecord
-                        if "name" in params and obr.oobialias is None:
-                            obr.oobialias = params["name"][0]
+        elif (match := DOOBI_RE.match(purl.path)) is not None:  # Full CID and optional EID
+            obr.said = match.group("said")
+            return True
 
-                        self.request(url, purl, obr)
+        elif not purl.path.startswith("/.well-known/keri/oobi"):  # Well Known
+            return False
 
-                except ValueError as ex:
-                    print("error requesting invalid OOBI URL {}", url)
-                yield self.tock
+        # If name is hinted in query string, use it as alias if not provided in OOBIRecord
+        if "name" in params and obr.oobialias is None:
+            obr.oobialias = params["name"][0]
 
-            yield self.tock
+        return True
 
     def clientsDo(self, tymth, tock=0.0):
         """ Process Client responses by parsing the messages and removing the client/doer
@@ -649,64 +729,110 @@ class Oobiery(doing.DoDoer):
         yield self.tock
 
         while True:
-            for (url, ), obr in self.hby.db.coobi.getItemIter():
-                if url not in self.clients:
-                    purl = parse.urlparse(url)
-                    self.request(url, purl, obr)
-                    continue
+            for key, (client, clientDoer, tyme) in list(self.clients.items()):
+                while client.responses:
+                    response = client.responses.popleft()
+                    url = response["request"].get("oobi")
+                    if url not in self.flights:
+                        continue
 
-                (client, clientDoer) = self.clients[url]
+                    _, obr, _ = self.flights.pop(url)
+                    if self.cids.get(obr.cid) == url:
+                        del self.cids[obr.cid]
+                    self.clients[key] = (client, clientDoer, self.tyme)
+                    self.respond(url, obr, response)
 
-                if client.responses:
-                    response = client.responses.popleft()
-                    self.remove([clientDoer])
+            for url, (key, obr, tyme) in list(self.flights.items()):
+                if url in self.flights and self.tyme - tyme > self.Timeout:  # host not answering so drop its client and retry
+                    self.release(key)
 
-                    if response["status"] == 404:
-                        print(f"{url} not found")
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.eoobi.pin(keys=(url,), val=obr)
+            for key, (client, clientDoer, tyme) in list(self.clients.items()):
+                if (not client.requests and not client.waited and not client.responses
+                        and self.tyme - tyme > self.Linger):
+                    self.release(key)
 
-                    elif not response["status"] == 200:
-                        self.hby.db.coobi.rem(keys=(url,))
-                        print("invalid status for oobi response: {}".format(response["status"]))
-                        self.cues.append(dict(kin="failed", oobi=url))
+            yield self.tock
 
-                    elif response["headers"]["Content-Type"] == "application/json+cesr":
-                        self.parser.parse(ims=bytearray(response["body"]))
-                        if "Keri-Aid" in response["headers"]:
-                            obr.cid = response["headers"]["Keri-Aid"]
+    def respond(self, url, obr, response):
+        """ Process one OOBI response
 
-                        if obr.oobialias is not None and obr.cid:
-                            self.org.replace(pre=obr.cid, data=dict(alias=obr.oobialias))
+        Parameters:
+            url (str): OOBI URL requested
+            obr (OobiRecord): record for the OOBI
+            response (dict): hio http client response
 
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.cues.append(dict(kin="resolved", oobi=url))
+        """
+        if response["status"] == 404:
+            print(f"{url} not found")
+            self.hby.db.coobi.rem(keys=(url,))
+            self.retry(url, obr)
+
+        elif not response["status"] == 200:
+            self.hby.db.coobi.rem(keys=(url,))
+            print("invalid status for oobi response: {}".format(response["status"]))
+            self.cues.append(dict(kin="failed", oobi=url))
+
+        elif response["headers"]["Content-Type"] == "application/json+cesr":
+            if "Keri-Aid" in response["headers"]:
+                obr.cid = response["headers"]["Keri-Aid"]
+
+            self.retries.pop(url, None)
+            parsator = self.parser.allParsator(ims=bytearray(response["body"]))
+            self.parsings.append((url, obr, parsator))
+
+        elif response["headers"]["Content-Type"] == "application/schema+json":
+            try:
+                schemer = scheming.Schemer(raw=bytearray(response["body"]))
+                if schemer.said == obr.said:
+                    self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
+                    self.cues.append(dict(kin="resolved", oobi=url))
+                else:
+                    self.cues.append(dict(kin="failed", oobi=url))
 
-                    elif response["headers"]["Content-Type"] == "application/schema+json":
-                        try:
-                            schemer = scheming.Schemer(raw=bytearray(response["body"]))
-                            if schemer.said == obr.said:
-                                self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
-                                self.cues.append(dict(kin="resolved", oobi=url))
-                            else:
-                                self.cues.append(dict(kin="failed", oobi=url))
+            except Exception:
+                self.cues.append(dict(kin="failed", oobi=url))
 
-                        except Exception:
-                            self.cues.append(dict(kin="failed", oobi=url))
+            self.retries.pop(url, None)
+            self.hby.db.coobi.rem(keys=(url,))
 
-                        self.hby.db.coobi.rem(keys=(url,))
+        else:
+            self.hby.db.coobi.rem(keys=(url,))
+            self.cues.append(dict(kin="failed", oobi=url))
+            print("invalid content type for oobi response: {}"
+                  .format(response["headers"]["Content-Type"]))
 
-                    else:
-                        self.cues.append(dict(kin="failed", oobi=url))
-                        print("invalid content type for oobi response: {}"
-                              .format(response["headers"]["Content-Type"]))
+    def parseDo(self, tymth, tock=0.0):
+        """ Parse resolved OOBI responses at most .chunk parser steps per tock
 
-                yield self.tock
+        Parameters:
+            tymth (function): injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock (float): injected initial tock value
+
+        """
+        self.wind(tymth)
+        self.tock = tock
+        yield self.tock
+
+        while True:
+            if self.parsings:
+                url, obr, parsator = self.parsings[0]
+                try:
+                    for _ in range(self.chunk):
+                        next(parsator)
+
+                except StopIteration:
+                    self.parsings.popleft()
+                    if obr.oobialias is not None and obr.cid:
+                        self.org.replace(pre=obr.cid, data=dict(alias=obr.oobialias))
+
+                    self.hby.db.coobi.rem(keys=(url,))
+                    self.cues.append(dict(kin="resolved", oobi=url))
 
             yield self.tock
 
     def retryDo(self, tymth, tock=0.0):
-        """ Process Client responses by parsing the messages and removing the client/doer
+        """ Move OOBIs in .eoobi back into .oobis once their backoff has expired
 
         Parameters:
             tymth (function): injected function wrapper closure returned by .tymen() of
@@ -718,27 +844,81 @@ class Oobiery(doing.DoDoer):
         self.tock = tock
         yield self.tock
 
-        retryDelay = 10.0
+        # entries left in eoobi by a previous run are due after the first delay
+        for (url, ), obr in self.hby.db.eoobi.getItemIter():
+            heapq.heappush(self.backoffs, (self.tyme + self.RetryDelay, url))
+
         while True:
-            for (url, ), obr in self.hby.db.eoobi.getItemIter():
-                self.hby.db.eoobi.rem(keys=(url,))
-                self.hby.db.oobis.pin(keys=(url,), val=obr)
-                yield retryDelay
+            while self.backoffs and self.backoffs[0][0] <= self.tyme:
+                _, url = heapq.heappop(self.backoffs)
+                if (obr := self.hby.db.eoobi.get(keys=(url,))) is not None:
+                    self.hby.db.eoobi.rem(keys=(url,))
+                    self.hby.db.oobis.pin(keys=(url,), val=obr)
 
-            yield retryDelay
+            yield self.tock
+
+    def retry(self, url, obr):
+        """ Escrow OOBI in .eoobi to be retried after an exponential backoff
+
+        Parameters:
+            url (str): OOBI URL to retry
+            obr (OobiRecord): record for the OOBI
+
+        """
+        attempts = self.retries.get(url, 0)
+        self.retries[url] = attempts + 1
+        delay = min(self.RetryDelay * 2 ** attempts, self.RetryMax)
+        heapq.heappush(self.backoffs, (self.tyme + delay, url))
+        self.hby.db.eoobi.pin(keys=(url,), val=obr)
 
     def request(self, url, purl, obr):
+        """ Queue GET for OOBI on the pooled client for its host
 
-        client = http.clienting.Client(hostname=purl.hostname, port=purl.port)
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
+        Parameters:
+            url (str): OOBI URL
+            purl (ParseResult): parsed OOBI URL
+            obr (OobiRecord): record for the OOBI
+
+        """
+        key = (purl.hostname, purl.port)
+        if key in self.clients:
+            client, clientDoer, _ = self.clients[key]
+        else:
+            client = http.clienting.Client(hostname=purl.hostname, port=purl.port)
+            clientDoer = http.clienting.ClientDoer(client=client)
+            self.extend([clientDoer])
 
         client.request(
             method="GET",
             path=purl.path,
             qargs=parse.parse_qs(purl.query),
+            headers=dict([('Connection', 'keep-alive')]),
+            oobi=url,
         )
 
-        self.clients[url] = (client, clientDoer)
+        self.clients[key] = (client, clientDoer, self.tyme)
+        self.flights[url] = (key, obr, self.tyme)
+        if obr.cid:
+            self.cids[obr.cid] = url
+
         self.hby.db.oobis.rem(keys=(url,))
         self.hby.db.coobi.pin(keys=(url,), val=obr)
+
+    def release(self, key):
+        """ Close and remove the pooled client for host key, retrying any requests still in flight on it
+
+        Parameters:
+            key (tuple): (hostname, port) of pooled client
+
+        """
+        client, clientDoer, _ = self.clients.pop(key)
+        self.remove([clientDoer])
+        client.close()
+
+        for url, (k, obr, _) in list(self.flights.items()):
+            if k == key:
+                del self.flights[url]
+                if self.cids.get(obr.cid) == url:
+                    del self.cids[obr.cid]
+                self.hby.db.coobi.rem(keys=(url,))
+                self.retry(url, obr)
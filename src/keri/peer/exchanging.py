@@ -10,7 +10,7 @@ from hio.base import doing
 from hio.help import decking
 
 from .. import help
-from ..core import eventing, coring
+from ..core import eventing, coring, routing
 from ..help import helping
 from ..kering import ValidationError, MissingSignatureError, AuthZError
 
@@ -40,6 +40,7 @@ class Exchanger(doing.DoDoer):
         self.kevers = self.hby.kevers
         self.delta = delta
         self.routes = dict()
+        self.rtr = routing.Router()  # finds handler of route
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
 
         doers = []
@@ -49,6 +50,7 @@ class Exchanger(doing.DoDoer):
                                       "".format(handler.resource))
 
             self.routes[handler.resource] = handler
+            self.rtr.addRoute(handler.resource, handler)
             doers.append(handler)
 
         super(Exchanger, self).__init__(doers=doers, **kwa)
@@ -59,6 +61,7 @@ class Exchanger(doing.DoDoer):
                                   "".format(handler.resource))
 
         self.routes[handler.resource] = handler
+        self.rtr.addRoute(handler.resource, handler)
         self.doers.append(handler)
 
     def processEvent(self, serder, source=None, sigers=None, cigars=None, **kwargs):
@@ -77,11 +80,12 @@ class Exchanger(doing.DoDoer):
         modifiers = serder.ked["q"] if 'q' in serder.ked else dict()
         pathed = kwargs["pathed"] if "pathed" in kwargs else []
 
-        if route not in self.routes:
+        found, _ = self.rtr.find(route=route)
+        if found is None:
             raise AttributeError("unregistered route {} for exchange message = {}"
                                  "".format(route, serder.pretty()))
 
-        behavior = self.routes[route]
+        behavior = found.resource
 
         if self.controller is not None and self.controller != source.qb64:
             raise AuthZError("Message {} is from invalid source {}"
@@ -107,7 +111,7 @@ class Exchanger(doing.DoDoer):
             tholder, verfers = self.hby.resolveVerifiers(pre=source.qb64, sn=kever.lastEst.s)
 
             #  Verify provided sigers using verfers
-            ssigers, indices = eventing.verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+            (ssigers, indices), = eventing.verifySigsBatch([(serder.raw, sigers, verfers)])
             if not tholder.satisfy(indices):  # at least one but not enough
                 psigers = self.hby.db.esigs.get(keys=(serder.said,))
                 if self.escrowPSEvent(serder=serder, source=source, sigers=sigers, pathed=pathed):
@@ -11,7 +11,7 @@ from hio.help import decking
 from keri.vdr import viring
 from .. import kering, help
 from ..app import agenting, signing, forwarding
-from ..core import parsing, coring, scheming
+from ..core import parsing, coring
 from ..core.coring import Seqner, MtrDex, Serder
 from ..core.eventing import SealEvent, TraitDex
 from ..db import dbing
@@ -709,12 +709,11 @@ class Credentialer(doing.DoDoer):
 
         """
         schema = creder.crd['s']
-        scraw = self.verifier.resolver.resolve(schema)
-        if not scraw:
+        schemer = self.verifier.resolver.schemer(schema)
+        if schemer is None:
             raise kering.ConfigurationError("Credential schema {} not found.  It must be loaded with data oobi before "
                                             "issuing credentials".format(schema))
 
-        schemer = scheming.Schemer(raw=scraw)
         try:
             schemer.verify(creder.raw)
         except kering.ValidationError as ex:
@@ -25,7 +25,7 @@ from ..db.dbing import dgKey, snKey
 from ..help import helping
 from ..kering import (MissingWitnessSignatureError, Version,
                       MissingAnchorError, ValidationError, OutOfOrderError, LikelyDuplicitousError)
-from ..vdr.viring import Reger
+from ..vdr.viring import Reger, CredStatusRecord
 
 logger = help.ogler.getLogger()
 
@@ -1199,7 +1199,7 @@ class Tever:
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
 
     def vcState(self, vci):
-        """ Calculate state (issued/revoked) of VC from db.
+        """ Returns state (issued/revoked) of VC from its status record in db.
 
         Returns None if never issued from this Registry
 
@@ -1209,40 +1209,17 @@ class Tever:
         Returns:
             status (Serder): transaction event state notification message
         """
-        digs = []
-        for _, dig in self.reger.getTelItemPreIter(pre=vci.encode("utf-8")):
-            digs.append(dig)
-
-        if len(digs) == 0:
-            return None
-
-        vcsn = len(digs) - 1
-        vcdig = bytes(digs[-1])
-
-        dgkey = dbing.dgKey(vci, vcdig)  # get message
-        raw = self.reger.getTvt(key=dgkey)
-        serder = coring.Serder(raw=bytes(raw))
-
-        if self.noBackers:
-            vcilk = Ilks.iss if len(digs) == 1 else Ilks.rev
-            ra = dict()
-        else:
-            vcilk = Ilks.bis if len(digs) == 1 else Ilks.brv
-            ra = serder.ked["ra"]
-
-        dgkey = dbing.dgKey(vci, vcdig)
-        couple = self.reger.getAnc(dgkey)
-        ancb = bytearray(couple)
-        seqner = coring.Seqner(qb64b=ancb, strip=True)
-        saider = coring.Saider(qb64b=ancb, strip=True)
+        if (rec := self.reger.vcsts.get(keys=vci)) is None:
+            if (rec := self.indexVcStatus(vci)) is None:
+                return None
 
         return vcstate(vcpre=vci,
-                       said=vcdig.decode("utf-8"),
-                       sn=vcsn,
+                       said=rec.d,
+                       sn=rec.sn,
                        ri=self.prefixer.qb64,
-                       eilk=vcilk,
-                       ra=ra,
-                       a=dict(s=seqner.sn, d=saider.qb64),
+                       eilk=rec.et,
+                       ra=rec.ra,
+                       a=rec.a,
                        )
 
     def vcSn(self, vci):
@@ -1257,10 +1234,70 @@ class Tever:
             int: current TEL sequence number of credential or None if not found
 
         """
+        if (rec := self.reger.vcsts.get(keys=vci)) is not None:
+            return rec.sn
+
         cnt = self.reger.cntTels(vci)
 
         return None if cnt == 0 else cnt - 1
 
+    def indexVcStatus(self, vci):
+        """ Rebuild status record of VC from its TEL for databases that predate
+        .reger.vcsts
+
+        Returns None if never issued from this Registry
+
+        Parameters:
+          vci (str):  qb64 VC identifier
+
+        Returns:
+            CredStatusRecord: status record now in .reger.vcsts
+        """
+        digs = []
+        for _, dig in self.reger.getTelItemPreIter(pre=vci.encode("utf-8")):
+            digs.append(dig)
+
+        if len(digs) == 0:
+            return None
+
+        vcdig = bytes(digs[-1])
+        raw = self.reger.getTvt(key=dbing.dgKey(vci, vcdig))
+        serder = coring.Serder(raw=bytes(raw))
+        couple = self.reger.getAnc(dbing.dgKey(vci, vcdig))
+        ancb = bytearray(couple)
+        seqner = coring.Seqner(qb64b=ancb, strip=True)
+        saider = coring.Saider(qb64b=ancb, strip=True)
+
+        return self.putVcStatus(vci, len(digs) - 1, serder, seqner, saider)
+
+    def putVcStatus(self, vci, sn, serder, seqner, saider):
+        """ Update status record of VC to latest TEL event serder at sn
+
+        Parameters:
+            vci (str): qb64 VC identifier
+            sn (int): sequence number of serder in TEL of VC
+            serder (Serder): VC TEL event
+            seqner (Seqner): anchoring event sequence number from controlling KEL
+            saider (Saider): anchoring event SAID from controlling KEL
+
+        Returns:
+            CredStatusRecord: status record now in .reger.vcsts
+        """
+        if self.noBackers:
+            vcilk = Ilks.iss if sn == 0 else Ilks.rev
+            ra = dict()
+        else:
+            vcilk = Ilks.bis if sn == 0 else Ilks.brv
+            ra = serder.ked["ra"]
+
+        rec = CredStatusRecord(sn=sn,
+                               d=serder.said,
+                               et=vcilk,
+                               ra=ra,
+                               a=dict(s=seqner.sn, d=saider.qb64))
+        self.reger.vcsts.pin(keys=vci, val=rec)
+        return rec
+
     def logEvent(self, pre, sn, serder, seqner, saider, bigers=None, baks=None):
         """ Update associated logs for verified event.
 
@@ -1290,6 +1327,10 @@ class Tever:
         self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
         self.reger.putTvt(key, serder.raw)
         self.reger.putTel(snKey(pre, sn), dig)
+        if serder.ked["t"] in (Ilks.iss, Ilks.rev, Ilks.bis, Ilks.brv):
+            vci = pre.decode("utf-8")
+            if (rec := self.reger.vcsts.get(keys=vci)) is None or sn >= rec.sn:
+                self.putVcStatus(vci, sn, serder, seqner, saider)
         logger.info("Tever state: %s Added to TEL valid event=\n%s\n",
                     pre, json.dumps(serder.ked, indent=1))
 
@@ -67,6 +67,7 @@ class Verifier:
         self.tvy = eventing.Tevery(reger=self.reger, db=self.hby.db, local=False)
         self.psr = parsing.Parser(framed=True, kvy=self.hby.kvy, tvy=self.tvy)
         self.resolver = scheming.CacheResolver(db=self.hby.db)
+        self.resolver.warm()  # compile known schema validators once up front
 
         self.inited = True
 
@@ -133,13 +134,12 @@ class Verifier:
             # raise kering.InvalidCredentialStateError("..."))
 
         # Verify the credential against the schema
-        scraw = self.resolver.resolve(schema)
-        if not scraw:
+        schemer = self.resolver.schemer(schema)
+        if schemer is None:
             if self.escrowMSE(creder, sadsigers, sadcigars):
                 self.cues.append(dict(kin="query", q=dict(r="schema", said=schema)))
             raise kering.MissingSchemaError("schema {} not in cache".format(schema))
 
-        schemer = scheming.Schemer(raw=scraw)
         try:
             schemer.verify(creder.raw)
         except kering.ValidationError as ex:
@@ -16,41 +16,28 @@ from ..db import koming, subing, escrowing
 from .. import kering
 from ..app import signing
 from ..core import coring
-from ..db import dbing
+from ..db import basing, dbing
 from ..help import helping
 from ..vc import proving
 
 
-class RegerDict(dict):
+class RegerDict(basing.dbdict):
     """ Reger backed read through cache for registry state
 
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    Bounded by .capacity the same way as basing.dbdict. Tevers of registries
+    whose issuer is a local prefix are pinned. Tever state is only pinned to
+    .reger.states on assignment so evicted tevers write back their state.
     """
-    __slots__ = ('reger', 'db', 'klas')  # no .__dict__ just for db reference
+    __slots__ = ('reger', 'klas')  # no .__dict__ just for db reference
 
     def __init__(self, *pa, **kwa):
         super(RegerDict, self).__init__(*pa, **kwa)
-        self.db = None
         self.reger = None
 
-    def __getitem__(self, k):
-        from ..vdr import eventing
-        try:
-            return super(RegerDict, self).__getitem__(k)
-        except KeyError as ex:
-            if not self.db or not self.reger:
-                raise ex  # reraise KeyError
-            if (state := self.reger.states.get(keys=k)) is None:
-                raise ex  # reraise KeyError
-            try:
-                tever = eventing.Tever(stt=state, db=self.db, reger=self.reger)
-            except kering.MissingEntryError:  # no kel event for keystate
-                raise ex  # reraise KeyError
-            super(RegerDict, self).__setitem__(k, tever)
-            return tever
-
     def __setitem__(self, key, item):
         super(RegerDict, self).__setitem__(key, item)
         self.reger.states.pin(keys=key, val=item.state())
@@ -59,16 +46,6 @@ class RegerDict(dict):
         super(RegerDict, self).__delitem__(key)
         self.reger.states.rem(keys=key)
 
-    def __contains__(self, k):
-        if not super(RegerDict, self).__contains__(k):
-            try:
-                self.__getitem__(k)
-                return True
-            except KeyError:
-                return False
-        else:
-            return True
-
     def get(self, k, default=None):
         """ Override of dict get method
 
@@ -80,10 +57,34 @@ class RegerDict(dict):
             Serder: value from underlying dict or database
 
         """
-        if not super(RegerDict, self).__contains__(k):
-            return default
-        else:
-            return self.__getitem__(k)
+        return super(RegerDict, self).get(k, default=default)
+
+    def _load(self, k):
+        """
+        Returns Tever reloaded from registry state of k in .reger or None if missing
+        """
+        from ..vdr import eventing
+        if not self.db or not self.reger:
+            return None
+        if (state := self.reger.states.get(keys=k)) is None:
+            return None
+        try:
+            return eventing.Tever(stt=state, db=self.db, reger=self.reger)
+        except kering.MissingEntryError:  # no kel event for keystate
+            return None
+
+    def _pinned(self, k, v):
+        """
+        Returns True if registry k is local or issued by a local prefix
+        """
+        return (k in self.reger.registries or
+                (bool(self.db) and v.pre in self.db.prefixes))
+
+    def _evicted(self, k, v):
+        """
+        Writes back state of evicted tever since tever updates do not repin it
+        """
+        self.reger.states.pin(keys=k, val=v.state())
 
 
 @dataclass
@@ -94,6 +95,19 @@ class RegistryRecord:
     prefix: str
 
 
+@dataclass
+class CredStatusRecord:
+    """ Current TEL status of a credential keyed by credential SAID
+
+    Maintained by Tever.logEvent so credential state is a single read
+    """
+    sn: int  # sequence number of latest TEL event of credential
+    d: str  # SAID of latest TEL event of credential
+    et: str  # ilk of latest TEL event, iss, rev, bis or brv
+    ra: dict  # registry anchor of latest event, empty when registry has no backers
+    a: dict  # seal of latest event anchor in issuer KEL with s and d
+
+
 def openReger(name="test", **kwa):
     """ Returns contextmanager generated by openLMDB but with Baser instance
 
@@ -172,6 +186,7 @@ class Reger(dbing.LMDBer):
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    TeverCapacity = 4096  # max tevers held in memory, None means unbounded
 
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
@@ -204,7 +219,7 @@ class Reger(dbing.LMDBer):
 
         self.registries = oset()
         if "db" in kwa:
-            self._tevers = RegerDict()
+            self._tevers = RegerDict(capacity=self.TeverCapacity)
             self._tevers.reger = self  # assign db for read thorugh cache of kevers
             self._tevers.db = kwa["db"]
         else:
@@ -287,6 +302,11 @@ class Reger(dbing.LMDBer):
                                  subkey='regs.',
                                  schema=RegistryRecord, )
 
+        # current TEL status of credentials keyed by credential SAID
+        self.vcsts = koming.Komer(db=self,
+                                  subkey='vcsts.',
+                                  schema=CredStatusRecord, )
+
         # TEL partial witness escrow
         self.tpwe = subing.CatCesrIoSetSuber(db=self, subkey='tpwe.',
                                              klas=(coring.Prefixer, coring.Seqner, coring.Saider))
@@ -317,20 +337,46 @@ class Reger(dbing.LMDBer):
 
         return self.env
 
-    def cloneCreds(self, saids):
+    def cloneCreds(self, saids, flat=False):
         """ Returns fully expanded credential with chained credentials attached.
 
+        Walks the chain edges iteratively and hydrates each credential only once
+        per call so credentials chained from many others, such as a shared
+        issuer credential, are shared rather than rebuilt for each.
+
         Parameters:
            saids (list): of Saider objects:
+           flat (bool): True means return node table of all credentials with
+               chains as lists of SAIDs instead of nested credentials
 
         Returns:
-            list: fully hydrated credentials with full chains provided
+            list: fully hydrated credentials with full chains provided when not flat
+            dict: of hydrated credentials by SAID, roots first, when flat
+
+        Raises:
+            ValidationError: when chain edges form a cycle
+
+        """
+        nodes = dict()  # hydrated credentials by SAID
+        edges = dict()  # chained SAIDs by SAID
+        path = set()  # SAIDs being expanded, i.e. ancestors of top of stack
+        roots = [saider.qb64 for saider in saids]
+        stack = [(said, False) for said in reversed(roots)]
+        while stack:
+            said, expanded = stack.pop()
+            if expanded:  # all chains hydrated
+                path.discard(said)
+                chains = edges[said]
+                nodes[said]["chains"] = chains if flat else [nodes[c] for c in chains]
+                continue
 
-        """
-        creds = []
-        for saider in saids:
-            key = saider.qb64
-            creder, sadsigers, sadcigars = self.cloneCred(said=key)
+            if said in path:
+                raise kering.ValidationError("Cycle in credential chain at said = {}."
+                                             "".format(said))
+            if said in nodes:  # already hydrated
+                continue
+
+            creder, sadsigers, sadcigars = self.cloneCred(said=said)
 
             chainSaids = []
             for k, p in creder.crd["e"].items():
@@ -340,12 +386,11 @@ class Reger(dbing.LMDBer):
                 if not isinstance(p, dict):
                     continue
 
-                chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids)
+                chainSaids.append(p["n"])
 
             regk = creder.status
-            status = self.tevers[regk].vcState(saider.qb64)
-            cred = dict(
+            status = self.tevers[regk].vcState(said)
+            nodes[said] = dict(
                 sad=creder.crd,
                 pre=creder.issuer,
                 sadsigers=[dict(
@@ -355,12 +400,55 @@ class Reger(dbing.LMDBer):
                     d=saider.qb64
                 ) for (pather, prefixer, seqner, saider, sigers) in sadsigers],
                 sadcigars=[dict(path=pather.bext, cigar=cigar.qb64) for (pather, cigar) in sadcigars],
-                chains=chains,
+                chains=[],
                 status=status.ked,
             )
+            edges[said] = chainSaids
+            path.add(said)
+            stack.append((said, True))
+            stack.extend((chain, False) for chain in reversed(chainSaids))
+
+        if flat:
+            return {said: nodes[said] for said in roots + list(nodes)}
+        return [nodes[said] for said in roots]
 
-            creds.append(cred)
-        return creds
+    def getCredSaidIter(self, index, keys, schema=None, status=None, after=''):
+        """ Returns iterator of SAIDs of credentials in index at keys in SAID order
+
+        Iterates index at keys and checks each SAID against the .schms index at
+        schema so cost is bounded by the credentials at keys, not by all
+        credentials of schema. Status filter reads the status record of each SAID.
+
+        Parameters:
+            index (CesrDupSuber): credential index such as .issus or .subjs
+            keys (Union[str, Iterable]): keys of index such as issuer or subject prefix
+            schema (str): optional qb64 SAID of schema credentials must have
+            status (str): optional status credentials must have, issued or revoked
+            after (str): optional SAID of credential to resume after
+
+        Returns:
+            iterator: of Saider of credentials
+
+        """
+        if status is not None and status not in ("issued", "revoked"):
+            raise kering.ValidationError("Invalid credential status = {}.".format(status))
+
+        for saider in index.getIter(keys=keys, after=after):
+            if schema is not None and not self.schms.has(keys=schema, val=saider):
+                continue
+            if status is not None:
+                if (rec := self.vcsts.get(keys=saider.qb64)) is None:
+                    if (creder := self.creds.get(keys=saider.qb64)) is None:
+                        continue
+                    if (state := self.tevers[creder.status].vcState(saider.qb64)) is None:
+                        continue
+                    et = state.ked["et"]
+                else:
+                    et = rec.et
+                revoked = et in (coring.Ilks.rev, coring.Ilks.brv)
+                if revoked != (status == "revoked"):
+                    continue
+            yield saider
 
     def logCred(self, creder, sadsigers=None, sadcigars=None):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
@@ -84,6 +84,10 @@ class ReceiptDoer(doing.DoDoer):
                 break
             yield self.tock
 
+        # Witnessers are pooled per witness URL and reused across events
+        assert len(witDoer.witers) == 2
+        witers = dict(witDoer.witers)
+
         # Controller should send endpoints between witnesses.  Check for Endpoints for each other:
         keys = (self.wanHab.pre, kering.Schemes.tcp)
         said = self.wilHab.db.lans.get(keys=keys)
@@ -92,6 +96,12 @@ class ReceiptDoer(doing.DoDoer):
         said = self.wanHab.db.lans.get(keys=keys)
         assert said is not None
 
+        # Only the new witness is missing the KEL
+        assert self.hby.db.knownFn(pre=palHab.pre, eid=self.wanHab.pre) == 0
+        assert self.hby.db.knownFn(pre=palHab.pre, eid=self.wesHab.pre) is None
+        assert agenting.catchup(palHab, self.wanHab.pre) == bytearray()
+        assert agenting.catchup(palHab, self.wesHab.pre) == b"".join(self.hby.db.clonePreIter(pre=palHab.pre))
+
         palHab.rotate(adds=[self.wesHab.pre])
 
         witDoer.msgs.append(dict(pre=palHab.pre, sn=1))
@@ -108,6 +118,18 @@ class ReceiptDoer(doing.DoDoer):
                 break
             yield self.tock
 
+        while len(witDoer.cues) < 2:
+            yield self.tock
+
+        assert [cue["pre"] for cue in witDoer.cues] == [palHab.pre, palHab.pre]
+        assert self.hby.db.knownFn(pre=palHab.pre, eid=self.wesHab.pre) == 1
+        assert len(witDoer.witers) == 3
+        for url, witer in witers.items():
+            assert witDoer.witers[url] is witer
+
+        while witDoer.flights:
+            yield self.tock
+
         self.remove([witDoer])
         return True
 
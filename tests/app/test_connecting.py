@@ -132,6 +132,32 @@ def test_organizer():
         assert wil in data
         assert sal in data
 
+        # index follows set, unset and rem
+        assert [d["id"] for d in org.find(field="last", val="Smith")] == [jen, sal]
+        assert org.find(field="last", val="Jones") == []
+        assert org.find(field="first", val="Jen") == []
+        assert [d["id"] for d in org.find(field="city", val=["Lawrence", "Sebastian"])] == [joe, bob]
+
+        grouped = org.findPrefix(field="first", prefix="S")
+        assert [d["id"] for d in grouped] == [sal]
+        grouped = org.findRange(field="zip", start="0", stop="1")
+        assert [d["zip"] for d in grouped] == ["01841", "06360", "08807"]
+        grouped = org.findRange(field="zip", start="32958")
+        assert [d["zip"] for d in grouped] == ["32958", "42420", "70605"]
+
+        # long values are truncated in index but still found exactly
+        longa = "a" * 600
+        longb = "a" * 599 + "b"
+        org.set(pre=joe, field="note", val=longa)
+        org.set(pre=bob, field="note", val=longb)
+        assert [d["id"] for d in org.find(field="note", val=longb)] == [bob]
+        assert org.values(field="note") == [longa, longb]
+        assert [d["id"] for d in org.findPrefix(field="note", prefix=longa[:590])] == [joe, bob]
+
+        idx = [item for item in hby.db.cidx.getItemIter()]
+        assert org.reindex() == len(idx)
+        assert [item for item in hby.db.cidx.getItemIter()] == idx
+
         d = org.get(pre=ken)
         assert d == {'address': '28 Williams Ave.',
                      'alias': 'ken',
@@ -6,10 +6,12 @@ tests.app.forwarding module
 """
 
 import time
+from types import SimpleNamespace
 
 from hio.base import doing, tyming
 
-from keri.app import forwarding, habbing, indirecting, storing
+from keri import kering
+from keri.app import agenting, forwarding, habbing, indirecting, storing
 from keri.core import coring, eventing, parsing
 from keri.peer import exchanging
 
@@ -44,10 +46,13 @@ def test_postman(seeder):
 
         pman = forwarding.Postman(hby=hby)
 
-        exn = exchanging.exchange(route="/echo", payload=dict(msg="test"))
-        atc = hab.endorse(exn)
-        del atc[:exn.size]
-        pman.send(src=hab.pre, dest=recpHab.pre, topic="echo", serder=exn, attachment=atc)
+        saids = []
+        for i in range(3):
+            exn = exchanging.exchange(route="/echo", payload=dict(msg=f"test{i}"))
+            atc = hab.endorse(exn)
+            del atc[:exn.size]
+            pman.send(src=hab.pre, dest=recpHab.pre, topic="echo", serder=exn, attachment=atc)
+            saids.append(exn.said)
 
         doers = wesDoers + [pman]
         limit = 1.0
@@ -63,17 +68,107 @@ def test_postman(seeder):
 
         assert doist.limit == limit
 
+        # all three messages coalesced into one stream over one pooled witnesser
+        assert len(pman.witers) == 1
+        assert list(pman.posts.values()) == [1]
+        assert pman.introduced == {(wesHab.pre, hab.pre): 0}
+        assert pman.introducing == {}
+        assert [cue["said"] for cue in pman.cues] == saids
+
         doist.exit()
 
         msgs = []
         for _, topic, msg in mbx.cloneTopicIter(topic=recpHab.pre + "/echo", fn=0):
             msgs.append(msg)
 
-        assert len(msgs) == 1
-        serder = coring.Serder(raw=msgs[0])
-        assert serder.ked["t"] == coring.Ilks.exn
-        assert serder.ked["r"] == "/echo"
-        assert serder.ked["a"] == dict(msg="test")
+        assert len(msgs) == 3
+        for i, msg in enumerate(msgs):
+            serder = coring.Serder(raw=msg)
+            assert serder.ked["t"] == coring.Ilks.exn
+            assert serder.ked["r"] == "/echo"
+            assert serder.ked["a"] == dict(msg=f"test{i}")
+
+        # KEL already introduced so only new events are sent
+        assert pman.introduce(hab, wesHab.pre) == bytearray()
+        hab.interact()
+        assert pman.introduce(hab, wesHab.pre) == b"".join(hby.db.clonePreIter(pre=hab.pre, fn=1))
+        assert pman.introducing == {(wesHab.pre, hab.pre): 1}  # not delivered yet
+        assert pman.introduced == {(wesHab.pre, hab.pre): 0}
+        assert pman.introduce(hab, wesHab.pre) == bytearray()  # in flight
+
+        # failed delivery forgets KEL so it is introduced again
+        keys = (wesHab.pre, hab.pre)
+        url = list(pman.witers)[0]
+        pman.witers[url].flushed = pman.posts[url] + 1
+        pman.witers[url].sent.append(SimpleNamespace(status=500))
+        pman.flights[url].append((pman.posts[url] + 1, [dict(said="x")], [(keys, 1)]))
+        pman.complete()
+        assert pman.cues[-1] == dict(said="x")
+        assert pman.introduced == {}
+        assert pman.introducing == {}
+        assert pman.introduce(hab, wesHab.pre) == forwarding.introduce(hab, wesHab.pre)
+
+        pman.release()
+        assert pman.introduced == {}
+        assert pman.introducing == {}
+
+
+def test_postman_tcp(seeder):
+    """ Test Postman delivery to mailbox witness with only a tcp endpoint """
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab), \
+            habbing.openHby(name="wes", salt=coring.Salter(raw=b'wess-the-witness').qb64, temp=True) as wesHby, \
+            habbing.openHby(name="repTest",  temp=True) as recpHby:
+
+        mbx = storing.Mailboxer(name="wes", temp=True)
+        wesDoers = indirecting.setupWitness(alias="wes", hby=wesHby, mbx=mbx, tcpPort=5634, httpPort=5644)
+        wesHab = wesHby.habByName("wes")
+        seeder.seedWitEnds(hby.db, witHabs=[wesHab], protocols=[kering.Schemes.tcp])
+        seeder.seedWitEnds(wesHby.db, witHabs=[wesHab])
+        seeder.seedWitEnds(recpHby.db, witHabs=[wesHab])
+
+        recpHab = recpHby.makeHab(name="repTest", transferable=True, wits=[wesHab.pre])
+        recpIcp = recpHab.makeOwnEvent(sn=0)
+        serder = coring.Serder(raw=recpIcp)
+        rct = wesHab.receipt(serder)
+
+        kvy = eventing.Kevery(db=hab.db)
+        parsing.Parser().parseOne(bytearray(recpIcp), kvy=kvy)
+        parsing.Parser().parseOne(bytearray(rct), kvy=kvy)
+        kvy.processEscrows()
+        assert recpHab.pre in kvy.kevers
+
+        pman = forwarding.Postman(hby=hby)
+
+        saids = []
+        for i in range(2):
+            exn = exchanging.exchange(route="/echo", payload=dict(msg=f"test{i}"))
+            atc = hab.endorse(exn)
+            del atc[:exn.size]
+            pman.send(src=hab.pre, dest=recpHab.pre, topic="echo", serder=exn, attachment=atc)
+            saids.append(exn.said)
+
+        doers = wesDoers + [pman]
+        limit = 1.0
+        tock = 0.03125
+        doist = doing.Doist(tock=tock, limit=limit, doers=doers)
+        doist.enter()
+
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+
+        while not tymer.expired:
+            doist.recur()
+            time.sleep(doist.tock)
+
+        # flushed stream counts as delivered since tcp has no responses
+        witer = list(pman.witers.values())[0]
+        assert isinstance(witer, agenting.TCPWitnesser)
+        assert list(pman.posts.values()) == [1]
+        assert not witer.sent
+        assert pman.introduced == {(wesHab.pre, hab.pre): 0}
+        assert pman.introducing == {}
+        assert [cue["said"] for cue in pman.cues] == saids
+
+        doist.exit()
 
 
 def test_forward_handler():
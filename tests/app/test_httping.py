@@ -194,5 +194,26 @@ def test_stream_cesr_request(mockHelpingNowUTC):
                                               b'EMeS0Jtlu-jargBw')
 
 
+
+def test_stream_cesr_batch_request():
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
+        msgs = httping.CesrStream(hab.makeOwnEvent(sn=0))
+        hab.interact()
+        msgs.extend(hab.makeOwnEvent(sn=1))
+
+        client = MockClient()
+        httping.createCESRStreamRequest(client, msgs)
+        assert len(client.args) == 1
+        args = client.args.pop()
+        assert args["method"] == "PUT"
+        assert args["path"] == "/"
+        assert args["body"] == bytes(msgs)
+
+        headers = args["headers"]
+        assert headers["Content-Type"] == "application/cesr"
+        assert headers["Content-Length"] == len(msgs)
+        assert httping.CESR_ATTACHMENT_HEADER not in headers
+
+
 if __name__ == '__main__':
     test_parse_cesr_request()
@@ -5,7 +5,9 @@ tests.app.indirecting module
 """
 import json
 
+import falcon
 import pytest
+from falcon import testing
 from hio.help import decking
 
 from keri.app import indirecting, storing, habbing
@@ -116,3 +118,80 @@ def test_qrymailbox_iter():
         mb.iter.TimeoutMBX = 0  # Force the iter to timeout
         with pytest.raises(StopIteration):
             next(mbi)
+
+
+def test_mailbox_iter_notify():
+    pre = "E83mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    mbx = storing.Mailboxer(temp=True)
+    msg = json.dumps(dict(i=pre, t="rct")).encode("utf-8")
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=msg)  # stored before stream
+
+    mb = indirecting.MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0, "/multisig": 0}, retry=1000)
+    mbi = iter(mb)
+    assert mb.stream is not None
+    assert len(mbx.subs) == 1
+    assert mbx.streams[f"{pre}/receipt".encode("utf-8")]
+
+    assert next(mbi) == b'retry: 1000\n\n'
+    val = next(mbi)  # first pass reads database
+    assert val.startswith(b'id: 0\nevent: /receipt\n')
+    assert mb.topics == {"/receipt": 1, "/multisig": 0}
+
+    # idle stream does not read database
+    clones = []
+    cloneTopicIter = mbx.cloneTopicIter
+    mbx.cloneTopicIter = lambda *pa, **kwa: clones.append(pa) or cloneTopicIter(*pa, **kwa)
+    assert next(mbi) == b''
+    mbx.storeMsg(topic=f"{pre}/multisig", msg=msg)
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=msg)
+    val = next(mbi)
+    assert val.startswith(b'id: 0\nevent: /multisig\n')
+    assert b'id: 1\nevent: /receipt\n' in val
+    assert clones == []
+    assert mb.topics == {"/receipt": 2, "/multisig": 1}
+
+    # overflowed buffer falls back to database for the topic
+    mb.stream.size = 1
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=msg)
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=b'{"i": "other"}')
+    assert len(mb.stream.msgs) == 1
+    val = next(mbi)
+    assert b'id: 2\nevent: /receipt\n' in val
+    assert b'id: 3\nevent: /receipt\n' in val
+    assert len(clones) == 1
+    assert mb.topics == {"/receipt": 4, "/multisig": 1}
+
+    # max streams end new streams after retry
+    mbx.MaxStreams = 1
+    mb1 = indirecting.MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0}, retry=1000)
+    mbi1 = iter(mb1)
+    assert mb1.stream is None
+    assert next(mbi1) == b'retry: 1000\n\n'
+    with pytest.raises(StopIteration):
+        next(mbi1)
+
+    mb.TimeoutMBX = 0  # timeout unsubscribes
+    with pytest.raises(StopIteration):
+        next(mbi)
+    assert len(mbx.subs) == 0
+    assert mbx.streams == {}
+
+
+def test_http_end_put_stream():
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
+        msgs = bytearray(hab.makeOwnEvent(sn=0))
+        hab.interact()
+        msgs.extend(hab.makeOwnEvent(sn=1))
+
+        rxbs = bytearray()
+        app = falcon.App()
+        app.add_route("/", indirecting.HttpEnd(rxbs=rxbs))
+        client = testing.TestClient(app)
+
+        rep = client.simulate_put("/", body=bytes(msgs), headers={"Content-Type": "application/cesr"})
+        assert rep.status == falcon.HTTP_204
+        assert rxbs == msgs
+
+        rep = client.simulate_put("/", body=bytes(msgs), headers={"Content-Type": "application/json"})
+        assert rep.status == falcon.HTTP_406
+        assert rxbs == msgs
@@ -681,6 +681,17 @@ def test_creator():
     assert signer.verfer.code in coring.NonTransDex
     assert signer.verfer.qb64 == 'BVG3IcCNK4lpFfpMM-9rfkY3XVUcCu5o5cxzv1lgMqxM'
 
+    # concurrent stretch of multiple sets derives each path of each set
+    isigners, nsigners = creator.creates([dict(count=3, ridx=0, kidx=0),
+                                          dict(count=2, ridx=1, kidx=3)], temp=True)
+    assert [signer.qb64 for signer in isigners] == ['AwasAzSejEulG1472bEZP7LNhKsoXAky40jgqWZKTbp4',
+                                                     'AY6d8m0iIQoef4l7Aed84ErGjcB6-A5Y6RghhAdTJCeg',
+                                                     'AzetmBCLaB2nSO_D0pGKdXDhy3ntM5qEBDAkw9ww4NOg']
+    assert [signer.qb64 for signer in nsigners] == ['A62BrsKSeEdJkLscdU0E1MbcrWqc47MJHd1UiSZRMiuk',
+                                                     'AQwuHStFRHLsp_t-ihW7mKQBJCmbyEmgBLRNqrLaXXBg']
+    assert keeping.SaltyCreator.Workers[coring.Tiers.high] == 1  # 1 GiB per stretch
+    assert creator.creates([dict(codes=[], count=0)], temp=True) == [[]]
+
     creator = keeping.Creatory(algo=keeping.Algos.salty).make(salt=salt)
     assert isinstance(creator, keeping.SaltyCreator)
     assert creator.salter.qb64 == salt
@@ -816,6 +827,14 @@ def test_manager():
         assert psigs == vsigs
         assert psigs == ['0BGu9G-EJ0zrRjrDKnHszLVcwhbkSRxniDJFmB2eWcRiFzNFw1QM5GHQnmnXz385SgunZH4sLidCMyzhJWmp1IBw']
 
+        sigs = manager.signs(sers=[ser, ser + b'x'], verfers=verfers, indexed=False)
+        assert len(sigs) == 2
+        assert [cigar.qb64 for cigar in sigs[0]] == psigs
+        assert sigs[1][0].verfer.verify(sigs[1][0].raw, ser + b'x')
+        sigs = manager.signs(sers=[ser], pubs=ps.new.pubs)
+        assert [siger.qb64 for siger in sigs[0]] == [siger.qb64 for siger in
+                                                     manager.sign(ser=ser, pubs=ps.new.pubs)]
+
         # salty algorithm rotate
         oldpubs = [verfer.qb64 for verfer in verfers]
         verfers, digers, cst, nst = manager.rotate(pre=spre.decode("utf-8"))
@@ -1787,6 +1806,50 @@ def test_manager_with_aeid():
     """End Test"""
 
 
+def test_signer_cache():
+    """
+    test SignerCache and Manager signing with cache enabled
+    """
+    signers = coring.generateSigners(count=3)
+    pubs = [signer.verfer.qb64 for signer in signers]
+    cache = keeping.SignerCache(capacity=2, ttl=300.0)
+    assert cache.get(pubs[0]) is None
+    cache.put(pubs[0], signers[0])
+    cache.put(pubs[1], signers[1])
+    assert cache.get(pubs[0]) is signers[0]  # now most recently used
+    cache.put(pubs[2], signers[2])  # evicts pubs[1]
+    assert cache.get(pubs[1]) is None
+    assert len(cache) == 2
+    assert cache.metrics() == dict(size=2, capacity=2, ttl=300.0, hits=1, misses=2,
+                                   evictions=1, expirations=0)
+
+    cache.ttl = 0.0  # expire on next get
+    cache.put(pubs[0], signers[0])
+    assert cache.get(pubs[0]) is None
+    assert cache.expirations == 1
+    cache.clear()
+    assert len(cache) == 0
+
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64
+    ser = b'sign me'
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(ks=keeper, salt=salt)
+        assert manager.cache is None
+
+        manager = keeping.Manager(ks=keeper, salt=salt, cacheSize=4)
+        verfers, digers, cst, nst = manager.incept(icount=2, temp=True)
+        sigers = manager.sign(ser=ser, verfers=verfers)
+        assert manager.cache.misses == 2
+        assert len(manager.cache) == 2
+        assert [siger.qb64 for siger in manager.sign(ser=ser, verfers=verfers)] == \
+               [siger.qb64 for siger in sigers]
+        assert manager.cache.hits == 2
+
+        manager.rotate(pre=verfers[0].qb64, temp=True)
+        assert len(manager.cache) == 0  # rotation clears
+
+    """End Test"""
+
 
 if __name__ == "__main__":
     test_manager()
@@ -136,6 +136,51 @@ def test_credential_handlers(mockHelpingNowUTC, seeder):
         state = result.json[0]["status"]
         assert state["et"] == coring.Ilks.rev
 
+        # Issue second credential then page, filter and stream the listing
+        data = dict(LEI="0987654321abcdefg")
+        body["credentialData"] = data
+        result = client.simulate_post(path="/credentials/test", body=json.dumps(body).encode("utf-8"))
+        assert result.status == falcon.HTTP_200
+        creder2 = proving.Creder(ked=result.json)
+        regery.processEscrows()
+        credentialer.processEscrows()
+        verifier.processEscrows()
+        saids = sorted([creder.said, creder2.said])
+
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued"))
+        assert [cred["sad"]["d"] for cred in result.json] == saids
+        assert kiwiing.CURSOR_HEADER not in result.headers
+
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", limit=1))
+        assert [cred["sad"]["d"] for cred in result.json] == saids[:1]
+        cursor = result.headers[kiwiing.CURSOR_HEADER]
+        assert cursor == saids[0]
+        result = client.simulate_get(path="/credentials/test",
+                                     params=dict(type="issued", limit=1, cursor=cursor))
+        assert [cred["sad"]["d"] for cred in result.json] == saids[1:]
+        result = client.simulate_get(path="/credentials/test",
+                                     params=dict(type="issued", limit=1, cursor=saids[1]))
+        assert result.json == []
+
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", status="revoked"))
+        assert [cred["sad"]["d"] for cred in result.json] == [creder.said]
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", status="issued",
+                                                                           schema=schema))
+        assert [cred["sad"]["d"] for cred in result.json] == [creder2.said]
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", schema=creder.said))
+        assert result.json == []
+
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", status="bad"))
+        assert result.status == falcon.HTTP_400
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", limit=0))
+        assert result.status == falcon.HTTP_400
+
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued"),
+                                     headers={"Accept": "application/x-ndjson"})
+        assert result.headers["content-type"] == "application/x-ndjson"
+        lines = result.content.splitlines()
+        assert [json.loads(line)["sad"]["d"] for line in lines] == saids
+
 
 def test_multisig_incept():
     prefix = "ends_test"
@@ -6,6 +6,7 @@ tests.core.test_coring module
 import dataclasses
 import hashlib
 import json
+import time
 from base64 import urlsafe_b64decode as decodeB64
 from base64 import urlsafe_b64encode as encodeB64
 from fractions import Fraction
@@ -19,6 +20,7 @@ import pytest
 
 from keri.core import coring
 from keri.core import eventing
+from keri.core import parsing
 from keri.core.coring import Ilkage, Ilks, Ids, Idents, Sadder
 from keri.core.coring import Seqner, NumDex, Number, Siger, Dater, Bexter
 from keri.core.coring import Serder, Tholder
@@ -33,7 +35,8 @@ from keri.core.coring import (intToB64, intToB64b, b64ToInt, b64ToB2, b2ToB64,
                               B64_CHARS, Reb64, nabSextets)
 from keri.help import helping
 from keri.kering import (EmptyMaterialError, RawMaterialError, DerivationError,
-                         ShortageError, InvalidCodeSizeError)
+                         ShortageError, InvalidCodeSizeError,
+                         UnexpectedCodeError, UnexpectedCountCodeError)
 from keri.kering import Version, Versionage
 
 
@@ -105,6 +108,11 @@ def test_b64_conversions():
     assert cs == "A"
     i = b64ToInt(cs)
     assert i == 0
+    assert coring.b64bToInt(b"A") == 0
+    assert coring.b64bToInt(b"_A") == 64 * 63
+    assert coring.b64bToInt(memoryview(b"BA")) == b64ToInt("BA") == 64
+    with pytest.raises(ValueError):
+        coring.b64bToInt(b"")
 
     cs = intToB64(0, l=0)
     assert cs == ""
@@ -2909,6 +2917,30 @@ def test_verfer():
 
     with pytest.raises(ValueError):
         verfer = Verfer(raw=verkey, code=MtrDex.Blake3_256)
+
+    # batch verification
+    bad = bytes(len(sig))
+    results = Verfer.verifyMany([(verfer, sig, ser), (verfer, bad, ser),
+                                 (verfer, sig, bytearray(ser)), (verfer, sig, ser + b'x')])
+    assert results == [True, False, True, False]
+    assert Verfer.verifyMany([]) == []
+
+    # large enough batch to use thread pool
+    triples = []
+    for i in range(Verfer.BatchThreshold * 2):
+        msg = ser + str(i).encode("utf-8")
+        triples.append((verfer, pysodium.crypto_sign_detached(msg, seed + verkey), msg))
+    triples.append((verfer, bad, ser))
+    results = Verfer.verifyMany(triples)
+    assert results == [True] * (Verfer.BatchThreshold * 2) + [False]
+    assert Verfer._Pool is not None
+
+    # preverified results are memoized and consumed by first use
+    Verfer._Memo.clear()
+    assert Verfer.preverify([(verfer, sig, ser), (verfer, bad, ser)]) == [True, False]
+    assert len(Verfer._Memo) == 2
+    assert Verfer.verifyMany([(verfer, bad, ser), (verfer, sig, bytearray(ser))]) == [False, True]
+    assert not Verfer._Memo
     """ Done Test """
 
 
@@ -3837,6 +3869,68 @@ def test_siger():
     """ Done Test """
 
 
+def test_exfil_tables():
+    """
+    Test byte indexed code tables used by Matter, Indexer and Counter ._exfil
+    """
+    assert Matter.Hardb[ord("E")] == 1
+    assert Matter.Hardb[ord("1")] == 4
+    assert Matter.Hardb[ord("-")] == 0
+    assert Matter.Sizeb[b"E"] == ("E", Matter.Sizes["E"])
+    assert Indexer.Hardb[ord("0")] == 2
+    assert Counter.Hardb[ord("A")] == 2
+    assert Counter.Hardb[ord("0")] == 3
+    assert Counter.Sizeb[b"-0U"] == ("-0U", Counter.Sizes["-0U"])
+    assert "E" in DigDex and "A" not in DigDex
+    assert coring.codexCodes(type(DigDex)) == frozenset(dataclasses.astuple(DigDex))
+
+    # memoryview streams decode without str conversion
+    dig = coring.Diger(ser=b"abc")
+    assert coring.Diger(qb64b=memoryview(dig.qb64b)).raw == dig.raw
+    siger = Signer().sign(b"abc", index=3)
+    assert Siger(qb64b=memoryview(siger.qb64b)).index == 3
+    with pytest.raises(UnexpectedCountCodeError):
+        Matter(qb64b=b"-AAB")
+    with pytest.raises(UnexpectedCodeError):
+        Counter(qb64b=b"AAAB")
+    with pytest.raises(ShortageError):
+        Matter(qb64b=dig.qb64b[:10])
+    """ Done Test """
+
+
+def test_exfil_stream(monkeypatch):
+    """
+    Test parsing sigers and digests from stream with .fromQb64bFast uses
+    precomputed code tables and codex code sets without converting codexes or
+    stream per primitive. Timings are benchmarked on demand by
+    scripts/bench/parsing.py
+    """
+    count = 1000
+    siger = Signer().sign(b"abc", index=0)
+    dig = coring.Diger(ser=b"abc")
+    for klas, qb64b in ((Siger, siger.qb64b), (coring.Diger, dig.qb64b)):
+        klas(qb64b=qb64b)  # compute codex code sets once
+
+    def astuple(obj):
+        raise AssertionError(f"astuple of {obj}")
+
+    monkeypatch.setattr(coring, "astuple", astuple)
+    for klas, qb64b in ((Siger, siger.qb64b), (coring.Diger, dig.qb64b)):
+        ims = parsing.Cursor(qb64b * count)
+        prims = [klas.fromQb64bFast(ims, strip=True) for _ in range(count)]
+        assert not ims
+        assert all(prim.qb64b == qb64b for prim in prims)
+        assert all(isinstance(prim.raw, bytes) for prim in prims)
+        assert type(prims[0]) is klas
+
+    counter = Counter(code=CtrDex.ControllerIdxSigs, count=1)
+    ims = bytearray(counter.qb64b * 2)
+    assert Counter.fromQb64bFast(ims, strip=True).count == 1
+    assert ims == counter.qb64b
+
+    """ Done Test """
+
+
 def test_saider():
     """
     Test Saider object
@@ -4663,6 +4757,26 @@ def test_serder():
     assert srdr.tholder.sith == "1"
     assert srdr.tholder.thold == 1
 
+    # derived primitives are memoized until .ked, .raw or .kind is assigned
+    assert srdr.tholder is srdr.tholder
+    assert srdr.ntholder is None
+    assert srdr.nexter is srdr.nexter
+    verfers = srdr.verfers
+    assert verfers is not srdr.verfers  # copy of memo
+    assert verfers[0] is srdr.verfers[0]
+    verfers.clear()
+    assert len(srdr.verfers) == 1
+    tholder = srdr.tholder
+    ked["kt"] = "2"
+    ked["k"] = ked["k"] * 2
+    srdr.ked = ked
+    assert srdr.tholder is not tholder
+    assert srdr.tholder.thold == 2
+    assert len(srdr.verfers) == 2
+    srdr.raw = srdr.raw
+    assert srdr.tholder is not tholder
+    assert not hasattr(srdr, "__dict__")
+
     # test validation in Serder.sn property
     ked["s"] = "-1"
     srdr = Serder(ked=ked)
@@ -1418,6 +1418,88 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_woke_escrow():
+    """
+    Test reprocessing of only those escrow entries woken by satisfied dependencies
+
+    """
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64  # init wes Salter
+    psr = parsing.Parser()
+
+    with basing.openDB(name="edy") as db, keeping.openKS(name="edy") as ks:
+        mgr = keeping.Manager(ks=ks, salt=salt)
+        kvy = eventing.Kevery(db=db)
+
+        verfers, digers, cst, nst = mgr.incept(icount=1, ncount=1, stem='wes', temp=True)
+        srdr = eventing.incept(keys=[verfer.qb64 for verfer in verfers],
+                               nkeys=[diger.qb64 for diger in digers],
+                               code=coring.MtrDex.Blake3_256)
+        pre = srdr.ked["i"]
+        mgr.move(old=verfers[0].qb64, new=pre)  # move key pair label to prefix
+        msgs = [eventing.messagize(srdr, sigers=mgr.sign(ser=srdr.raw, verfers=verfers))]
+        dig = srdr.said
+        for sn in range(1, 4):
+            srdr = eventing.interact(pre=pre, dig=dig, sn=sn, data=[])
+            msgs.append(eventing.messagize(srdr, sigers=mgr.sign(ser=srdr.raw, verfers=verfers)))
+            dig = srdr.said
+
+        for msg in reversed(msgs[1:]):  # all out of order
+            psr.parse(ims=bytearray(msg), kvy=kvy)
+        assert pre not in kvy.kevers
+        assert not db.woke  # escrowing wakes nothing
+
+        kvy.processEscrows(woke=True)  # first pass walks all escrows
+        assert kvy.swept is not None
+        assert pre not in kvy.kevers
+        for sn in range(1, 4):
+            assert len(db.getOoes(dbing.snKey(pre, sn))) == 1
+
+        psr.parse(ims=bytearray(msgs[0]), kvy=kvy)  # inception wakes its successor
+        assert kvy.kevers[pre].sn == 0
+        assert db.woke["ooes"] == basing.oset([dbing.snKey(pre, 1)])
+
+        kvy.processEscrows(woke=True)  # woken chain unescrows without walk
+        assert kvy.kevers[pre].sn == 3
+        for sn in range(1, 4):
+            assert not db.getOoes(dbing.snKey(pre, sn))
+        assert not db.woke
+
+        # waits on a prefix are woken by its events
+        key = dbing.snKey(pre, 5)
+        db.waitEscrow(pre, "pses", key)
+        assert db.waits[pre.encode("utf-8")] == basing.oset([("pses", key)])
+        db.wakeEvent(pre, 4)
+        assert key in db.woke["pses"]
+        assert dbing.snKey(pre, 5) in db.woke["ooes"]
+        assert pre.encode("utf-8") not in db.waits
+        assert db.popWoke("pses") == basing.oset([dbing.snKey(pre, 4), key])
+        assert "pses" not in db.woke
+
+        # waits are dropped once their escrow entries are removed or pruned
+        other = "EQf1hzB6s5saaQPdDAsEzSMEFoQx_WLsq93bjPu5wuqA"  # never seen
+        key = dbing.snKey(other, 1)
+        digs = [b"EAzjKx3hSVJArKpIOVt2KfTRjq8st22hL25Ystw2ig5T",
+                b"EQxvjQf0LFasBgO0HQWqf2cU1vKW7k0C8FKWyYwGzRsh"]
+        for dig in digs:
+            db.addPse(key, dig)
+            db.indexEscrow("pses", key, dig, helping.nowIso8601())
+        db.waitEscrow(other, "pses", key)
+        assert db.waited[("pses", key)] == basing.oset([other.encode("utf-8")])
+
+        assert db.delPse(key, digs[0])
+        assert db.waits[other.encode("utf-8")] == basing.oset([("pses", key)])  # entry left at key
+
+        later = helping.nowUTC() + datetime.timedelta(seconds=kvy.TimeoutPSE + 1)
+        assert db.pruneEscrows(now=later, timeouts={"pses": kvy.TimeoutPSE}) == 1
+        assert not db.getPses(key)
+        assert other.encode("utf-8") not in db.waits
+        assert ("pses", key) not in db.waited
+
+    assert not os.path.exists(ks.path)
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_out_of_order_escrow()
-
@@ -619,6 +619,40 @@ def test_lastestloc():
     """End Test """
 
 
+def test_verifysigs():
+    """
+    Test verifySigs and verifySigsBatch
+    """
+    salter = coring.Salter(raw=b'0123456789abcdef')
+    signers = [salter.signer(path=f"{i:x}", temp=True) for i in range(3)]
+    verfers = [signer.verfer for signer in signers]
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    other = b'0123456789abcdefghijklmnopqrstuvwxyz'
+
+    sigers = [signer.sign(ser, index=i) for i, signer in enumerate(signers)]
+    dupe = Siger(qb64=sigers[0].qb64)  # duplicate sig dropped
+    wrong = signers[2].sign(ser, index=1)  # index does not match key so fails
+    big = signers[0].sign(ser, index=5)  # index out of range so skipped
+
+    vsigers, vindices = eventing.verifySigs(raw=ser, sigers=sigers + [dupe, wrong, big],
+                                            verfers=verfers)
+    assert vindices == [0, 1, 2]
+    assert [siger.qb64 for siger in vsigers] == [siger.qb64 for siger in sigers]
+    assert [siger.verfer.qb64 for siger in vsigers] == [verfer.qb64 for verfer in verfers]
+    assert not any(vsiger is siger for vsiger, siger in zip(vsigers, sigers))  # copies
+
+    assert eventing.verifySigs(raw=ser, sigers=None, verfers=verfers) == ([], [])
+
+    osigers = [signer.sign(other, index=i) for i, signer in enumerate(signers)]
+    results = eventing.verifySigsBatch([(ser, sigers, verfers),
+                                        (other, osigers[:2], verfers),
+                                        (other, sigers, verfers)])
+    assert [indices for _, indices in results] == [[0, 1, 2], [0, 1], []]
+    assert eventing.verifySigsBatch([]) == []
+
+    """End Test """
+
+
 def test_seals_states():
     """
     Test seal and state namedtuples
@@ -4307,8 +4341,23 @@ def test_reload_kever(mockHelpingNowUTC):
 
         # now create new Kever with state
         kever = eventing.Kever(state=state, db=natHby.db)
+        assert not hasattr(kever, "__dict__")
         assert kever.sn == 6
         assert kever.fn == 6
+        assert kever.lastEst.s == 2
+        assert kever.wits == []
+        for lazy in eventing.Kever.Lazies:  # nothing built yet
+            assert getattr(kever, lazy) is None
+        assert kever.state().raw == state.raw  # served from raw ksn
+        assert kever._serder is None
+
+        assert kever.prefixer.qb64 == natHab.pre
+        assert kever._verfers is None  # only accessed primitive built
+        assert [verfer.qb64 for verfer in kever.verfers] == state.ked["k"]
+        assert kever.tholder.sith == '2'
+        assert kever.ntholder.sith == '2'
+        assert kever.nexter.digs == state.ked["n"]
+        assert kever.dater.dts == state.ked["dt"]
         assert kever.serder.ked == natHab.kever.serder.ked
         assert kever.serder.said == natHab.kever.serder.said
 
@@ -226,6 +226,7 @@ def test_parser():
         msgs.extend(siger.qb64b)
 
         assert len(msgs) == 3745
+        cmsgs = bytes(msgs)  # copy for cursor parse below
 
         pre = kever.prefixer.qb64
 
@@ -254,6 +255,128 @@ def test_parser():
     assert not os.path.exists(kevery.db.path)
     assert not os.path.exists(kever.db.path)
 
+    # parse by read offset of cursor with small compaction so compacts midstream
+    with openDB(name="cursor") as curDB:
+        kevery = Kevery(db=curDB)
+        ims = parsing.Cursor(cmsgs, compaction=256)
+        parser = parsing.Parser(ims=ims, kvy=kevery)
+        parser.parse()
+        assert ims == b''
+        assert ims.offset == 0 and not ims.buf
+        assert kevery.kevers[pre].sn == 7
+        db_digs = [bytes(val).decode("utf-8") for val in kevery.db.getKelIter(pre)]
+        assert db_digs == event_digs
+
+    """ Done Test """
+
+
+def test_parser_pipeline():
+    """
+    Test pipelined attachment group processing by Parser
+    """
+    with habbing.openHby(name="piper", base="test") as hby, \
+            habbing.openHby(name="pipee", base="test") as vhby:
+        hab = hby.makeHab(name="piper", transferable=True)
+        hab.rotate()
+        hab.interact()
+        hab.rotate()
+        hab.interact()
+        assert hab.kever.sn == 4
+
+        msgs = bytearray()
+        for msg in hab.db.clonePreIter(pre=hab.pre):
+            msgs.extend(msg)
+        ctr = Counter(qb64b=msgs[coring.Serder(raw=msgs).size:])  # after first msg
+        assert ctr.code == CtrDex.AttachedMaterialQuadlets  # clone is pipelined
+
+        # inception and rotations signed by own keys so preverified and memoized
+        coring.Verfer._Memo.clear()
+        kevery = Kevery(db=vhby.db, lax=False, local=False)
+        parser = parsing.Parser(kvy=kevery, pipeline=True)
+        parser.parse(ims=bytearray(msgs))
+        assert not parser.pipes
+        assert hab.pre in kevery.kevers
+        assert kevery.kevers[hab.pre].sn == 4
+        assert kevery.kevers[hab.pre].serder.said == hab.kever.serder.said
+        assert not coring.Verfer._Memo  # all preverifications consumed
+
+        # corrupt pipelined group is dropped while stream order is kept
+        pmsgs = bytearray()
+        for i, msg in enumerate(hab.db.clonePreIter(pre=hab.pre)):
+            if i == 2:  # corrupt signature in second rotation
+                msg = bytearray(msg)
+                msg[-200] = ord("-")
+            pmsgs.extend(msg)
+
+    with habbing.openHby(name="pipor", base="test") as vhby:
+        kevery = Kevery(db=vhby.db, lax=False, local=False)
+        parser = parsing.Parser(kvy=kevery, pipeline=True)
+        parser.parse(ims=pmsgs)
+        assert not parser.pipes
+        assert kevery.kevers[hab.pre].sn == 1  # later events escrowed out of order
+
+    """ Done Test """
+
+
+def test_cursor():
+    """
+    Test Cursor incoming message stream buffer
+    """
+    ims = parsing.Cursor()
+    assert not ims
+    assert len(ims) == 0
+    assert ims == b''
+
+    ims.extend(b'abcdefghij')
+    ims += bytearray(b'klmnop')
+    assert ims
+    assert len(ims) == 16
+    assert ims[0] == ord(b'a')
+    assert ims[-1] == ord(b'p')
+    assert ims[:3] == bytearray(b'abc')
+    assert isinstance(ims[:3], bytearray)
+    assert ims[14:20] == bytearray(b'op')
+    with pytest.raises(IndexError):
+        ims[16]
+
+    del ims[:3]  # consume from front advances offset only
+    assert ims.offset == 3
+    assert len(ims.buf) == 16
+    assert len(ims) == 13
+    assert ims[0] == ord(b'd')
+    assert ims[:3] == bytearray(b'def')
+    assert bytes(ims) == b'defghijklmnop'
+    assert ims == parsing.Cursor(b'defghijklmnop')
+
+    del ims[2:4]  # arbitrary deletion compacts first
+    assert ims.offset == 0
+    assert ims.buf == bytearray(b'dehijklmnop')
+
+    ims = parsing.Cursor(b'0123456789', compaction=4)
+    del ims[:4]
+    assert ims.offset == 4  # less than half consumed so not compacted
+    del ims[:1]
+    assert ims.offset == 0  # half consumed so compacted
+    assert ims.buf == bytearray(b'56789')
+    del ims[:]
+    assert not ims
+    assert ims.offset == 0 and not ims.buf
+
+    # primitives strip themselves from cursor
+    signer = coring.Salter(raw=b'0123456789abcdef').signer(temp=True)
+    counter = Counter(CtrDex.ControllerIdxSigs)
+    ims = parsing.Cursor(counter.qb64b + signer.verfer.qb64b)
+    ctr = Counter(qb64b=ims, strip=True)
+    assert ctr.code == CtrDex.ControllerIdxSigs
+    verfer = coring.Verfer(qb64b=ims, strip=True)
+    assert verfer.qb64 == signer.verfer.qb64
+    assert not ims
+
+    ims = parsing.Cursor(counter.qb2 + signer.verfer.qb2)
+    assert Counter(qb2=ims, strip=True).code == CtrDex.ControllerIdxSigs
+    assert coring.Verfer(qb2=ims, strip=True).qb64 == signer.verfer.qb64
+    assert not ims
+
     """ Done Test """
 
 
@@ -433,6 +433,14 @@ def test_replay():
         msgs = debHab.replay()
         assert msgs == debFelMsgs
 
+        # streamed replay coalesces whole messages into chunks of at least size
+        chunks = list(debHab.replayIter(size=4096))
+        assert [len(chunk) for chunk in chunks] == [4522, 5116]
+        assert bytearray().join(chunks) == debFelMsgs
+        chunks = list(debHab.replayIter(fn=6, size=4096))
+        assert len(chunks) == 1
+        assert chunks[0] == debFelMsgs[-1279:]
+
         # Play Cam's messages to Bev
         parsing.Parser().parse(ims=bytearray(camMsgs), kvy=bevKevery)
         # bevKevery.process(ims=bytearray(camMsgs))  # give copy to process
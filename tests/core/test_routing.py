@@ -0,0 +1,133 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.routing module
+
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from keri import kering
+from keri.core import routing
+
+
+class Recorder:
+    """ Test resource recording dispatched replies """
+
+    def __init__(self):
+        self.calls = []
+
+    def processReply(self, *, serder, saider, route, cigars=None, tsgs=None, **kwargs):
+        self.calls.append(("", route, kwargs))
+
+    def processReplyEndRole(self, *, serder, saider, route, cigars=None, tsgs=None, **kwargs):
+        self.calls.append(("EndRole", route, kwargs))
+
+
+def test_router():
+    """
+    Test Router static, templated and regex only routes
+    """
+    rtr = routing.Router()
+    res = Recorder()
+    rtr.addRoute("/end/role/{action}", res, suffix="EndRole")
+    rtr.addRoute("/loc/scheme", res)
+    rtr.addRoute("/ksn/{aid}", res)
+    rtr.addRoute("/ksn/latest", res, suffix="Latest")  # shadowed by earlier template
+    rtr.addRoute("/tsn/{kind}/{aid}/", res)
+    rtr.addRoute("/oobi/{aid}.{role}", res)  # field inside segment so regex only
+    rtr.addRoute("/", res)
+    assert len(rtr.routes) == 7
+    assert list(rtr.statics) == ["loc/scheme", "ksn/latest", ""]
+    assert len(rtr.rest) == 1
+    assert rtr.lowest == 0
+
+    route, params = rtr.find("/end/role/add")
+    assert route.suffix == "EndRole"
+    assert params == dict(action="add")
+    route, params = rtr.find("/LOC/Scheme")  # static segments ignore case
+    assert route.template == "/loc/scheme"
+    assert params == {}
+    route, params = rtr.find("/ksn/latest")
+    assert route.template == "/ksn/{aid}"
+    assert params == dict(aid="latest")
+    route, params = rtr.find("/tsn/registry/EAbc")
+    assert params == dict(kind="registry", aid="EAbc")
+    route, params = rtr.find("/oobi/EAbc.witness")
+    assert params == dict(aid="EAbc", role="witness")
+    route, params = rtr.find("/")
+    assert route.template == "/"
+
+    for r in ("/end/role", "/end/role/add/more", "/ksn/", "/tsn/registry/EAbc/", "loc/scheme",
+              "/unknown", "", None):
+        assert rtr.find(r) == (None, None)
+
+    # same result as linear regex search in registration order
+    for r in ("/end/role/cut", "/loc/scheme", "/ksn/EAbc", "/ksn/latest", "/tsn/credential/EAbc",
+              "/oobi/EAbc.agent", "/", "/nope"):
+        expect = next(((route, m.groupdict()) for route in rtr.routes
+                       if (m := route.regex.search(r))), (None, None))
+        assert rtr.find(r) == expect
+
+    # static route registered first takes fast path
+    rtr = routing.Router()
+    rtr.addRoute("/ksn/latest", res, suffix="Latest")
+    rtr.addRoute("/ksn/{aid}", res)
+    assert rtr.find("/ksn/latest")[0].suffix == "Latest"
+    assert rtr.find("/ksn/EAbc")[1] == dict(aid="EAbc")
+
+    # preregistered routes without template are matched by regex
+    fields, regex = routing.compile_uri_template("/ksn/{aid}")
+    rtr = routing.Router(routes=[routing.Route(regex=regex, fields=fields, resource=res)])
+    assert rtr.find("/ksn/EAbc")[1] == dict(aid="EAbc")
+
+    rtr = routing.Router()
+    rtr.addRoute("/end/role/{action}", res, suffix="EndRole")
+    serder = SimpleNamespace(ked=dict(t="rpy", r="/end/role/add"))
+    rtr.dispatch(serder=serder, saider=None, cigars=[], tsgs=[])
+    assert res.calls == [("EndRole", "/end/role/add", dict(action="add"))]
+    serder = SimpleNamespace(ked=dict(t="rpy", r="/end/cut"))
+    with pytest.raises(kering.ValidationError):
+        rtr.dispatch(serder=serder, saider=None, cigars=[], tsgs=[])
+
+    """End Test"""
+
+
+def test_router_index():
+    """
+    Test Router.find resolves routes from static table and segment trie without
+    the linear regex search regardless of number of registered routes.
+    Timings are benchmarked on demand by scripts/bench/routing.py
+    """
+
+    class NoRegex:
+        """ Regex stand in that fails test if searched """
+
+        def search(self, route):
+            raise AssertionError(f"regex search of {route}")
+
+    res = Recorder()
+    for count in (10, 100, 1000):
+        rtr = routing.Router()
+        for i in range(count):
+            rtr.addRoute(f"/route{i}/{{aid}}", res)
+            rtr.addRoute(f"/static{i}/scheme", res)
+        assert len(rtr.statics) == count
+        assert rtr.rest == []
+        for route in rtr.routes:
+            route.regex = NoRegex()
+
+        route, kwargs = rtr.find(f"/route{count - 1}/EAbc")
+        assert route.template == f"/route{count - 1}/{{aid}}"
+        assert kwargs == dict(aid="EAbc")
+        route, kwargs = rtr.find(f"/static{count - 1}/scheme")
+        assert route.template == f"/static{count - 1}/scheme"
+        assert kwargs == dict()
+        assert rtr.find(f"/route{count}/EAbc") == (None, None)
+
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_router()
+    test_router_index()
@@ -211,6 +211,52 @@ def test_resolution():
             schemer.verify(badload)
 
 
+def test_validator_cache():
+    scer = (
+        b'{"$id": "ExG9LuUbFzV4OV5cGS9IeQWzy9SuyVFyVrpRc4l1xzPA", "$schema": '
+        b'"http://json-schema.org/draft-07/schema#", "type": "object", "properties": {"a": {"type": "string"}, '
+        b'"b": {"type": "number"}, "c": {"type": "string", "format": "date-time"}}}')
+    payload = b'{"a": "test", "b": 123, "c": "2018-11-13T20:20:39+00:00"}'
+    mismatch = b'{"a": "test", "b": "123", "c": "2018-11-13T20:20:39+00:00"}'
+    badjson = b'{"a": "test" "b": 123 "c": "2018-11-13T20:20:39+00:00"}'
+
+    typ = JSONSchema(capacity=1)
+    sce = Schemer(raw=scer, typ=typ)
+    assert sce.typ is typ
+    validator = typ.validator(sce.sed)
+    assert typ.validator(sce.sed) is validator
+    assert list(typ.validators) == [sce.said]
+
+    errors = sce.verifyMany([payload, mismatch, badjson])
+    assert errors[0] == []
+    assert errors[1] == [dict(path="/b", keyword="type", message="'123' is not of type 'number'")]
+    assert errors[2][0]["keyword"] == "json"
+    assert typ.validator(sce.sed) is validator
+
+    with pytest.raises(ValidationError) as ex:
+        sce.verify(mismatch)
+    assert "/b" in str(ex.value)
+
+    # least recently used validator evicted
+    other = Schemer(sed={"$id": "", "$schema": "http://json-schema.org/draft-07/schema#", "type": "object"},
+                    typ=typ)
+    typ.validator(other.sed)
+    assert list(typ.validators) == [other.said]
+
+    with basing.openDB(name="edy") as db:
+        cache = CacheResolver(db=db)
+        assert cache.schemer(sce.said) is None
+        cache.add(sce.said, scer)
+        cache.add(other.said, other.raw)
+        assert cache.warm() == 2
+        assert set(cache.typ.validators) == {sce.said, other.said}
+
+        schemer = cache.schemer(sce.said)
+        assert schemer is cache.schemer(sce.said)
+        assert schemer.typ is cache.typ
+        assert schemer.verify(payload) is True
+
+
 if __name__ == '__main__':
     test_json_schema()
     test_json_schema_dict()
@@ -3,6 +3,7 @@
 tests.db.dbing module
 
 """
+import datetime
 import json
 import os
 
@@ -10,6 +11,7 @@ import lmdb
 import pytest
 from hio.base import doing
 from keri.app import habbing
+from keri import kering
 from keri.core import coring, eventing
 from keri.core.coring import MtrDex
 from keri.core.coring import Serials, versify
@@ -20,6 +22,7 @@ from keri.db import dbing
 from keri.db.basing import openDB, Baser
 from keri.db.dbing import (dgKey, onKey, snKey)
 from keri.db.dbing import openLMDB
+from keri.help import helping
 
 
 def test_baser():
@@ -1723,7 +1726,7 @@ def test_clean_baser():
         state = natHab.db.states.get(keys=natHab.pre)  # Serder instance
         assert state.sn == 6
         assert state.ked["f"] == '6'
-        assert natHab.db.env.stat()['entries'] == 58
+        assert natHab.db.env.stat()['entries'] == 61
 
         # test reopenDB with reuse  (because temp)
         with basing.reopenDB(db=natHab.db, reuse=True):
@@ -1732,7 +1735,7 @@ def test_clean_baser():
             assert ldig == natHab.kever.serder.saidb
             serder = coring.Serder(raw=bytes(natHab.db.getEvt(dbing.dgKey(natHab.pre,ldig))))
             assert serder.said == natHab.kever.serder.said
-            assert natHab.db.env.stat()['entries'] == 58
+            assert natHab.db.env.stat()['entries'] == 61
 
             # verify name pre kom in db
             data = natHab.db.habs.get(keys=natHab.name)
@@ -2076,6 +2079,144 @@ def test_dbdict():
     """End Test"""
 
 
+def test_prune_escrows():
+    """
+    Test escrow expiry index and PruneDoer
+    """
+    with openDB() as db:
+        pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+        key0 = snKey(pre, 0)
+        key1 = snKey(pre, 1)
+        dig0 = b'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4'
+        dig1 = b'EQ-yQs4EKRBBi-SlpbUM8BbL_5uRPJEQjG52JG9z7Uds'
+        old = "2021-01-01T00:00:00.000000+00:00"
+        new = "2021-01-01T00:05:00.000000+00:00"
+        now = helping.fromIso8601("2021-01-01T00:06:00.000000+00:00")
+
+        assert db.addOoe(key0, dig0)
+        assert db.indexEscrow("ooes", key0, dig0, old)
+        assert db.addOoe(key1, dig1)
+        assert db.indexEscrow("ooes", key1, dig1, new)
+        assert db.addPse(key0, dig0)
+        assert db.indexEscrow("pses", key0, dig0, old.encode("utf-8"))
+        couple = b'0AAAAAAAAAAAAAAAAAAAAAAB' + dig1
+        assert db.putPde(dgKey(pre, dig0), couple)
+        assert [bytes(k) for k, v in db.getTopItemIter(db.exps, b'ooes|')] == \
+               [b'ooes|' + old.encode("utf-8") + b'|' + key0,
+                b'ooes|' + new.encode("utf-8") + b'|' + key1]
+
+        # only ooes older than cutoff are pruned
+        assert db.pruneEscrows(now=now, timeouts=dict(ooes=120)) == 1
+        assert db.getOoes(key0) == []
+        assert db.getOoes(key1) == [dig1]
+        assert db.getPses(key0) == [dig0]
+        assert len(list(db.getTopItemIter(db.exps, b'ooes|'))) == 1
+
+        # default timeouts of Kevery prune rest once stale
+        assert db.pruneEscrows(now=now) == 0
+        later = now + datetime.timedelta(seconds=eventing.Kevery.TimeoutOOE + 1)
+        assert db.pruneEscrows(now=later) == 1
+        assert db.getOoes(key1) == []
+        assert db.getPses(key0) == [dig0]
+        later = now + datetime.timedelta(seconds=eventing.Kevery.TimeoutPSE + 1)
+        assert db.pruneEscrows(now=later) == 1
+        assert db.getPses(key0) == []
+        assert db.getPde(dgKey(pre, dig0)) is None  # partial delegation removed too
+        assert list(db.getTopItemIter(db.exps)) == []
+
+        # already unescrowed entries only drop index
+        assert db.indexEscrow("ooes", key0, dig0, old)
+        assert db.pruneEscrows(now=later) == 0
+        assert list(db.getTopItemIter(db.exps)) == []
+
+        assert db.addOoe(key0, dig0)
+        assert db.indexEscrow("ooes", key0, dig0, old)
+        doer = basing.PruneDoer(baser=db, timeouts=dict(ooes=0))
+        assert doer.tock == 60.0
+        doist = doing.Doist(limit=0.25, tock=0.03125)
+        doist.do(doers=[doer])
+        assert db.getOoes(key0) == []
+
+        # entries escrowed without index row are backfilled from their dts
+        assert db.addOoe(key0, dig0)
+        assert db.putDts(dgKey(pre, dig0), old.encode("utf-8"))
+        assert db.addPse(key1, dig1)  # no dts so indexed at now
+        assert db.reindexEscrows(now=new) == 2
+        assert db.reindexEscrows(now=new) == 0  # already indexed
+        assert [bytes(k) for k, v in db.getTopItemIter(db.exps)] == \
+               [b'ooes|' + old.encode("utf-8") + b'|' + key0,
+                b'pses|' + new.encode("utf-8") + b'|' + key1]
+        assert bytes(db.getDts(dgKey(pre, dig1))) == new.encode("utf-8")
+        assert db.pruneEscrows(now=now, timeouts=dict(ooes=120, pses=120)) == 1
+        assert db.getOoes(key0) == []
+        assert db.getPses(key1) == [dig1]
+
+        # reindex reads escrows in chunks resuming within dups of a key
+        db.ReindexChunk = 2
+        digs = [coring.Diger(ser=bytes([i])).qb64b for i in range(5)]
+        for dig in digs:
+            assert db.addOoe(key1, dig)
+        assert db.addOoe(snKey(pre, 2), dig0)
+        assert list(db._escrowItemIter(db.ooes)) == \
+               [(key1, dig) for dig in digs] + [(snKey(pre, 2), dig0)]
+        assert db.reindexEscrows(now=new) == 6
+        assert db.pruneEscrows(now=helping.fromIso8601(new) + datetime.timedelta(seconds=121),
+                               timeouts=dict(ooes=120)) == 6
+        del db.ReindexChunk
+
+        # reopen backfills index once
+        assert db.hbys.get(Baser.EscrowsIndexed) is not None  # set on first open
+        assert db.addOoe(key0, dig0)  # dts of dig0 is old
+        db.reopen(reuse=True)
+        assert db.getOoes(key0) == [dig0]
+        assert list(db.getTopItemIter(db.exps, b'ooes|')) == []  # already migrated
+        assert db.hbys.rem(Baser.EscrowsIndexed)
+        db.reopen(reuse=True)
+        assert len(list(db.getTopItemIter(db.exps, b'ooes|'))) == 1
+        assert db.hbys.get(Baser.EscrowsIndexed) is not None
+        assert db.pruneEscrows(now=now, timeouts=dict(ooes=120)) == 1
+        assert db.getOoes(key0) == []
+
+    """End Test"""
+
+
+def test_anchor_seals():
+    """
+    Test anchored seal index used by findAnchoringEvent
+    """
+    with habbing.openHby(name="sealer") as hby:
+        hab = hby.makeHab(name="sealer")
+        seal = dict(i=hab.pre, s="a", d=hab.kever.serder.said)
+        other = dict(i=hab.pre, s="b", d=hab.kever.serder.said)
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=seal) is None
+
+        hab.interact()
+        hab.interact(data=[seal, dict(d=hab.kever.serder.said)])
+        ixn = hab.kever.serder
+        third = dict(i=hab.pre, s="c", d=hab.kever.serder.said)
+        hab.interact(data=[seal, third])  # first anchoring event is kept
+        hab.interact(data=[dict(i=1, s=0, d=2), dict(i=hab.pre, s="z", d=seal["d"])])  # not event seals
+
+        assert hby.db.seals.get(keys=(hab.pre, hab.pre, coring.Seqner(sn=10).qb64, seal["d"])) is not None
+        srdr = hby.db.findAnchoringEvent(hab.pre, anchor=seal)
+        assert srdr.said == ixn.said
+        assert srdr.sn == 2
+        # int sn matches hex sn of seal
+        anchor = dict(i=hab.pre, s=10, d=seal["d"])
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=anchor).said == ixn.said
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=other) is None
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=third).sn == 3
+
+        # backfill rebuilds index of existing KELs
+        hby.db.seals.trim()
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=seal) is None
+        assert hby.db.reindexSeals() == 2  # only events that wrote a seal
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=seal).said == ixn.said
+        assert hby.db.reindexSeals() == 0  # already indexed
+
+    """End Test"""
+
+
 def test_baserdoer():
     """
     Test BaserDoer
@@ -2140,5 +2281,194 @@ def test_baserdoer():
     """End Test"""
 
 
+def test_dbdict_bounded():
+    """
+    Test CLOCK eviction, pinning and counters of bounded dbdict
+    """
+    dbd = basing.dbdict(capacity=3)
+    dbd['a'] = 1
+    dbd['b'] = 2
+    dbd['c'] = 3
+    assert dbd.evictions == 0
+    assert dbd['a'] == 1  # hit keeps a reference on 'a'
+    assert dbd.hits == 1
+
+    dbd['d'] = 4  # refs cleared oldest first then 'b' evicted
+    assert list(dbd.keys()) == ['c', 'd', 'a']
+    assert dbd.evictions == 1
+    assert 'b' not in dbd
+    assert dbd.misses == 1
+
+    dbd['e'] = 5  # no refs left so oldest evicted
+    assert list(dbd.keys()) == ['d', 'a', 'e']
+    assert dbd.evictions == 2
+
+    with habbing.openHby(name="test") as hby:
+        hab = hby.makeHab(name="test")
+        kevers = hby.db.kevers
+        assert isinstance(kevers, basing.dbdict)
+        assert kevers.capacity == basing.Baser.KeverCapacity
+        kevers.capacity = 1
+        for i in range(5):
+            kevers[f"x{i}"] = i
+        assert list(kevers.keys()) == [hab.pre, 'x4']  # local prefix is pinned
+        assert kevers.evictions == 5  # x0 to x3 and the unpinned signator kever
+
+        hby.db.prefixes.remove(hab.pre)  # unpinned so may be evicted
+        kever = kevers[hab.pre]
+        kevers['y'] = 0
+        kevers['z'] = 0
+        assert list(kevers.keys()) == ['z']
+        misses = kevers.misses
+        rkever = kevers[hab.pre]  # rebuilt from key state
+        assert kevers.misses == misses + 1
+        assert rkever is not kever
+        assert rkever.state().ked == kever.state().ked
+
+    """End Test"""
+
+
+def test_dbdict_reload():
+    """
+    Test evicted remote kever is reloaded nonlocal whatever Kevery came first so
+    it still escrows and cues partially witnessed events
+    """
+    signers = [Signer(raw=bytes([i]) * 32) for i in range(3)]
+    wit = Signer(raw=b'w' * 32, transferable=False).verfer.qb64
+    own = Signer(raw=b'o' * 32, transferable=False).verfer.qb64
+    icp = incept(keys=[signers[0].verfer.qb64],
+                 nkeys=[coring.Diger(ser=signers[1].verfer.qb64b).qb64],
+                 code=MtrDex.Blake3_256)
+    rot = rotate(pre=icp.pre, keys=[signers[1].verfer.qb64], dig=icp.said,
+                 nkeys=[coring.Diger(ser=signers[2].verfer.qb64b).qb64],
+                 toad=1, adds=[wit])
+
+    with openDB() as db:
+        db.prefixes.add(own)  # not promiscuous so toad check depends on .local
+        lkvy = eventing.Kevery(db=db, local=True)  # like Habery.kvy
+        kvy = eventing.Kevery(db=db)
+        kvy.processEvent(serder=icp, sigers=[signers[0].sign(icp.raw, index=0)])
+        kever = db.kevers[icp.pre]
+        assert kever.local is False
+
+        db.kevers.capacity = 1
+        db.kevers['x'] = 0  # evicts kever
+        assert not dict.__contains__(db.kevers, icp.pre)
+        rkever = db.kevers[icp.pre]  # reloaded from key state
+        assert rkever is not kever
+        assert rkever.local is False
+        assert rkever.cues is not lkvy.cues
+        assert rkever.prefixes is db.prefixes
+
+        kvy.cues.clear()
+        with pytest.raises(kering.MissingWitnessSignatureError):
+            kvy.processEvent(serder=rot, sigers=[signers[1].sign(rot.raw, index=0)])
+        assert db.getPwes(snKey(icp.pre, 1)) == [rot.saidb]
+        assert db.kevers[icp.pre].sn == 0
+        assert kvy.cues.popleft() == dict(kin="query", q=dict(pre=icp.pre, sn=1))
+        assert not lkvy.cues
+
+    """End Test"""
+
+
+def test_known_fn():
+    """
+    Test knownFn evidence of remote holder of KEL from witness signatures and
+    receipts scanning backwards from latest event
+    """
+    signers = [Signer(raw=bytes([i]) * 32, transferable=False) for i in range(3)]
+    wits = [signer.verfer.qb64 for signer in signers]
+
+    with habbing.openHby(name="known") as hby:
+        hab = hby.makeHab(name="known", wits=wits[:2], toad=1)
+        for _ in range(3):
+            hab.interact()
+        hab.rotate(cuts=[wits[1]], toad=1)
+        hab.interact()
+        digs = [dig for fn, dig in hby.db.getFelItemPreIter(hab.pre.encode("utf-8"))]
+        assert len(digs) == 6
+        assert [fn for fn, dig in hby.db.getFelItemPreBackIter(hab.pre.encode("utf-8"))] == \
+               [5, 4, 3, 2, 1, 0]
+        assert [fn for fn, dig in hby.db.getFelItemPreBackIter(hab.pre.encode("utf-8"), fn=2)] == \
+               [2, 1, 0]
+        assert list(hby.db.getFelItemPreBackIter(b'A' + hab.pre.encode("utf-8"))) == []
+        assert list(hby.db.getFelItemPreBackIter(b'x' + hab.pre.encode("utf-8"))) == []
+
+        def evt(fn):
+            dgkey = dgKey(hab.pre, bytes(digs[fn]))
+            return dgkey, bytes(hby.db.getEvt(dgkey))
+
+        assert hby.db.knownFn(pre=hab.pre, eid=wits[1]) is None
+
+        dgkey, raw = evt(2)  # witness signature of wits[1] at index 1
+        assert hby.db.addWig(dgkey, signers[1].sign(raw, index=1).qb64b)
+        assert hby.db.knownFn(pre=hab.pre, eid=wits[1]) == 2
+        assert hby.db.knownFn(pre=hab.pre, eid=wits[0]) is None
+
+        dgkey, raw = evt(5)  # wits[1] cut at 4 so its index 0 is of wits[0]
+        assert hby.db.addWig(dgkey, signers[1].sign(raw, index=0).qb64b)
+        assert hby.db.knownFn(pre=hab.pre, eid=wits[1]) == 2
+        assert hby.db.knownFn(pre=hab.pre, eid=wits[0]) == 5
+
+        dgkey, raw = evt(3)  # receipt from nonwitness
+        cigar = signers[2].sign(raw)
+        assert hby.db.addRct(dgkey, signers[2].verfer.qb64b + cigar.qb64b)
+        assert hby.db.knownFn(pre=hab.pre, eid=wits[2]) == 3
+
+        dgkey, raw = evt(1)  # earlier receipt does not hide later signature
+        cigar = signers[1].sign(raw)
+        assert hby.db.addRct(dgkey, signers[1].verfer.qb64b + cigar.qb64b)
+        assert hby.db.knownFn(pre=hab.pre, eid=wits[1]) == 2
+
+    """End Test"""
+
+
+
+def test_clone_pre_chunk_iter():
+    """
+    Test chunked replay of FEL reads each chunk in its own read transaction
+    resuming by fn so writes between chunks are seen
+    """
+    with habbing.openHby(name="chunks") as hby:
+        hab = hby.makeHab(name="chunks")
+        for _ in range(3):
+            hab.interact()
+        msgs = list(hby.db.clonePreIter(pre=hab.pre))
+        size = 1  # one message per chunk
+
+        chunks = list(hby.db.clonePreChunkIter(pre=hab.pre, size=size))
+        assert [bytes(chunk) for chunk in chunks] == [bytes(msg) for msg in msgs]
+        chunks = list(hby.db.clonePreChunkIter(pre=hab.pre, fn=1, size=len(msgs[1]) + 1))
+        assert len(chunks) == 2
+        assert b"".join(chunks) == b"".join(msgs[1:])
+        assert list(hby.db.clonePreChunkIter(pre=hab.pre, fn=4)) == []
+        assert list(hby.db.clonePreChunkIter(pre="E" + "A" * 43)) == []
+
+        chunks = hby.db.clonePreChunkIter(pre=hab.pre, size=size)
+        assert next(chunks) == msgs[0]
+        hab.interact()  # write between chunks is not blocked and is replayed
+        rest = list(chunks)
+        assert len(rest) == 4
+        assert rest[-1] == next(hby.db.clonePreIter(pre=hab.pre, fn=4))
+
+        assert b"".join(hab.replayIter(size=size)) == hab.replay()
+
+    """End Test"""
+
+
+def test_chunkify():
+    msgs = [b"a" * 3, b"b" * 5, b"c" * 2, b"d" * 7, b"e"]
+
+    chunks = list(basing.chunkify(msgs, size=8))
+    assert chunks == [bytearray(b"aaabbbbb"), bytearray(b"ccddddddd"), bytearray(b"e")]
+
+    chunks = list(basing.chunkify(iter(msgs), size=1))
+    assert chunks == [bytearray(msg) for msg in msgs]
+
+    assert list(basing.chunkify(msgs)) == [bytearray(b"".join(msgs))]
+    assert list(basing.chunkify([])) == []
+    assert basing.ChunkSize == 65536
+
+
 if __name__ == "__main__":
     test_clean_baser()
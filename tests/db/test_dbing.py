@@ -794,5 +794,50 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_transact():
+    """
+    Test LMDBer.transact shared write transaction
+    """
+    with dbing.openLMDB() as dber:
+        assert dber._txn is None
+        db = dber.env.open_db(key=b'beep.')
+        ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+        key = b'A'
+
+        with dber.transact() as txn:
+            assert dber._txn is txn
+            assert dber.putVal(db, key, b'whex')
+            assert dber.putIoVals(ddb, key, [b'z', b'a'])
+            assert dber.addIoVal(ddb, key, b'm')
+            assert not dber.addIoVal(ddb, key, b'a')  # sees pending write
+            assert dber.addVal(ddb, b'B', b'x')
+            assert not dber.addVal(ddb, b'B', b'x')
+            with dber.transact() as ntxn:  # nested joins outer
+                assert ntxn is txn
+                assert dber.setVal(db, b'C', b'blue')
+            assert dber._txn is txn
+            assert dber.getVal(db, key) is None  # reads see last commit only
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'whex'
+        assert bytes(dber.getVal(db, b'C')) == b'blue'
+        assert [bytes(val) for val in dber.getIoVals(ddb, key)] == [b'z', b'a', b'm']
+
+        # exception aborts all writes in transaction
+        with pytest.raises(ValueError):
+            with dber.transact():
+                assert dber.setVal(db, key, b'red')
+                assert dber.delVal(db, b'C')
+                raise ValueError("abort")
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'whex'
+        assert bytes(dber.getVal(db, b'C')) == b'blue'
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_lmdber()
@@ -171,6 +171,12 @@ def test_dup_suber():
         actual = sdb.get(keys=keys0)
         assert actual == [sue, sal]  # lexicographic order
         assert sdb.cnt(keys0) == 2
+        assert list(sdb.getIter(keys0, after=sue)) == [sal]
+        assert list(sdb.getIter(keys0, after="I")) == [sal]
+        assert list(sdb.getIter(keys0, after=sal)) == []
+        assert sdb.has(keys0, sal)
+        assert not sdb.has(keys0, "Not")
+        assert not sdb.has(keys1, sal)
 
         sdb.rem(keys0)
         actual = sdb.get(keys=keys0)
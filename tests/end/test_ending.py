@@ -11,6 +11,7 @@ import time
 import falcon
 from falcon import testing
 from hio.base import tyming, doing
+from hio.core import http
 
 from keri import help, kering
 from keri.app import habbing
@@ -460,6 +461,19 @@ def test_get_oobi():
         assert serder.ked['a']['url'] == "http://127.0.0.1:5555"
         print(serder.pretty())
 
+        # replies longer than one chunk are streamed
+        app = falcon.App()
+        app.add_route("/oobi/{aid}/{role}", ending.OOBIEnd(hby=hby, size=64))
+        client = testing.TestClient(app=app)
+
+        rep = client.simulate_get(f'/oobi/{hab.pre}/controller')
+        assert rep.status == falcon.HTTP_OK
+        assert rep.headers[ending.OOBI_AID_HEADER] == hab.pre
+        assert "content-length" not in rep.headers
+        assert len(rep.content) == len(hab.replyToOobi(aid=hab.pre, role=kering.Roles.controller))
+        serder = coring.Serder(raw=rep.content)
+        assert serder.ked['r'] == "/loc/scheme"
+
     """Done Test"""
 
 
@@ -522,5 +536,79 @@ def test_oobiery():
     """Done Test"""
 
 
+def test_oobiery_pooled():
+    with habbing.openHby(name="srv", base="test") as srvHby, \
+            habbing.openHby(name="oobi", base="test") as hby:
+        pres = []
+        for i in range(3):
+            hab = srvHby.makeHab(name=f"srv{i}")
+            msgs = bytearray()
+            msgs.extend(hab.makeEndRole(eid=hab.pre,
+                                        role=kering.Roles.controller,
+                                        stamp=help.nowIso8601()))
+            msgs.extend(hab.makeLocScheme(url='http://127.0.0.1:5646',
+                                          scheme=kering.Schemes.http,
+                                          stamp=help.nowIso8601()))
+            hab.psr.parse(ims=msgs)
+            pres.append(hab.pre)
+
+        app = falcon.App()
+        ending.loadEnds(app, hby=srvHby)
+        server = http.Server(port=5646, app=app)
+        serverDoer = http.ServerDoer(server=server)
+
+        oobiery = ending.Oobiery(hby=hby, concurrency=2, batch=2)
+        assert oobiery.concurrency == 2
+        assert oobiery.batch == 2
+
+        urls = [f"http://127.0.0.1:5646/oobi/{pre}/controller?name=s{i}" for i, pre in enumerate(pres)]
+        dup = f"http://127.0.0.1:5646/oobi/{pres[0]}/controller/{pres[0]}"
+        bogus = "http://127.0.0.1:5646/oobi/EBogus000000000000000000000000000000000000/controller"
+        # sorted ahead of valid OOBIs so would starve them if left in oobis
+        unknown = "http://127.0.0.1:5646/bad"
+        invalid = "http://127.0.0.1:00x/oobi"
+        for url in urls + [dup, bogus, unknown, invalid]:
+            hby.db.oobis.pin(keys=(url,), val=basing.OobiRecord(date=helping.nowIso8601()))
+
+        flights = []
+
+        def watch(tymth=None, tock=0.0):
+            while True:
+                flights.append((set(oobiery.flights), len(oobiery.clients)))
+                yield tock
+
+        doist = doing.Doist(limit=1.0, tock=0.03125, real=True)
+        doist.do(doers=[serverDoer, oobiery, doing.doify(watch)])
+
+        # never more than concurrency requests in flight, all over one pooled client
+        assert max(len(f) for f, _ in flights) == 2
+        assert max(c for _, c in flights) == 1
+        # same CID never in flight twice
+        assert not any({urls[0], dup} <= f for f, _ in flights)
+
+        resolved = [cue["oobi"] for cue in oobiery.cues if cue["kin"] == "resolved"]
+        assert sorted(resolved) == sorted(urls + [dup])
+        assert sorted(contact["alias"] for contact in oobiery.org.list()) == ["s0", "s1", "s2"]
+        failed = [cue["oobi"] for cue in oobiery.cues if cue["kin"] == "failed"]
+        assert sorted(failed) == sorted([unknown, invalid])
+
+        # not found is escrowed with backoff
+        assert hby.db.oobis.cntAll() == 0
+        assert hby.db.coobi.cntAll() == 0
+        assert hby.db.eoobi.get(keys=(bogus,)) is not None
+        assert oobiery.retries == {bogus: 1}
+        (due, url), = oobiery.backoffs
+        assert url == bogus
+        assert due > doist.tyme
+
+        oobiery.retry(bogus, hby.db.eoobi.get(keys=(bogus,)))
+        assert oobiery.retries == {bogus: 2}
+        assert max(oobiery.backoffs)[0] - min(oobiery.backoffs)[0] > ending.Oobiery.RetryDelay
+
+        server.close()
+
+    """Done Test"""
+
+
 if __name__ == '__main__':
     test_signature_designature()
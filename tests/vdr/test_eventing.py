@@ -742,6 +742,22 @@ def test_tevery():
         assert status.ked["et"] == Ilks.rev
         assert status.sn == 1
 
+        # status is read from materialized record
+        rec = reg.vcsts.get(keys=vcdig.decode("utf-8"))
+        assert rec.sn == 1
+        assert rec.d == rev.said
+        assert rec.et == Ilks.rev
+        assert rec.a == dict(s=seqner.sn, d=diger.qb64)
+        assert tev.vcSn(vcdig.decode("utf-8")) == 1
+
+        # record missing is rebuilt from TEL
+        reg.vcsts.rem(keys=vcdig.decode("utf-8"))
+        rstatus = tev.vcState(vcdig.decode("utf-8"))
+        assert rstatus.ked["d"] == status.ked["d"]
+        assert rstatus.ked["a"] == status.ked["a"]
+        assert reg.vcsts.get(keys=vcdig.decode("utf-8")) == rec
+        assert tev.vcState("EZ-i0d8JZAoTNZH3ULaU6JR2nmwyvYAfSVPzhzS6b5CM") is None
+
 
 def test_tevery_process_escrow(mockCoringRandomNonce):
     with basing.openDB() as db, keeping.openKS() as kpr, viring.openReger() as reg:
@@ -524,6 +524,21 @@ def test_verifier_chained_credential(seeder):
         assert cue["kin"] == "saved"
         assert cue["creder"].raw == vLeiCreder.raw
 
+        # Chained credential is hydrated once and shared
+        creds = vicreg.reger.cloneCreds([vLeiCreder.saider, creder.saider])
+        assert len(creds) == 2
+        assert creds[0]["sad"]["d"] == vLeiCreder.said
+        assert creds[0]["status"]["et"] == coring.Ilks.iss
+        assert len(creds[0]["chains"]) == 1
+        assert creds[0]["chains"][0] is creds[1]
+        assert creds[1]["sad"]["d"] == creder.said
+        assert creds[1]["chains"] == []
+
+        nodes = vicreg.reger.cloneCreds([vLeiCreder.saider], flat=True)
+        assert list(nodes) == [vLeiCreder.said, creder.said]
+        assert nodes[vLeiCreder.said]["chains"] == [creder.said]
+        assert nodes[creder.said]["sad"] == creds[1]["sad"]
+
         # Revoke Ian's issuer credential and vic should no longer be able to verify
         # Han's credential that's linked to it
         rev = roniss.revoke(said=creder.said)